@@ -0,0 +1,72 @@
+"""
+Compares the columnar `DFList.df()` with the previous row-by-row implementation.
+
+Usage:
+    python benchmarks/bench_dataframe.py [--rows 10000]
+"""
+
+import sys
+import timeit
+import argparse
+
+from pathlib import Path
+from datetime import datetime, timedelta
+
+sys.path.append(str(Path(__file__).parent.parent))
+from pybithumb2.models import DFList, MinuteCandle
+
+
+def make_candles(rows: int) -> DFList[MinuteCandle]:
+    start = datetime(2025, 1, 1)
+    candles = []
+    for i in range(rows):
+        kst = start + timedelta(minutes=i)
+        candles.append(
+            MinuteCandle.model_validate(
+                {
+                    "market": "KRW-BTC",
+                    "candle_date_time_utc": (kst - timedelta(hours=9)).strftime(
+                        "%Y-%m-%dT%H:%M:%S"
+                    ),
+                    "candle_date_time_kst": kst.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "opening_price": 140000000 + i,
+                    "high_price": 140100000 + i,
+                    "low_price": 139900000 + i,
+                    "trade_price": 140050000 + i,
+                    "timestamp": int(kst.timestamp() * 1000),
+                    "candle_acc_trade_price": 1234567.891 + i,
+                    "candle_acc_trade_volume": 0.1234 + i,
+                    "unit": 1,
+                }
+            )
+        )
+    return DFList[MinuteCandle](candles)
+
+
+def rowwise_df(candles: DFList[MinuteCandle]):
+    """The previous implementation: one single row DataFrame per element."""
+    import pandas as pd
+
+    return pd.concat([c.df() for c in candles], ignore_index=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    candles = make_candles(args.rows)
+
+    rowwise = min(
+        timeit.repeat(lambda: rowwise_df(candles), number=1, repeat=args.repeat)
+    )
+    columnar = min(timeit.repeat(lambda: candles.df(), number=1, repeat=args.repeat))
+
+    print(f"rows:     {args.rows}")
+    print(f"rowwise:  {rowwise * 1000:10.2f} ms")
+    print(f"columnar: {columnar * 1000:10.2f} ms ({rowwise / columnar:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Compares the position based datetime, date and time parsers with strptime/dateutil.
+
+Usage:
+    python benchmarks/bench_datetime.py
+"""
+
+import sys
+import timeit
+
+from pathlib import Path
+from datetime import datetime
+
+sys.path.append(str(Path(__file__).parent.parent))
+from pybithumb2.utils import _parse_datetime, parse_date, parse_datetime, parse_time
+
+CASES = [
+    ("datetime T", "2025-01-01T10:00:00", _parse_datetime, parse_datetime),
+    ("datetime space", "2025-01-01 10:00:00", _parse_datetime, parse_datetime),
+    ("datetime +09:00", "2025-01-01T10:00:00+09:00", _parse_datetime, parse_datetime),
+    (
+        "date",
+        "2025-01-01",
+        lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+        parse_date,
+    ),
+    (
+        "time",
+        "10:00:00",
+        lambda s: datetime.strptime(s, "%H:%M:%S").time(),
+        parse_time,
+    ),
+]
+
+
+def main() -> None:
+    number = 20000
+    for name, value, slow, fast in CASES:
+        slow_time = min(timeit.repeat(lambda: slow(value), number=number, repeat=3))
+        fast_time = min(timeit.repeat(lambda: fast(value), number=number, repeat=3))
+        print(
+            f"{name:<16} strptime={slow_time / number * 1e6:6.2f} us  "
+            f"fast={fast_time / number * 1e6:6.2f} us ({slow_time / fast_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Compares the indicators of `pybithumb2.indicators` with naive Python loops over `DFList[MinuteCandle]`.
+
+Two cases are measured for each indicator:
+    series:  the indicator over every candle, a loop over the models against the NumPy function on a CandleArray.
+    append:  the value after one more candle, recomputing over the models against one `update` of the state.
+
+Usage:
+    python benchmarks/bench_indicators.py [--rows 10000] [--period 20]
+"""
+
+import sys
+import math
+import timeit
+import argparse
+
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from pybithumb2 import indicators
+from pybithumb2.arrays import CandleArray
+from pybithumb2.indicators import RSI, SMA, EMA, VWAP, BollingerBands
+
+from bench_dataframe import make_candles
+
+
+def naive_sma(candles, period):
+    closes = [float(c.trade_price) for c in candles]
+    return [
+        sum(closes[i + 1 - period : i + 1]) / period if i >= period - 1 else math.nan
+        for i in range(len(closes))
+    ]
+
+
+def naive_ema(candles, period):
+    out, alpha = [], 2 / (period + 1)
+    for i, candle in enumerate(candles):
+        close = float(candle.trade_price)
+        if i < period - 1:
+            out.append(math.nan)
+        elif i == period - 1:
+            out.append(sum(float(c.trade_price) for c in candles[:period]) / period)
+        else:
+            out.append(out[-1] + alpha * (close - out[-1]))
+    return out
+
+
+def naive_rsi(candles, period):
+    closes = [float(c.trade_price) for c in candles]
+    out = [math.nan] * len(closes)
+    gain = loss = 0.0
+    for i in range(1, len(closes)):
+        change = closes[i] - closes[i - 1]
+        if i <= period:
+            gain += max(change, 0) / period
+            loss += max(-change, 0) / period
+        else:
+            gain = (gain * (period - 1) + max(change, 0)) / period
+            loss = (loss * (period - 1) + max(-change, 0)) / period
+        if i >= period:
+            out[i] = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+    return out
+
+
+def naive_vwap(candles):
+    out, value, volume = [], 0.0, 0.0
+    for candle in candles:
+        value += float(candle.candle_acc_trade_price)
+        volume += float(candle.candle_acc_trade_volume)
+        out.append(value / volume if volume else math.nan)
+    return out
+
+
+def naive_bollinger(candles, period, width=2.0):
+    closes = [float(c.trade_price) for c in candles]
+    bands = []
+    for i in range(len(closes)):
+        if i < period - 1:
+            bands.append((math.nan, math.nan, math.nan))
+            continue
+        window = closes[i + 1 - period : i + 1]
+        mean = sum(window) / period
+        std = math.sqrt(sum((x - mean) ** 2 for x in window) / period)
+        bands.append((mean, mean + width * std, mean - width * std))
+    return bands
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--period", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    candles = make_candles(args.rows)
+    array = CandleArray.from_candles(candles)
+    period = args.period
+    last = candles[-1]
+    close, value, volume = (
+        float(last.trade_price),
+        float(last.candle_acc_trade_price),
+        float(last.candle_acc_trade_volume),
+    )
+
+    cases = {
+        "sma": (
+            lambda: naive_sma(candles, period),
+            lambda: indicators.sma(array, period),
+            SMA.from_history(array, period),
+            lambda state: state.update(close),
+        ),
+        "ema": (
+            lambda: naive_ema(candles, period),
+            lambda: indicators.ema(array, period),
+            EMA.from_history(array, period),
+            lambda state: state.update(close),
+        ),
+        "rsi": (
+            lambda: naive_rsi(candles, period),
+            lambda: indicators.rsi(array, period),
+            RSI.from_history(array, period),
+            lambda state: state.update(close),
+        ),
+        "vwap": (
+            lambda: naive_vwap(candles),
+            lambda: indicators.vwap(array),
+            VWAP.from_history(array),
+            lambda state: state.update(value, volume),
+        ),
+        "bollinger": (
+            lambda: naive_bollinger(candles, period),
+            lambda: indicators.bollinger(array, period),
+            BollingerBands.from_history(array, period),
+            lambda state: state.update(close),
+        ),
+    }
+
+    def best(fn, number=1):
+        return min(timeit.repeat(fn, number=number, repeat=args.repeat)) / number
+
+    print(f"rows: {args.rows}, period: {period}")
+    print(f"{'':<10} {'naive':>12} {'numpy':>12} {'':>8} {'update':>10} {'':>10}")
+    for name, (naive, vectorized, state, update) in cases.items():
+        naive_time = best(naive)
+        vectorized_time = best(vectorized)
+        update_time = best(lambda: update(state), number=10000)
+        print(
+            f"{name:<10} {naive_time * 1000:9.2f} ms {vectorized_time * 1000:9.2f} ms "
+            f"({naive_time / vectorized_time:5.0f}x) "
+            f"{update_time * 1e6:7.2f} us ({naive_time / update_time:7.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
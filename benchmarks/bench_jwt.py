@@ -0,0 +1,58 @@
+"""
+Compares the JWT signer of private requests with jwt.encode, and reports signed requests per second.
+
+Usage:
+    python benchmarks/bench_jwt.py
+"""
+
+import sys
+import time
+import uuid
+import timeit
+import hashlib
+
+from pathlib import Path
+
+import jwt
+
+sys.path.append(str(Path(__file__).parent.parent))
+from pybithumb2.auth import JWTSigner
+from pybithumb2.client import BithumbClient
+
+API_KEY = "a" * 40
+SECRET_KEY = "b" * 64
+QUERY = "market=KRW-BTC&side=bid&volume=0.001&price=140000000&ord_type=limit"
+
+
+def pyjwt_token(query: str) -> str:
+    payload = {
+        "access_key": API_KEY,
+        "nonce": str(uuid.uuid4()),
+        "timestamp": round(time.time() * 1000),
+    }
+    if query:
+        payload["query_hash"] = hashlib.sha512(query.encode()).hexdigest()
+        payload["query_hash_alg"] = "SHA512"
+    return jwt.encode(payload, SECRET_KEY)
+
+
+def per_second(fn, number: int = 20000) -> float:
+    return number / min(timeit.repeat(fn, number=number, repeat=3))
+
+
+def main() -> None:
+    signer = JWTSigner(API_KEY, SECRET_KEY)
+    client = BithumbClient(API_KEY, SECRET_KEY)
+    data = {"market": "KRW-BTC", "side": "bid", "volume": "0.001"}
+
+    slow = per_second(lambda: pyjwt_token(QUERY))
+    fast = per_second(lambda: signer.token(QUERY))
+    print(
+        f"token            jwt.encode={slow:10,.0f}/s  JWTSigner={fast:10,.0f}/s ({fast / slow:.1f}x)"
+    )
+    signed = per_second(lambda: client._prepare_request("/v1/orders", True, data))
+    print(f"signed requests  _prepare_request={signed:10,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compares per-row `model_validate` with the bulk `model_validate_many` decoder on a 200 candle response and on a
+full-market ticker response.
+
+Usage:
+    python benchmarks/bench_models.py [--markets 400]
+"""
+
+import sys
+import timeit
+import argparse
+
+from pathlib import Path
+from datetime import datetime, timedelta
+
+sys.path.append(str(Path(__file__).parent.parent))
+from pybithumb2.models import MinuteCandle, Snapshot
+
+
+def make_candle_payload(rows: int = 200) -> list:
+    start = datetime(2025, 1, 1)
+    payload = []
+    for i in range(rows):
+        kst = start + timedelta(minutes=i)
+        payload.append(
+            {
+                "market": "KRW-BTC",
+                "candle_date_time_utc": (kst - timedelta(hours=9)).strftime(
+                    "%Y-%m-%dT%H:%M:%S"
+                ),
+                "candle_date_time_kst": kst.strftime("%Y-%m-%dT%H:%M:%S"),
+                "opening_price": 140000000.0 + i,
+                "high_price": 140100000.0 + i,
+                "low_price": 139900000.0 + i,
+                "trade_price": 140050000.0 + i,
+                "timestamp": int(kst.timestamp() * 1000),
+                "candle_acc_trade_price": 1234567.89123456 + i,
+                "candle_acc_trade_volume": 0.01234567 + i,
+                "unit": 1,
+            }
+        )
+    return payload
+
+
+def make_ticker_payload(markets: int = 400) -> list:
+    return [
+        {
+            "market": f"KRW-C{i:03d}",
+            "trade_date": "20250101",
+            "trade_time": "010203",
+            "trade_date_kst": "20250101",
+            "trade_time_kst": "100203",
+            "trade_timestamp": 1735693323000 + i,
+            "opening_price": 1400.0 + i,
+            "high_price": 1410.0 + i,
+            "low_price": 1390.0 + i,
+            "trade_price": 1405.5 + i,
+            "prev_closing_price": 1400.0,
+            "change": ["RISE", "FALL", "EVEN"][i % 3],
+            "change_price": 5.5,
+            "change_rate": 0.0036,
+            "signed_change_price": 5.5,
+            "signed_change_rate": 0.0036,
+            "trade_volume": 0.0123,
+            "acc_trade_price": 123456789.123,
+            "acc_trade_price_24h": 223456789.1,
+            "acc_trade_volume": 12.5 + i,
+            "acc_trade_volume_24h": 25.1 + i,
+            "highest_52_week_price": 1600.0,
+            "highest_52_week_date": "2024-12-17",
+            "lowest_52_week_price": 600.0,
+            "lowest_52_week_date": "2024-01-23",
+            "timestamp": 1735693323500 + i,
+        }
+        for i in range(markets)
+    ]
+
+
+def compare(name: str, model, payload: list, repeat: int) -> None:
+    per_row = min(
+        timeit.repeat(
+            lambda: [model.model_validate(item) for item in payload],
+            number=1,
+            repeat=repeat,
+        )
+    )
+    bulk = min(
+        timeit.repeat(
+            lambda: model.model_validate_many(payload), number=1, repeat=repeat
+        )
+    )
+    print(
+        f"{name:<16} rows={len(payload):<5} model_validate={per_row * 1000:8.2f} ms  "
+        f"model_validate_many={bulk * 1000:8.2f} ms ({per_row / bulk:.1f}x)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--markets", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    compare("minute candles", MinuteCandle, make_candle_payload(200), args.repeat)
+    compare("ticker", Snapshot, make_ticker_payload(args.markets), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
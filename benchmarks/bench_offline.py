@@ -0,0 +1,223 @@
+"""
+Offline benchmark suite of the hot paths of the client, run against the recorded responses in benchmarks/fixtures.
+Requests go through the full sync client stack with `FixtureTransport` in place of the network, so results do not
+depend on credentials, the network or the state of the exchange.
+
+Covers `_request` overhead, header signing, model validation of every endpoint, end-to-end client calls,
+`DFList.df()`, `clean_and_format_data` and `parse_datetime`.
+
+Usage:
+    python benchmarks/bench_offline.py [--filter validate] [--repeat 5] [--min-time 0.2]
+    python benchmarks/bench_offline.py --json results.json
+    python benchmarks/bench_offline.py --compare results.json [--threshold 0.2]
+
+With --compare, benchmarks whose best time per call is more than `threshold` slower than in the given results are
+reported and the exit status is 1.
+"""
+
+import sys
+import json
+import timeit
+import argparse
+import platform
+import statistics
+
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+import pybithumb2.models as models
+from pybithumb2.__env__ import __version__
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import DFList, MarketID, TimeUnit
+from pybithumb2.types import OrderBy, OrderState
+from pybithumb2.utils import clean_and_format_data, parse_datetime
+
+from transport import load_fixtures, mount
+
+API_KEY = "a" * 40
+SECRET_KEY = "b" * 64
+QUERY = "market=KRW-BTC&side=bid&volume=0.001&price=140000000&ord_type=limit"
+MARKET = MarketID.from_string("KRW-BTC")
+
+DATETIMES = {
+    "space": "2025-01-01 10:00:00",
+    "t": "2025-01-01T10:00:00",
+    "z": "2025-01-01T01:00:00Z",
+    "offset": "2025-01-01T10:00:00+09:00",
+}
+
+
+def build_cases(fixtures: Dict[str, dict]) -> Dict[str, Callable[[], object]]:
+    client = BithumbClient(API_KEY, SECRET_KEY)
+    raw_client = BithumbClient(API_KEY, SECRET_KEY, use_raw_data=True)
+    mount(client, fixtures)
+    mount(raw_client, fixtures)
+
+    cases: Dict[str, Callable[[], object]] = {
+        "request.public_small": lambda: raw_client.get(
+            "/v1/market/all", is_private=False, data={"isDetails": "false"}
+        ),
+        "request.public_ticker": lambda: raw_client.get(
+            "/v1/ticker", is_private=False, data={"markets": "KRW-BTC"}
+        ),
+        "request.private": lambda: raw_client.get("/v1/accounts", is_private=True),
+        "sign.public": lambda: client._generate_headers(False, None),
+        "sign.private": lambda: client._generate_headers(True, None),
+        "sign.private_query": lambda: client._generate_headers(True, QUERY),
+    }
+
+    for name, fixture in fixtures.items():
+        model = getattr(models, fixture["model"])
+        body = fixture["body"]
+        if isinstance(body, list):
+            cases[f"validate.{name}"] = (
+                lambda model=model, body=body: model.model_validate_many(body)
+            )
+            if len(body) > 1:
+                validated = DFList(model.model_validate_many(body))
+                cases[f"df.{name}"] = lambda validated=validated: validated.df()
+        else:
+            cases[f"validate.{name}"] = (
+                lambda model=model, body=body: model.model_validate(body)
+            )
+
+    markets = [
+        MarketID.from_string(row["market"]) for row in fixtures["ticker"]["body"]
+    ]
+    cases.update(
+        {
+            "endpoint.get_markets": lambda: client.get_markets(),
+            "endpoint.get_minute_candles": lambda: client.get_minute_candles(
+                MARKET, count=200, unit=TimeUnit(1)
+            ),
+            "endpoint.get_trades": lambda: client.get_trades(MARKET, count=100),
+            "endpoint.get_snapshots": lambda: client.get_snapshots(markets),
+            "endpoint.get_orderbooks": lambda: client.get_orderbooks([MARKET]),
+            "endpoint.get_accounts": lambda: client.get_accounts(),
+            "endpoint.get_orders": lambda: client.get_orders(
+                MARKET, states={OrderState.DONE, OrderState.CANCEL}
+            ),
+            "utils.clean_and_format_data": lambda: clean_and_format_data(
+                {
+                    "market": MARKET,
+                    "state": None,
+                    "states": [OrderState.DONE, OrderState.CANCEL],
+                    "page": 1,
+                    "limit": 100,
+                    "order_by": OrderBy.DESC,
+                }
+            ),
+        }
+    )
+    for layout, value in DATETIMES.items():
+        cases[f"utils.parse_datetime.{layout}"] = lambda value=value: parse_datetime(
+            value
+        )
+        cases[f"utils.parse_datetime.{layout}_field"] = (
+            lambda value=value, layout=layout: parse_datetime(value, layout)
+        )
+    return cases
+
+
+def measure(fn: Callable[[], object], repeat: int, min_time: float) -> dict:
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    # autorange stops at 0.2 seconds, scale up to the requested time per repeat.
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    times = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": min(times),
+        "median_us": statistics.median(times),
+        "mean_us": statistics.fmean(times),
+        "stdev_us": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def environment() -> dict:
+    def has(module: str) -> bool:
+        try:
+            __import__(module)
+        except ImportError:
+            return False
+        return True
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pybithumb2": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "optional": {m: has(m) for m in ("numpy", "pandas", "orjson")},
+    }
+
+
+def compare(results: Dict[str, dict], baseline: dict, threshold: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["min_us"] / before["min_us"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {before['min_us']:.2f} us -> {result['min_us']:.2f} us ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Seconds per repeat"
+    )
+    parser.add_argument(
+        "--json", help="Writes the results to this file, '-' for stdout"
+    )
+    parser.add_argument("--compare", help="Results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    cases = {
+        name: fn
+        for name, fn in build_cases(load_fixtures()).items()
+        if args.filter in name
+    }
+    quiet = args.json == "-"
+    results = {}
+    for name, fn in cases.items():
+        results[name] = measure(fn, args.repeat, args.min_time)
+        if not quiet:
+            result = results[name]
+            print(
+                f"{name:<40} {result['min_us']:12.2f} us  "
+                f"(median {result['median_us']:.2f} us, {1e6 / result['min_us']:,.0f}/s)"
+            )
+
+    report = {"environment": environment(), "results": results}
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
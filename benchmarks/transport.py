@@ -0,0 +1,101 @@
+"""
+Serves recorded API responses to a client without touching the network.
+
+Each file in `benchmarks/fixtures` holds one response:
+    {"method": "GET", "path": "/v1/ticker", "private": false, "model": "Snapshot", "body": [...]}
+
+`FixtureTransport` is a requests transport adapter, so it replaces the network under the whole client stack
+(`_request`, header signing, the session and the response handling) and only the socket I/O is left out. Like the
+API, it only answers with the rows of the requested markets when a request has a `markets` parameter.
+"""
+
+import json
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixtures(directory: Path = FIXTURES_DIR) -> Dict[str, dict]:
+    """Returns every fixture of a directory by file name, with its body encoded once as `content`."""
+    fixtures = {}
+    for path in sorted(directory.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        fixture["content"] = json.dumps(fixture["body"], ensure_ascii=False).encode()
+        if isinstance(fixture["body"], list) and all(
+            "market" in row for row in fixture["body"]
+        ):
+            fixture["rows"] = {
+                row["market"]: json.dumps(row, ensure_ascii=False).encode()
+                for row in fixture["body"]
+            }
+        fixtures[path.stem] = fixture
+    return fixtures
+
+
+class FixtureTransport(BaseAdapter):
+    """Answers requests with the fixture of their method and path, and counts the requests it served."""
+
+    def __init__(self, fixtures: Iterable[dict]):
+        super().__init__()
+        self.routes: Dict[Tuple[str, str], dict] = {}
+        for fixture in fixtures:
+            # The first fixture of a route wins, e.g. `orders` over `order_info` for GET /v1/orders.
+            self.routes.setdefault((fixture["method"], fixture["path"]), fixture)
+        self.requests = 0
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self.requests += 1
+        url = urlsplit(request.url)
+        fixture = self.routes.get((request.method, url.path))
+        content = None if fixture is None else fixture["content"]
+        if fixture is not None and "rows" in fixture:
+            markets = parse_qs(url.query).get("markets")
+            if markets:
+                rows = fixture["rows"]
+                content = (
+                    b"["
+                    + b",".join(
+                        rows[market]
+                        for market in markets[0].split(",")
+                        if market in rows
+                    )
+                    + b"]"
+                )
+
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.reason = "OK" if content is not None else "Not Found"
+        response.status_code = 200 if content is not None else 404
+        response._content = (
+            content
+            if content is not None
+            else b'{"error": {"name": "not_found", "message": "No fixture"}}'
+        )
+        response.headers = CaseInsensitiveDict(
+            {
+                "Content-Type": "application/json; charset=utf-8",
+                "Content-Length": str(len(response._content)),
+            }
+        )
+        response.encoding = "utf-8"
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def mount(client, fixtures: Optional[Dict[str, dict]] = None) -> FixtureTransport:
+    """Routes every request of a sync client to the fixtures."""
+    transport = FixtureTransport((fixtures or load_fixtures()).values())
+    client._session.mount("https://", transport)
+    client._session.mount("http://", transport)
+    return transport
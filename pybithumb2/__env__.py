@@ -2,6 +2,8 @@ import sys
 
 API_BASE_URL = "https://api.bithumb.com"
 
+STREAM_URL = "wss://ws-api.bithumb.com/websocket/v1"
+
 VERSION = "1.0.0-beta"
 
 USER_AGENT = f"pybithumb2/{VERSION}"
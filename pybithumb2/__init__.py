@@ -8,12 +8,42 @@ from pybithumb2.__env__ import (
 )
 from pybithumb2.exceptions import *
 from pybithumb2.client import BithumbClient
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.arrays import CandleArray
+from pybithumb2.candle_store import CandleStore
+from pybithumb2.stream import BithumbStream
+from pybithumb2.orderbook import LocalOrderBook
+from pybithumb2.recorder import TickLog, TradeRecorder
+from pybithumb2.poller import TickerChange, TickerPoller
+from pybithumb2.ratelimit import RateLimiter, EndpointGroup, TokenBucket
+from pybithumb2.cache import ResponseCache, CacheStats
+from pybithumb2.metrics import ClientMetrics, RequestEvent
+from pybithumb2.batch import BatchResult, OrderRequest
 from pybithumb2.types import *
 from pybithumb2.models import *
 
 __all__ = [
     BithumbClient,
+    AsyncBithumbClient,
+    CandleArray,
+    CandleStore,
+    BithumbStream,
+    LocalOrderBook,
+    TickLog,
+    TradeRecorder,
+    TickerChange,
+    TickerPoller,
     APIError,
+    RateLimitError,
+    RateLimiter,
+    EndpointGroup,
+    TokenBucket,
+    ResponseCache,
+    CacheStats,
+    ClientMetrics,
+    RequestEvent,
+    BatchResult,
+    OrderRequest,
     # ################################
     # ##            Types           ##
     # ################################
@@ -30,6 +60,7 @@ __all__ = [
     BlockState,
     OrderID,
     OrderBy,
+    StreamChannel,
     # ################################
     # ##            Models          ##
     # ################################
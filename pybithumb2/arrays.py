@@ -0,0 +1,308 @@
+from datetime import datetime
+from decimal import Decimal
+from numbers import Integral
+from typing import Any, Iterable, Optional, Sequence, Union, TYPE_CHECKING
+
+from pybithumb2.constants import KST
+from pybithumb2.models import Candle, MarketID
+from pybithumb2.types import RawData
+from pybithumb2.utils import to_kst
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+_VALUE_COLUMNS = ("open", "high", "low", "close", "volume", "value")
+_COLUMNS = ("time",) + _VALUE_COLUMNS + ("timestamp",)
+
+# Source fields of the candle payloads, in the order of _VALUE_COLUMNS.
+_VALUE_FIELDS = (
+    "opening_price",
+    "high_price",
+    "low_price",
+    "trade_price",
+    "candle_acc_trade_volume",
+    "candle_acc_trade_price",
+)
+
+
+def _epoch_ms(value: datetime) -> int:
+    """Converts a datetime to milliseconds since the epoch. Naive datetimes are assumed to be in KST."""
+    return int(to_kst(value).replace(tzinfo=KST).timestamp() * 1000)
+
+
+class CandleArray:
+    """
+    Struct of arrays holding the candles of a single market in chronological order.
+    Each column is one NumPy array: `time` is the start of the candle and `timestamp` the time of its last trade, both
+    as int64 milliseconds since the epoch. The price and volume columns are float64, or int64 scaled by
+    10 ** scale when a scale is given.
+    """
+
+    __slots__ = ("market", "scale") + _COLUMNS
+
+    def __init__(
+        self,
+        market: MarketID,
+        time: "np.ndarray",
+        open: "np.ndarray",
+        high: "np.ndarray",
+        low: "np.ndarray",
+        close: "np.ndarray",
+        volume: "np.ndarray",
+        value: "np.ndarray",
+        timestamp: "np.ndarray",
+        scale: Optional[int] = None,
+    ):
+        """
+        Args:
+            market (MarketID): The market of every candle.
+            time (np.ndarray): The start of each candle in int64 milliseconds since the epoch.
+            open (np.ndarray): The opening prices.
+            high (np.ndarray): The high prices.
+            low (np.ndarray): The low prices.
+            close (np.ndarray): The closing (last trade) prices.
+            volume (np.ndarray): The accumulated trade volumes.
+            value (np.ndarray): The accumulated trade values.
+            timestamp (np.ndarray): The time of the last trade in int64 milliseconds since the epoch.
+            scale (int, optional): The number of decimal digits of the int64 value columns. None if they are float64.
+        """
+        import numpy as np
+
+        self.market = market
+        self.scale = scale
+        dtype = np.float64 if scale is None else np.int64
+        self.time = np.asarray(time, dtype=np.int64)
+        self.open = np.asarray(open, dtype=dtype)
+        self.high = np.asarray(high, dtype=dtype)
+        self.low = np.asarray(low, dtype=dtype)
+        self.close = np.asarray(close, dtype=dtype)
+        self.volume = np.asarray(volume, dtype=dtype)
+        self.value = np.asarray(value, dtype=dtype)
+        self.timestamp = np.asarray(timestamp, dtype=np.int64)
+
+        if any(len(getattr(self, name)) != len(self.time) for name in _COLUMNS):
+            raise ValueError("All columns of a CandleArray must have the same length")
+
+    @classmethod
+    def from_raw(
+        cls,
+        rows: Sequence[RawData],
+        market: Optional[MarketID] = None,
+        scale: Optional[int] = None,
+    ) -> "CandleArray":
+        """
+        Builds the array straight from the candle payloads of the API, without creating a model per candle.
+
+        Args:
+            rows (Sequence[RawData]): Candle payloads, in any order.
+            market (MarketID, optional): The market of the candles. Defaults to the market of the first row and is
+                required when there are no rows.
+            scale (int, optional): Stores the value columns as int64 with this many decimal digits. Defaults to None
+                (float64 columns). Raises OverflowError if a column does not fit in int64 at that scale, e.g. the
+                traded value of KRW-BTC candles at scale 8.
+
+        Returns:
+            CandleArray
+        """
+        import numpy as np
+
+        if market is None:
+            if not rows:
+                raise ValueError("The market of an empty CandleArray must be given")
+            market = MarketID.from_string(rows[0]["market"])
+        market_str = str(market)
+        if any(row["market"] != market_str for row in rows):
+            raise ValueError(f"Every candle of a CandleArray must be in {market_str}")
+
+        time = np.array(
+            [row["candle_date_time_utc"] for row in rows], "datetime64[ms]"
+        ).astype(np.int64)
+        values = [
+            _scaled([row.get(field) or 0 for row in rows], scale, field)
+            for field in _VALUE_FIELDS
+        ]
+        timestamp = np.array([row.get("timestamp", 0) for row in rows], np.int64)
+        return cls(market, time, *values, timestamp, scale=scale)._sorted()
+
+    @classmethod
+    def from_candles(
+        cls,
+        candles: Sequence[Candle],
+        market: Optional[MarketID] = None,
+        scale: Optional[int] = None,
+    ) -> "CandleArray":
+        """
+        Builds the array from candle models.
+
+        Args:
+            candles (Sequence[Candle]): Candles of one market, in any order.
+            market (MarketID, optional): The market of the candles. Defaults to the market of the first candle and is
+                required when there are no candles.
+            scale (int, optional): Stores the value columns as int64 with this many decimal digits. Defaults to None
+                (float64 columns). Raises OverflowError if a column does not fit in int64 at that scale, e.g. the
+                traded value of KRW-BTC candles at scale 8.
+
+        Returns:
+            CandleArray
+        """
+        return cls.from_raw(
+            [
+                {
+                    "market": str(candle.market),
+                    "candle_date_time_utc": candle.candle_date_time_utc.isoformat(),
+                    "timestamp": candle.timestamp,
+                    # Decimals are kept so that scaled columns are exact.
+                    **{field: getattr(candle, field) for field in _VALUE_FIELDS},
+                }
+                for candle in candles
+            ],
+            market=market,
+            scale=scale,
+        )
+
+    @classmethod
+    def concat(cls, arrays: Iterable["CandleArray"]) -> "CandleArray":
+        """
+        Concatenates arrays of the same market and scale, keeping chronological order.
+        Candles present in more than one array are kept once, from the last array holding them.
+
+        Args:
+            arrays (Iterable[CandleArray]): The arrays to join.
+
+        Returns:
+            CandleArray
+        """
+        import numpy as np
+
+        arrays = list(arrays)
+        if not arrays:
+            raise ValueError("At least one CandleArray is required")
+        first = arrays[0]
+        for array in arrays[1:]:
+            if array.market != first.market or array.scale != first.scale:
+                raise ValueError(
+                    "Only CandleArrays of the same market and scale can be concatenated"
+                )
+        if len(arrays) == 1:
+            return first
+
+        joined = cls(
+            first.market,
+            *(
+                np.concatenate([getattr(array, name) for array in arrays])
+                for name in _COLUMNS
+            ),
+            scale=first.scale,
+        )
+        return joined._sorted()
+
+    def _sorted(self) -> "CandleArray":
+        """Returns the candles sorted by time, keeping the last of duplicated times."""
+        import numpy as np
+
+        time = self.time
+        if len(time) < 2 or (np.diff(time) > 0).all():
+            return self
+        # Reverse first so that np.unique picks the last occurrence of each time.
+        reversed_time = time[::-1]
+        _, index = np.unique(reversed_time, return_index=True)
+        return self[len(time) - 1 - index]
+
+    def between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> "CandleArray":
+        """
+        Returns the candles that start in [start, end). Naive datetimes are assumed to be in KST.
+
+        Args:
+            start (datetime, optional): The start of the range (inclusive). Defaults to the first candle.
+            end (datetime, optional): The end of the range (exclusive). Defaults to after the last candle.
+
+        Returns:
+            CandleArray
+        """
+        first = 0 if start is None else self.time.searchsorted(_epoch_ms(start))
+        last = len(self) if end is None else self.time.searchsorted(_epoch_ms(end))
+        return self[first:last]
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, key: Any) -> Union["CandleArray", dict]:
+        """
+        Slices, integer arrays and boolean masks select candles and return a CandleArray that shares memory with this
+        one when NumPy does. An integer returns the candle as a dict of scalars.
+        """
+        if isinstance(key, Integral):
+            return {name: getattr(self, name)[key].item() for name in _COLUMNS}
+        return CandleArray(
+            self.market,
+            *(getattr(self, name)[key] for name in _COLUMNS),
+            scale=self.scale,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes held by the columns."""
+        return sum(getattr(self, name).nbytes for name in _COLUMNS)
+
+    def df(self) -> "pd.DataFrame":
+        """
+        Returns the columns as a DataFrame without copying them.
+        `time` and `timestamp` are viewed as datetime64[ms] UTC-naive columns, scaled value columns stay int64.
+
+        Returns:
+            pd.DataFrame
+        """
+        import pandas as pd
+
+        columns = {name: getattr(self, name) for name in _COLUMNS}
+        columns["time"] = columns["time"].view("datetime64[ms]")
+        columns["timestamp"] = columns["timestamp"].view("datetime64[ms]")
+        return pd.DataFrame(columns, copy=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(market={self.market!r}, "
+            f"len={len(self)}, scale={self.scale!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+# Integers below this are exact in float64, so scaling through a float multiply does not round.
+_EXACT_FLOAT_INT = 2**53
+_INT64_MAX = 2**63 - 1
+
+
+def _scaled(values: list, scale: Optional[int], field: str = "") -> "np.ndarray":
+    """
+    Converts the values of a column to float64, or to int64 with `scale` decimal digits.
+    Scaled values too large for a float64 multiply to be exact are converted through Decimal from the source values,
+    and values that do not fit in int64 raise OverflowError instead of wrapping.
+    """
+    import numpy as np
+
+    floats = np.array(values, np.float64)
+    if scale is None:
+        return floats
+    factor = 10**scale
+    bound = float(np.abs(floats).max(initial=0.0)) * factor
+    if bound < _EXACT_FLOAT_INT:
+        return np.rint(floats * factor).astype(np.int64)
+    scaled = [
+        int(
+            (value if isinstance(value, Decimal) else Decimal(str(value)))
+            .scaleb(scale)
+            .to_integral_value()
+        )
+        for value in values
+    ]
+    if any(abs(value) > _INT64_MAX for value in scaled):
+        raise OverflowError(
+            f"{field or 'A column'} does not fit in int64 with scale {scale}, use a smaller scale"
+        )
+    return np.array(scaled, np.int64)
@@ -0,0 +1,728 @@
+import asyncio
+
+from collections import deque
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Set,
+)
+from datetime import datetime, time
+from decimal import Decimal
+
+from pybithumb2.__env__ import API_BASE_URL
+from pybithumb2.constants import MAX_MARKETS_PER_REQUEST, MAX_MARKETS_QUERY_LENGTH
+from pybithumb2.types import (
+    RawData,
+    CandlePeriod,
+    Currency,
+    OrderID,
+    OrderState,
+    OrderType,
+    OrderBy,
+    TradeSide,
+)
+from pybithumb2.models import (
+    Account,
+    Candle,
+    DFList,
+    MarketID,
+    Market,
+    MinuteCandle,
+    DayCandle,
+    WeekCandle,
+    MonthCandle,
+    TimeUnit,
+    TradeInfo,
+    Snapshot,
+    OrderBook,
+    OrderAvailable,
+    OrderInfo,
+    Order,
+    WarningMarketInfo,
+    WalletStatus,
+    APIKeyInfo,
+)
+from pybithumb2.arrays import CandleArray
+from pybithumb2.rest import AsyncRESTClient
+from pybithumb2.client import (
+    CandleWindow,
+    _candle_windows,
+    _clip_candles,
+    _in_market_order,
+    _join_candle_arrays,
+    _market_chunks,
+)
+from pybithumb2.exceptions import APIError
+from pybithumb2.ratelimit import RateLimiter
+from pybithumb2.cache import ResponseCache, cached
+from pybithumb2.metrics import ClientMetrics
+from pybithumb2.batch import BatchResult, OrderRequest
+from pybithumb2.utils import clean_and_format_data
+
+
+class AsyncBithumbClient(AsyncRESTClient):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        use_raw_data: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
+        keep_alive: bool = True,
+        keep_alive_timeout: Optional[float] = 15.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        lazy: bool = False,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[ClientMetrics] = None,
+        coalesce: bool = False,
+    ) -> None:
+        """
+        Instantiates the asyncio Bithumb Client.
+        If either key is missing, then the client will only have access to the public API.
+        All requests share one aiohttp connection pool, which is released by `close()` or by using the client
+        as an async context manager.
+
+        Args:
+            api_key (str, optional): The API key for the client.
+            secret_key (str, optional): The secret key for the client.
+            use_raw_data (bool): Whether the API response is returned as raw data or in pydantic models.
+            pool_connections (int): The number of per-host connection pools to keep. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept open per host. Defaults to 100. Requests wait
+                for a free connection when all of them are in use.
+            keep_alive (bool): Whether connections are reused between requests. Defaults to True.
+            keep_alive_timeout (float, optional): Seconds an idle pooled connection is kept alive. Defaults to 15.
+            connect_timeout (float, optional): Seconds to wait for a connection to be established. Defaults to None.
+            read_timeout (float, optional): Seconds to wait between bytes received from the server. Defaults to None.
+            rate_limiter (RateLimiter, optional): Throttles requests per endpoint group (public, private and order)
+                before they are sent. Defaults to None (no client side limit).
+            lazy (bool): Whether list responses hold lazy views that convert a field on first access instead of
+                fully validated models. Views have the same attributes as the models. Defaults to False.
+            cache (ResponseCache, optional): Caches the responses of get_markets, get_warning_markets,
+                get_wallet_status, get_api_keys and get_order_available for the TTL of each method. Concurrent
+                identical calls share one request. Defaults to None (no caching).
+            metrics (ClientMetrics, optional): Records per-endpoint latency histograms split by stage, bytes in and
+                out, status codes, retries and parse time, exportable with `metrics.to_prometheus()`.
+                Defaults to None.
+            coalesce (bool): Whether concurrent identical public GET requests, such as get_snapshots or
+                get_orderbooks for the same markets, share one request and its decoded response. Defaults to False.
+        """
+        super().__init__(
+            API_BASE_URL,
+            api_key,
+            secret_key,
+            use_raw_data,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            keep_alive_timeout=keep_alive_timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            rate_limiter=rate_limiter,
+            lazy=lazy,
+            cache=cache,
+            metrics=metrics,
+            coalesce=coalesce,
+        )
+
+    # ##### Public API features #####
+    @cached()
+    async def get_markets(
+        self, isDetails: bool = False
+    ) -> Union[List[Market], RawData]:
+        """
+        Instantiates the Bithumb Client.
+        If either key is missing, then the client will only have access to the public API.
+
+        Args:
+            isDetails (bool): Whether the API response is returned as raw data or in pydantic models. Defaults to False.
+
+        Returns:
+            Union[List[Market], RawData]
+        """
+        data = locals().copy()
+        data.pop("self")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/market/all", is_private=False, data=data)
+
+        if self._use_raw_data:
+            return response
+
+        return self._decode_many(Market, response)
+
+    async def get_minute_candles(
+        self,
+        market: MarketID,
+        to: Optional[datetime] = None,
+        count: int = 1,
+        unit: TimeUnit = TimeUnit(1),
+        as_array: bool = False,
+    ) -> Union[DFList[MinuteCandle], CandleArray, RawData]:
+        if count <= 0 or count > 200:
+            raise APIError("You can only request betwewen 1 and 200 candles")
+
+        data = locals().copy()
+        data.pop("self")
+        data.pop("unit")
+        data.pop("as_array")
+        data = clean_and_format_data(data)
+
+        response = await self.get(
+            f"/v1/candles/minutes/{unit}", is_private=False, data=data
+        )
+
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
+        if self._use_raw_data:
+            return response
+
+        return DFList[MinuteCandle](self._decode_many(MinuteCandle, response))
+
+    async def get_day_candles(
+        self,
+        market: MarketID,
+        to: Optional[datetime] = None,
+        count: int = 1,
+        convertingPriceUnit: Optional[Currency] = None,
+        as_array: bool = False,
+    ) -> Union[DFList[DayCandle], CandleArray, RawData]:
+        if count <= 0 or count > 200:
+            raise APIError("You can only request betwewen 1 and 200 candles")
+        data = locals().copy()
+        data.pop("self")
+        data.pop("as_array")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/candles/days", is_private=False, data=data)
+
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
+        if self._use_raw_data:
+            return response
+
+        return DFList[DayCandle](self._decode_many(DayCandle, response))
+
+    async def get_week_candles(
+        self,
+        market: MarketID,
+        to: Optional[datetime] = None,
+        count: int = 1,
+        as_array: bool = False,
+    ) -> Union[DFList[WeekCandle], CandleArray, RawData]:
+        if count <= 0 or count > 200:
+            raise APIError("You can only request betwewen 1 and 200 candles")
+        data = locals().copy()
+        data.pop("self")
+        data.pop("as_array")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/candles/weeks", is_private=False, data=data)
+
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
+        if self._use_raw_data:
+            return response
+
+        return DFList[WeekCandle](self._decode_many(WeekCandle, response))
+
+    async def get_month_candles(
+        self,
+        market: MarketID,
+        to: Optional[datetime] = None,
+        count: int = 1,
+        as_array: bool = False,
+    ) -> Union[DFList[MonthCandle], CandleArray, RawData]:
+        if count <= 0 or count > 200:
+            raise APIError("You can only request betwewen 1 and 200 candles")
+        data = locals().copy()
+        data.pop("self")
+        data.pop("as_array")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/candles/months", is_private=False, data=data)
+
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
+        if self._use_raw_data:
+            return response
+
+        return DFList[MonthCandle](self._decode_many(MonthCandle, response))
+
+    async def _get_candles(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        to: datetime,
+        count: int,
+        as_array: bool = False,
+    ) -> Union[DFList[Candle], CandleArray, RawData]:
+        if isinstance(unit, TimeUnit):
+            return await self.get_minute_candles(
+                market, to=to, count=count, unit=unit, as_array=as_array
+            )
+        if unit == CandlePeriod.DAY:
+            return await self.get_day_candles(
+                market, to=to, count=count, as_array=as_array
+            )
+        if unit == CandlePeriod.WEEK:
+            return await self.get_week_candles(
+                market, to=to, count=count, as_array=as_array
+            )
+        return await self.get_month_candles(
+            market, to=to, count=count, as_array=as_array
+        )
+
+    async def _iter_candle_windows(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int,
+        as_array: bool = False,
+    ) -> AsyncIterator[
+        Tuple[CandleWindow, Union[DFList[Candle], CandleArray, RawData]]
+    ]:
+        """Yields every window of the range with its response, oldest first, fetching a few windows ahead."""
+        windows = iter(_candle_windows(unit, start, end))
+        semaphore = asyncio.Semaphore(max_workers)
+        pending = deque()
+
+        async def fetch(
+            window: CandleWindow,
+        ) -> Union[DFList[Candle], CandleArray, RawData]:
+            _, window_end, count = window
+            async with semaphore:
+                return await self._get_candles(
+                    market, unit, window_end, count, as_array
+                )
+
+        def submit(window: CandleWindow) -> None:
+            pending.append((window, asyncio.ensure_future(fetch(window))))
+
+        try:
+            for _, window in zip(range(max_workers * 2), windows):
+                submit(window)
+            while pending:
+                window, task = pending.popleft()
+                next_window = next(windows, None)
+                if next_window is not None:
+                    submit(next_window)
+                yield window, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+            # Wait for the cancellations and read the errors, so no task outlives the iterator.
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    async def iter_candles_range(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int = 8,
+    ) -> AsyncIterator[Union[Candle, RawData]]:
+        """
+        Yields every candle in [start, end) in chronological order.
+        The range is split into windows of up to 200 candles which are fetched concurrently, a few windows ahead of
+        the one being consumed. Naive datetimes are assumed to be in KST.
+
+        Args:
+            market (MarketID): The market to fetch.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+            max_workers (int): The maximum number of windows fetched at the same time. Defaults to 8.
+
+        Returns:
+            AsyncIterator[Union[Candle, RawData]]
+        """
+        windows = self._iter_candle_windows(market, unit, start, end, max_workers)
+        try:
+            async for window, candles in windows:
+                for candle in _clip_candles(candles, window):
+                    yield candle
+        finally:
+            await windows.aclose()
+
+    async def get_candles_range(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int = 8,
+        as_array: bool = False,
+    ) -> Union[DFList[Candle], CandleArray, List[RawData]]:
+        """
+        Fetches every candle in [start, end) in chronological order, lifting the 200 candle limit of a single request.
+        See `iter_candles_range`.
+
+        Args:
+            market (MarketID): The market to fetch.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+            max_workers (int): The maximum number of windows fetched at the same time. Defaults to 8.
+            as_array (bool): Whether the candles are returned as a single CandleArray. Defaults to False.
+
+        Returns:
+            Union[DFList[Candle], CandleArray, List[RawData]]
+        """
+        if as_array:
+            windows = [
+                window
+                async for window in self._iter_candle_windows(
+                    market, unit, start, end, max_workers, as_array=True
+                )
+            ]
+            return _join_candle_arrays(market, windows)
+
+        candles = [
+            candle
+            async for candle in self.iter_candles_range(
+                market, unit, start, end, max_workers=max_workers
+            )
+        ]
+
+        if self._use_raw_data:
+            return candles
+
+        return DFList(candles)
+
+    async def get_trades(
+        self,
+        market: MarketID,
+        to: Optional[time] = None,
+        count: int = 1,
+        # cursor: str, # No support for this yet. (I don't know what its supposed to do)
+        daysAgo: Optional[int] = None,
+    ) -> Union[TradeInfo, RawData]:
+        if daysAgo is not None and (daysAgo <= 0 or daysAgo > 7):
+            raise APIError("You can only request data from 1 to 7 days ago")
+        data = locals().copy()
+        data.pop("self")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/trades/ticks", is_private=False, data=data)
+
+        if self._use_raw_data:
+            return response
+
+        return DFList[TradeInfo](self._decode_many(TradeInfo, response))
+
+    async def get_snapshots(
+        self,
+        markets: List[MarketID],
+        max_markets: int = MAX_MARKETS_PER_REQUEST,
+        max_query_length: int = MAX_MARKETS_QUERY_LENGTH,
+        max_workers: int = 8,
+    ) -> Union[DFList[Snapshot], RawData]:
+        """See `BithumbClient.get_snapshots`. Chunks are fetched concurrently."""
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(chunk: List[MarketID]) -> list:
+            data = clean_and_format_data({"markets": chunk})
+            async with semaphore:
+                return await self.get("/v1/ticker", is_private=False, data=data)
+
+        responses = await asyncio.gather(
+            *(
+                fetch(chunk)
+                for chunk in _market_chunks(markets, max_markets, max_query_length)
+            )
+        )
+        response = _in_market_order(markets, responses)
+
+        if self._use_raw_data:
+            return response
+
+        return DFList[Snapshot](self._decode_many(Snapshot, response))
+
+    async def get_orderbooks(
+        self,
+        markets: List[MarketID],
+        max_markets: int = MAX_MARKETS_PER_REQUEST,
+        max_query_length: int = MAX_MARKETS_QUERY_LENGTH,
+        max_workers: int = 8,
+    ) -> Union[List[OrderBook], RawData]:
+        """See `BithumbClient.get_orderbooks`. Chunks are fetched concurrently."""
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(chunk: List[MarketID]) -> list:
+            data = clean_and_format_data({"markets": chunk})
+            async with semaphore:
+                return await self.get("/v1/orderbook", is_private=False, data=data)
+
+        responses = await asyncio.gather(
+            *(
+                fetch(chunk)
+                for chunk in _market_chunks(markets, max_markets, max_query_length)
+            )
+        )
+        response = _in_market_order(markets, responses)
+
+        if self._use_raw_data:
+            return response
+
+        return self._decode_many(OrderBook, response)
+
+    @cached()
+    async def get_warning_markets(self) -> Union[List[WarningMarketInfo], RawData]:
+        response = await self.get("/v1/market/virtual_asset_warning", is_private=False)
+
+        if self._use_raw_data:
+            return response
+
+        return self._decode_many(WarningMarketInfo, response)
+
+    # ##### Private API features #####
+    async def get_accounts(self) -> Union[List[Account], RawData]:
+        response = await self.get("/v1/accounts", is_private=True)
+
+        if self._use_raw_data:
+            return response
+
+        return self._decode_many(Account, response)
+
+    @cached(private=True)
+    async def get_order_available(
+        self, market: MarketID
+    ) -> Union[OrderAvailable, RawData]:
+        data = locals().copy()
+        data.pop("self")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/orders/chance", is_private=True, data=data)
+
+        if self._use_raw_data:
+            return response
+
+        return self._decode_one(OrderAvailable, response)
+
+    async def get_order_info(
+        self, uuid: Optional[OrderID] = None
+    ) -> Union[DFList[OrderInfo], RawData]:
+        data = locals().copy()
+        data.pop("self")
+        data = clean_and_format_data(data)
+
+        response = await self.get("/v1/orders", is_private=True, data=data)
+
+        if self._use_raw_data:
+            return response
+
+        return DFList[OrderInfo](self._decode_many(OrderInfo, response))
+
+    async def get_orders(
+        self,
+        market: MarketID,
+        uuids: Optional[List[OrderID]] = None,
+        state: Optional[OrderState] = None,
+        states: Optional[Set[OrderState]] = None,
+        page: int = 1,
+        limit: int = 100,
+        order_by: OrderBy = OrderBy.DESC,
+    ) -> Union[DFList[Order], RawData]:
+        if states:
+            if state:
+                raise AssertionError("You can not have both state and states parameter")
+
+        data = locals().copy()
+        data.pop("self")
+        data.pop("uuids")
+        data = clean_and_format_data(data)
+        if uuids:
+            data["uuids"] = [str(u.id) for u in uuids]
+
+        response = await self.get("/v1/orders", is_private=True, data=data, doseq=True)
+
+        if self._use_raw_data:
+            return response
+
+        return DFList[Order](self._decode_many(Order, response))
+
+    async def iter_orders(
+        self,
+        market: MarketID,
+        state: Optional[OrderState] = None,
+        states: Optional[Set[OrderState]] = None,
+        limit: int = 100,
+        order_by: OrderBy = OrderBy.DESC,
+        start_page: int = 1,
+    ) -> AsyncIterator[Union[Order, RawData]]:
+        """
+        Yields the orders of a market page by page until a page comes back short.
+        The next page is requested as soon as a full page arrives, so the request overlaps with the consumption of
+        the current page.
+
+        Args:
+            market (MarketID): The market of the orders.
+            state (OrderState, optional): The state of the orders.
+            states (Set[OrderState], optional): The states of the orders. Can not be used with `state`.
+            limit (int): The number of orders per page. Defaults to 100.
+            order_by (OrderBy): The order of the orders. Defaults to OrderBy.DESC.
+            start_page (int): The first page to fetch. Defaults to 1.
+
+        Returns:
+            AsyncIterator[Union[Order, RawData]]
+        """
+
+        def fetch(page: int) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self.get_orders(
+                    market,
+                    state=state,
+                    states=states,
+                    page=page,
+                    limit=limit,
+                    order_by=order_by,
+                )
+            )
+
+        page = start_page
+        task = fetch(page)
+        try:
+            while task is not None:
+                orders = await task
+                task = None
+                if len(orders) >= limit:
+                    page += 1
+                    task = fetch(page)
+                for order in orders:
+                    yield order
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def cancel_order(self, uuid: OrderID) -> Union[Order, RawData]:
+        data = locals().copy()
+        data.pop("self")
+        data = clean_and_format_data(data)
+
+        response = await self.delete("/v1/order", is_private=True, data=data)
+        if self._cache is not None:
+            # Balances and locked amounts change with every order.
+            self._cache.invalidate("get_order_available")
+
+        if self._use_raw_data:
+            return response
+        return self._decode_one(Order, response)
+
+    async def submit_order(
+        self,
+        market: MarketID,
+        side: TradeSide,
+        volume: Decimal,
+        price: Decimal,
+        ord_type: OrderType,
+    ) -> Union[Order, RawData]:
+        data = locals().copy()
+        data.pop("self")
+        data = clean_and_format_data(data)
+
+        response = await self.post("/v1/orders", is_private=True, data=data)
+        if self._cache is not None:
+            # Balances and locked amounts change with every order.
+            self._cache.invalidate("get_order_available")
+
+        if self._use_raw_data:
+            return response
+
+        return self._decode_one(Order, response)
+
+    async def submit_orders(
+        self,
+        orders: Iterable[Union[OrderRequest, RawData]],
+        max_concurrency: int = 10,
+    ) -> BatchResult[Union[Order, RawData]]:
+        """
+        Submits several orders concurrently.
+        At most `max_concurrency` requests are in flight at once, and each request still waits for the client's
+        rate limiter, if it has one. A failed order does not stop the others.
+
+        Args:
+            orders (Iterable[Union[OrderRequest, RawData]]): The orders, as OrderRequests or as dicts of
+                `submit_order` arguments.
+            max_concurrency (int): The maximum number of requests in flight. Defaults to 10.
+
+        Returns:
+            BatchResult[Union[Order, RawData]]: The order or the exception of each request, in input order, and the
+                wall time of the batch.
+        """
+        requests = [OrderRequest.of(order) for order in orders]
+
+        async def submit(request: OrderRequest) -> Union[Order, RawData]:
+            return await self.submit_order(
+                request.market,
+                request.side,
+                request.volume,
+                request.price,
+                request.ord_type,
+            )
+
+        return await self._run_batch(submit, requests, max_concurrency)
+
+    async def cancel_orders(
+        self, uuids: Iterable[OrderID], max_concurrency: int = 10
+    ) -> BatchResult[Union[Order, RawData]]:
+        """
+        Cancels several orders concurrently. See `submit_orders`.
+
+        Args:
+            uuids (Iterable[OrderID]): The orders to cancel.
+            max_concurrency (int): The maximum number of requests in flight. Defaults to 10.
+
+        Returns:
+            BatchResult[Union[Order, RawData]]: The cancelled order or the exception of each request, in input
+                order, and the wall time of the batch.
+        """
+        return await self._run_batch(self.cancel_order, list(uuids), max_concurrency)
+
+    async def _run_batch(
+        self,
+        call: Callable[[Any], Awaitable[Any]],
+        items: List[Any],
+        max_concurrency: int,
+    ) -> BatchResult:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(item: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await call(item)
+                except Exception as error:
+                    return error
+
+        start = perf_counter()
+        results = await asyncio.gather(*(run(item) for item in items))
+        return BatchResult(list(results), perf_counter() - start)
+
+    @cached(private=True)
+    async def get_wallet_status(self) -> Union[DFList[WalletStatus], RawData]:
+        response = await self.get("/v1/status/wallet", is_private=True)
+
+        if self._use_raw_data:
+            return response
+
+        return DFList[WalletStatus](self._decode_many(WalletStatus, response))
+
+    @cached(private=True)
+    async def get_api_keys(self) -> Union[DFList[APIKeyInfo], RawData]:
+        response = await self.get("/v1/api_keys", is_private=True)
+
+        if self._use_raw_data:
+            return response
+
+        return DFList[APIKeyInfo](self._decode_many(APIKeyInfo, response))
@@ -0,0 +1,68 @@
+import hmac
+import json
+import time
+import uuid
+import base64
+import hashlib
+
+from typing import Optional
+
+
+def _b64(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# PyJWT serializes the header with sorted keys and compact separators.
+_HEADER = _b64(b'{"alg":"HS256","typ":"JWT"}') + b"."
+
+
+class JWTSigner:
+    """
+    Builds the HS256 JWTs of private requests, byte for byte the same as `jwt.encode(payload, secret_key)`.
+    The encoded header, the JSON prefix holding the access key and the HMAC key schedule are computed once, so each
+    token only serializes the nonce, timestamp and query hash and finishes a copy of the prepared HMAC.
+    """
+
+    def __init__(self, api_key: str, secret_key: str) -> None:
+        """
+        Args:
+            api_key (str): The API key, sent as the `access_key` claim.
+            secret_key (str): The secret key used to sign the token.
+        """
+        self._hmac = hmac.new(secret_key.encode(), _HEADER, hashlib.sha256)
+        # json.dumps escapes the key exactly like the encoder used by PyJWT.
+        self._prefix = '{"access_key":%s,"nonce":"' % json.dumps(api_key)
+
+    def token(
+        self,
+        query: Optional[str] = None,
+        nonce: Optional[str] = None,
+        timestamp: Optional[int] = None,
+    ) -> str:
+        """
+        Returns a signed token for a request.
+
+        Args:
+            query (str, optional): The urlencoded query of the request, hashed into the `query_hash` claim.
+            nonce (str, optional): The nonce claim. Defaults to a random UUID4.
+            timestamp (int, optional): The timestamp claim in milliseconds. Defaults to now.
+
+        Returns:
+            str
+        """
+        if nonce is None:
+            nonce = str(uuid.uuid4())
+        if timestamp is None:
+            timestamp = round(time.time() * 1000)
+
+        payload = f'{self._prefix}{nonce}","timestamp":{timestamp}'
+        if query:
+            query_hash = hashlib.sha512(query.encode()).hexdigest()
+            payload += f',"query_hash":"{query_hash}","query_hash_alg":"SHA512"}}'
+        else:
+            payload += "}"
+
+        encoded_payload = _b64(payload.encode())
+        mac = self._hmac.copy()
+        mac.update(encoded_payload)
+        return b"".join((_HEADER, encoded_payload, b".", _b64(mac.digest()))).decode()
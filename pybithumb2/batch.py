@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Generic, Iterator, List, TypeVar, Union
+
+from pybithumb2.models import MarketID
+from pybithumb2.types import OrderType, RawData, TradeSide
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class OrderRequest:
+    """The arguments of one `submit_order` call."""
+
+    market: MarketID
+    side: TradeSide
+    volume: Decimal
+    price: Decimal
+    ord_type: OrderType
+
+    @classmethod
+    def of(cls, order: Union["OrderRequest", RawData]) -> "OrderRequest":
+        return order if isinstance(order, OrderRequest) else cls(**order)
+
+
+@dataclass
+class BatchResult(Generic[R]):
+    """
+    Outcome of a batch of requests, in the order they were given.
+    Each item of `results` is the response of a request, or the exception it raised.
+    """
+
+    results: List[Union[R, Exception]]
+    elapsed: float  # Wall time of the whole batch in seconds.
+
+    @property
+    def succeeded(self) -> List[R]:
+        return [r for r in self.results if not isinstance(r, Exception)]
+
+    @property
+    def errors(self) -> Dict[int, Exception]:
+        """The exceptions of the failed requests, by their position in the batch."""
+        return {i: r for i, r in enumerate(self.results) if isinstance(r, Exception)}
+
+    @property
+    def ok(self) -> bool:
+        return not any(isinstance(r, Exception) for r in self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[Union[R, Exception]]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> Union[R, Exception]:
+        return self.results[index]
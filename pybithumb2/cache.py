@@ -0,0 +1,365 @@
+import time
+import asyncio
+import inspect
+import functools
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    """Tells the followers of a cancelled call to make the call again themselves."""
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time.
+    Callers that ask for a key while its call is running wait for that call and share its result or its error.
+    Works for threads with `do` and for coroutines with `do_async`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Calls `fn` unless a call for `key` is already running, in which case its result is awaited instead.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable[[], T]): The call to make.
+
+        Returns:
+            Tuple[T, bool]: The result and whether it was shared from another caller.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            value = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """
+        Awaits `fn()` unless a call for `key` is already running, in which case its result is awaited instead.
+        If the caller running the call is cancelled, one of the waiting callers makes the call instead, so that
+        cancelling one caller never cancels the others.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable[[], Awaitable[T]]): The coroutine function to call.
+
+        Returns:
+            Tuple[T, bool]: The result and whether it was shared from another caller.
+        """
+        while True:
+            future = self._async_calls.get(key)
+            if future is None:
+                break
+            try:
+                # Shielded so that a cancelled follower does not cancel the call of the others.
+                return await asyncio.shield(future), True
+            except _LeaderCancelled:
+                # The first follower to wake up finds no call running and makes it.
+                continue
+
+        future = self._async_calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the error as retrieved, the leader raises it itself.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            del self._async_calls[key]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Misses answered by a fetch that another caller had already started.
+    shared: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        requests = self.hits + self.misses + self.shared
+        return (self.hits + self.shared) / requests if requests else 0.0
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache for the responses of rarely changing endpoints.
+    Entries expire after the TTL of their endpoint and the least recently used entry is evicted once `maxsize` is
+    reached. Concurrent misses for the same request share a single fetch.
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        "get_markets": 600.0,
+        "get_warning_markets": 60.0,
+        "get_wallet_status": 60.0,
+        "get_api_keys": 600.0,
+        "get_order_available": 5.0,
+    }
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 60.0,
+        maxsize: int = 256,
+    ) -> None:
+        """
+        Args:
+            ttls (Dict[str, float], optional): Seconds to keep responses, by client method name. Merged over
+                `DEFAULT_TTLS`. A TTL of 0 disables caching for that method.
+            default_ttl (float): Seconds to keep responses of methods without a TTL. Defaults to 60 seconds.
+            maxsize (int): The maximum number of cached responses. Defaults to 256.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, not {maxsize}")
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._stats: Dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _endpoint_stats(self, endpoint: str) -> CacheStats:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = CacheStats()
+        return stats
+
+    def _lookup(self, key: Tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._endpoint_stats(key[0]).hits += 1
+                    return True, value
+                del self._entries[key]
+        return False, None
+
+    def _store(self, key: Tuple, value: Any) -> None:
+        ttl = self.ttl(key[0])
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._endpoint_stats(evicted[0]).evictions += 1
+
+    def _count_miss(self, endpoint: str, shared: bool) -> None:
+        with self._lock:
+            stats = self._endpoint_stats(endpoint)
+            if shared:
+                stats.shared += 1
+            else:
+                stats.misses += 1
+
+    def get_or_fetch(self, key: Tuple, fetch: Callable[[], T]) -> T:
+        """
+        Returns the cached response for `key`, or fetches and caches it.
+
+        Args:
+            key (Tuple): The request key. Its first element is the endpoint name.
+            fetch (Callable[[], T]): Makes the request.
+
+        Returns:
+            T
+        """
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        def fetch_and_store() -> T:
+            value = fetch()
+            self._store(key, value)
+            return value
+
+        value, shared = self._flight.do(key, fetch_and_store)
+        self._count_miss(key[0], shared)
+        return value
+
+    async def get_or_fetch_async(
+        self, key: Tuple, fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Returns the cached response for `key`, or awaits `fetch()` and caches it.
+
+        Args:
+            key (Tuple): The request key. Its first element is the endpoint name.
+            fetch (Callable[[], Awaitable[T]]): Makes the request.
+
+        Returns:
+            T
+        """
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        async def fetch_and_store() -> T:
+            value = await fetch()
+            self._store(key, value)
+            return value
+
+        value, shared = await self._flight.do_async(key, fetch_and_store)
+        self._count_miss(key[0], shared)
+        return value
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """
+        Drops cached responses.
+
+        Args:
+            endpoint (str, optional): The client method whose responses are dropped. Defaults to every method.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == endpoint]:
+                del self._entries[key]
+
+    def stats(self, endpoint: Optional[str] = None) -> CacheStats:
+        """
+        Returns the hit and miss counters of one client method, or their sum over every method.
+
+        Args:
+            endpoint (str, optional): The client method name. Defaults to every method.
+
+        Returns:
+            CacheStats
+        """
+        with self._lock:
+            if endpoint is not None:
+                stats = self._stats.get(endpoint, CacheStats())
+                return CacheStats(
+                    stats.hits, stats.misses, stats.shared, stats.evictions
+                )
+            total = CacheStats()
+            for stats in self._stats.values():
+                total.hits += stats.hits
+                total.misses += stats.misses
+                total.shared += stats.shared
+                total.evictions += stats.evictions
+            return total
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _copy(value: T) -> T:
+    # Callers get their own list so that changing it does not change the cached one. The items are shared.
+    if isinstance(value, (list, dict)):
+        return type(value)(value)
+    return value
+
+
+def cached(private: bool = False) -> Callable:
+    """
+    Decorates a client method so that its responses go through the client's ResponseCache, if it has one.
+    Works on both sync and async methods. Responses of private endpoints are cached per API key.
+
+    Args:
+        private (bool): Whether the endpoint depends on the account. Defaults to False.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        endpoint = method.__name__
+        signature = inspect.signature(method)
+
+        def key_of(client: Any, args: tuple, kwargs: dict) -> Tuple:
+            bound = signature.bind(client, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(
+                (name, str(value))
+                for name, value in bound.arguments.items()
+                if name != "self"
+            )
+            return (
+                endpoint,
+                arguments,
+                client._use_raw_data,
+                client._lazy,
+                client._api_key if private else None,
+            )
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if self._cache is None:
+                    return await method(self, *args, **kwargs)
+                return _copy(
+                    await self._cache.get_or_fetch_async(
+                        key_of(self, args, kwargs),
+                        lambda: method(self, *args, **kwargs),
+                    )
+                )
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self._cache is None:
+                return method(self, *args, **kwargs)
+            return _copy(
+                self._cache.get_or_fetch(
+                    key_of(self, args, kwargs),
+                    lambda: method(self, *args, **kwargs),
+                )
+            )
+
+        return wrapper
+
+    return decorator
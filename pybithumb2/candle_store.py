@@ -0,0 +1,321 @@
+import os
+import json
+import threading
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from pybithumb2.arrays import CandleArray, _COLUMNS, _epoch_ms
+from pybithumb2.constants import KST
+from pybithumb2.models import MarketID, TimeUnit
+from pybithumb2.types import CandlePeriod
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# [start, end) in milliseconds since the epoch.
+Range = Tuple[int, int]
+
+_CANDLES_FILE = "candles.npy"
+_RANGES_FILE = "ranges.json"
+
+
+def _interval_name(unit: Union[TimeUnit, CandlePeriod]) -> str:
+    if isinstance(unit, TimeUnit):
+        return f"minutes{unit.minutes}"
+    return str(CandlePeriod(unit))
+
+
+def _from_epoch_ms(value: int) -> datetime:
+    """Converts milliseconds since the epoch to a naive KST datetime."""
+    return datetime.fromtimestamp(value / 1000, KST).replace(tzinfo=None)
+
+
+def _merge_ranges(ranges: List[Range]) -> List[Range]:
+    """Sorts the ranges and joins the ones that overlap or touch."""
+    merged: List[Range] = []
+    for start, end in sorted(ranges):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _subtract_ranges(start: int, end: int, covered: List[Range]) -> List[Range]:
+    """Returns the parts of [start, end) outside the sorted, disjoint `covered` ranges."""
+    gaps: List[Range] = []
+    for covered_start, covered_end in covered:
+        if covered_end <= start:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > start:
+            gaps.append((start, covered_start))
+        start = max(start, covered_end)
+    if start < end:
+        gaps.append((start, end))
+    return gaps
+
+
+class CandleStore:
+    """
+    On-disk store of historical candles, one series per (market, interval).
+    Each series is a directory holding the candles as a single NumPy structured array, which is memory-mapped on
+    read, and the time ranges it is known to cover. `sync` only requests the parts of a range that are not covered yet,
+    so a job that asks for the same history again reads it from disk instead of the API.
+    Requires `numpy`.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Args:
+            path (Union[str, os.PathLike]): The root directory of the store. Created if missing.
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _series_path(
+        self, market: MarketID, unit: Union[TimeUnit, CandlePeriod]
+    ) -> Path:
+        return self.path / str(market) / _interval_name(unit)
+
+    def ranges(
+        self, market: MarketID, unit: Union[TimeUnit, CandlePeriod]
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Returns the time ranges held for a series, as [start, end) pairs in naive KST.
+
+        Args:
+            market (MarketID): The market of the series.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+
+        Returns:
+            List[Tuple[datetime, datetime]]
+        """
+        return [
+            (_from_epoch_ms(start), _from_epoch_ms(end))
+            for start, end in self._read_ranges(self._series_path(market, unit))
+        ]
+
+    def missing(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Returns the parts of [start, end) that are not held yet, as [start, end) pairs in naive KST.
+        Naive datetimes are assumed to be in KST.
+
+        Args:
+            market (MarketID): The market of the series.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+
+        Returns:
+            List[Tuple[datetime, datetime]]
+        """
+        covered = self._read_ranges(self._series_path(market, unit))
+        return [
+            (_from_epoch_ms(gap_start), _from_epoch_ms(gap_end))
+            for gap_start, gap_end in _subtract_ranges(
+                _epoch_ms(start), _epoch_ms(end), covered
+            )
+        ]
+
+    def read(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        mmap: bool = True,
+    ) -> CandleArray:
+        """
+        Returns the stored candles that start in [start, end), without touching the API.
+        Naive datetimes are assumed to be in KST.
+
+        Args:
+            market (MarketID): The market of the series.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime, optional): The start of the range (inclusive). Defaults to the first stored candle.
+            end (datetime, optional): The end of the range (exclusive). Defaults to after the last stored candle.
+            mmap (bool): Whether the columns are read-only views of the memory-mapped file rather than copies in
+                memory. Defaults to True.
+
+        Returns:
+            CandleArray
+        """
+        records = self._read_records(self._series_path(market, unit), mmap)
+        if records is None:
+            return CandleArray.from_raw([], market=market)
+        return CandleArray(market, *(records[name] for name in _COLUMNS)).between(
+            start, end
+        )
+
+    def df(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> "pd.DataFrame":
+        """Returns the stored candles that start in [start, end) as a DataFrame. See `read`."""
+        return self.read(market, unit, start, end).df()
+
+    def sync(
+        self,
+        client: Any,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int = 8,
+    ) -> CandleArray:
+        """
+        Fetches the parts of [start, end) that are not held yet with `client.get_candles_range`, stores them and
+        returns every candle of the range. Naive datetimes are assumed to be in KST.
+
+        Args:
+            client (BithumbClient): The client used to fetch the missing candles.
+            market (MarketID): The market of the series.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+            max_workers (int): The maximum number of candle requests made at the same time. Defaults to 8.
+
+        Returns:
+            CandleArray
+        """
+        fetched = [
+            (
+                gap,
+                client.get_candles_range(
+                    market, unit, *gap, max_workers=max_workers, as_array=True
+                ),
+            )
+            for gap in self.missing(market, unit, start, end)
+        ]
+        self._save(market, unit, fetched)
+        return self.read(market, unit, start, end)
+
+    async def sync_async(
+        self,
+        client: Any,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int = 8,
+    ) -> CandleArray:
+        """
+        Same as `sync`, with an AsyncBithumbClient.
+
+        Args:
+            client (AsyncBithumbClient): The client used to fetch the missing candles.
+            market (MarketID): The market of the series.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+            max_workers (int): The maximum number of candle requests made at the same time. Defaults to 8.
+
+        Returns:
+            CandleArray
+        """
+        fetched = [
+            (
+                gap,
+                await client.get_candles_range(
+                    market, unit, *gap, max_workers=max_workers, as_array=True
+                ),
+            )
+            for gap in self.missing(market, unit, start, end)
+        ]
+        self._save(market, unit, fetched)
+        return self.read(market, unit, start, end)
+
+    def _save(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        fetched: List[Tuple[Tuple[datetime, datetime], CandleArray]],
+    ) -> None:
+        if not fetched:
+            return
+        path = self._series_path(market, unit)
+        now = _epoch_ms(datetime.now(KST))
+
+        with self._lock:
+            path.mkdir(parents=True, exist_ok=True)
+            ranges = self._read_ranges(path)
+            arrays = [self.read(market, unit, mmap=False)]
+            for (gap_start, gap_end), array in fetched:
+                arrays.append(array)
+                start, end = _epoch_ms(gap_start), _epoch_ms(gap_end)
+                if end > now:
+                    # The latest candle is still forming, so it is fetched again by the next sync.
+                    end = min(end, int(array.time[-1])) if len(array) else start
+                ranges.append((start, end))
+
+            joined = CandleArray.concat(arrays)
+            self._write(path / _CANDLES_FILE, lambda f: _write_records(f, joined))
+            self._write(
+                path / _RANGES_FILE,
+                lambda f: f.write(json.dumps(_merge_ranges(ranges)).encode()),
+            )
+
+    @staticmethod
+    def _write(path: Path, write) -> None:
+        """Writes a file through a temporary file, so that readers never see it half written."""
+        temporary = path.with_name(path.name + ".tmp")
+        with open(temporary, "wb") as f:
+            write(f)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def _read_ranges(path: Path) -> List[Range]:
+        try:
+            with open(path / _RANGES_FILE, "rb") as f:
+                return [(start, end) for start, end in json.loads(f.read())]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _read_records(path: Path, mmap: bool) -> Optional["np.ndarray"]:
+        import numpy as np
+
+        try:
+            return np.load(path / _CANDLES_FILE, mmap_mode="r" if mmap else None)
+        except FileNotFoundError:
+            return None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={str(self.path)!r})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+def _write_records(f, candles: CandleArray) -> None:
+    import numpy as np
+
+    if candles.scale is not None:
+        raise ValueError("Only float64 CandleArrays can be stored")
+    records = np.empty(
+        len(candles),
+        dtype=[
+            (name, np.int64 if name in ("time", "timestamp") else np.float64)
+            for name in _COLUMNS
+        ],
+    )
+    for name in _COLUMNS:
+        records[name] = getattr(candles, name)
+    np.save(f, records)
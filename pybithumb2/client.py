@@ -1,10 +1,30 @@
-from typing import List, Optional, Union, Set
-from datetime import datetime, time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Set,
+)
+from datetime import datetime, time, timedelta
 from decimal import Decimal
+from urllib.parse import quote_plus
 
 from pybithumb2.__env__ import API_BASE_URL
+from pybithumb2.constants import (
+    MAX_CANDLE_COUNT,
+    MAX_MARKETS_PER_REQUEST,
+    MAX_MARKETS_QUERY_LENGTH,
+)
 from pybithumb2.types import (
     RawData,
+    CandlePeriod,
     Currency,
     OrderID,
     OrderState,
@@ -14,6 +34,7 @@ from pybithumb2.types import (
 )
 from pybithumb2.models import (
     Account,
+    Candle,
     DFList,
     MarketID,
     Market,
@@ -32,9 +53,124 @@ from pybithumb2.models import (
     WalletStatus,
     APIKeyInfo,
 )
+from pybithumb2.arrays import CandleArray
 from pybithumb2.rest import RESTClient
 from pybithumb2.exceptions import APIError
-from pybithumb2.utils import clean_and_format_data
+from pybithumb2.ratelimit import RateLimiter
+from pybithumb2.cache import ResponseCache, cached
+from pybithumb2.metrics import ClientMetrics
+from pybithumb2.batch import BatchResult, OrderRequest
+from pybithumb2.utils import (
+    add_months,
+    clean_and_format_data,
+    parse_datetime,
+    to_kst,
+)
+
+CandleWindow = Tuple[datetime, datetime, int]
+
+
+def _candle_windows(
+    unit: Union[TimeUnit, CandlePeriod], start: datetime, end: datetime
+) -> List[CandleWindow]:
+    """
+    Splits the interval [start, end) into windows that each fit in a single candle request, oldest first.
+    Every window asks for one candle more than it spans, so that the result does not depend on whether the API
+    treats `to` as inclusive or exclusive.
+
+    Returns:
+        List[CandleWindow]: (window_start, window_end, count) tuples in naive KST.
+    """
+    start, end = to_kst(start), to_kst(end)
+    size = MAX_CANDLE_COUNT - 1
+    windows: List[CandleWindow] = []
+
+    window_end = end
+    while window_end > start:
+        if unit == CandlePeriod.MONTH:
+            window_start = max(start, add_months(window_end, -size))
+            span = (window_end.year - window_start.year) * 12 + (
+                window_end.month - window_start.month
+            )
+            if add_months(window_start, span) < window_end:
+                span += 1
+        else:
+            if isinstance(unit, TimeUnit):
+                step = timedelta(minutes=unit.minutes)
+            elif unit == CandlePeriod.DAY:
+                step = timedelta(days=1)
+            else:
+                step = timedelta(weeks=1)
+            window_start = max(start, window_end - step * size)
+            span = -(-(window_end - window_start) // step)
+        windows.append((window_start, window_end, min(span + 1, MAX_CANDLE_COUNT)))
+        window_end = window_start
+
+    windows.reverse()
+    return windows
+
+
+def _candle_time(candle: Union[Candle, RawData]) -> datetime:
+    if isinstance(candle, dict):
+        return parse_datetime(candle["candle_date_time_kst"])
+    return candle.candle_date_time_kst
+
+
+def _clip_candles(
+    candles: Iterable[Union[Candle, RawData]], window: CandleWindow
+) -> List[Union[Candle, RawData]]:
+    """Returns the candles inside the window in chronological order, without duplicates."""
+    window_start, window_end, _ = window
+    selected = {}
+    for candle in candles:
+        candle_time = _candle_time(candle)
+        if window_start <= candle_time < window_end:
+            selected[candle_time] = candle
+    return [selected[candle_time] for candle_time in sorted(selected)]
+
+
+def _join_candle_arrays(
+    market: MarketID, windows: Iterable[Tuple[CandleWindow, CandleArray]]
+) -> CandleArray:
+    """Joins the arrays of consecutive windows, keeping only the candles inside each window."""
+    arrays = [array.between(start, end) for (start, end, _), array in windows]
+    if not arrays:
+        return CandleArray.from_raw([], market=market)
+    return CandleArray.concat(arrays)
+
+
+def _market_chunks(
+    markets: List[MarketID], max_markets: int, max_query_length: int
+) -> List[List[MarketID]]:
+    """
+    Splits markets into lists of at most `max_markets` markets whose encoded `markets` query is at most
+    `max_query_length` characters long. Repeated markets are only requested once.
+    """
+    chunks: List[List[MarketID]] = []
+    chunk: List[MarketID] = []
+    length = 0
+    for market in dict.fromkeys(markets):
+        # Markets are joined with commas, which are sent as %2C.
+        size = len(quote_plus(str(market)))
+        if chunk and (
+            len(chunk) >= max_markets or length + 3 + size > max_query_length
+        ):
+            chunks.append(chunk)
+            chunk = []
+        length = length + 3 + size if chunk else size
+        chunk.append(market)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _in_market_order(markets: List[MarketID], responses: List[list]) -> list:
+    """Joins the responses of market chunks in the order of `markets`."""
+    order = {str(market): index for index, market in enumerate(markets)}
+    return sorted(
+        (item for response in responses for item in response),
+        key=lambda item: order.get(item.get("market"), len(order)),
+    )
 
 
 class BithumbClient(RESTClient):
@@ -43,6 +179,18 @@ class BithumbClient(RESTClient):
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         use_raw_data: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_timeout: Optional[float] = 15.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        lazy: bool = False,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[ClientMetrics] = None,
+        coalesce: bool = False,
     ) -> None:
         """
         Instantiates the Bithumb Client.
@@ -52,10 +200,48 @@ class BithumbClient(RESTClient):
             api_key (str, optional): The API key for the client.
             secret_key (str, optional): The secret key for the client.
             use_raw_data (bool): Whether the API response is returned as raw data or in pydantic models.
+            pool_connections (int): The number of per-host connection pools to keep. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept open per host. Defaults to 10.
+            pool_block (bool): Whether to wait for a free pooled connection instead of opening (and later discarding)
+                an extra one when the pool is exhausted. Defaults to False.
+            keep_alive (bool): Whether connections are reused between requests. Defaults to True.
+            keep_alive_timeout (float, optional): Seconds an idle pooled connection is kept alive. Defaults to 15.
+            connect_timeout (float, optional): Seconds to wait for a connection to be established. Defaults to None.
+            read_timeout (float, optional): Seconds to wait between bytes received from the server. Defaults to None.
+            rate_limiter (RateLimiter, optional): Throttles requests per endpoint group (public, private and order)
+                before they are sent. Defaults to None (no client side limit).
+            lazy (bool): Whether list responses hold lazy views that convert a field on first access instead of
+                fully validated models. Views have the same attributes as the models. Defaults to False.
+            cache (ResponseCache, optional): Caches the responses of get_markets, get_warning_markets,
+                get_wallet_status, get_api_keys and get_order_available for the TTL of each method. Concurrent
+                identical calls share one request. Defaults to None (no caching).
+            metrics (ClientMetrics, optional): Records per-endpoint latency histograms split by stage, bytes in and
+                out, status codes, retries and parse time, exportable with `metrics.to_prometheus()`.
+                Defaults to None.
+            coalesce (bool): Whether concurrent identical public GET requests, such as get_snapshots or
+                get_orderbooks for the same markets, share one request and its decoded response. Defaults to False.
         """
-        super().__init__(API_BASE_URL, api_key, secret_key, use_raw_data)
+        super().__init__(
+            API_BASE_URL,
+            api_key,
+            secret_key,
+            use_raw_data,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            keep_alive_timeout=keep_alive_timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            rate_limiter=rate_limiter,
+            lazy=lazy,
+            cache=cache,
+            metrics=metrics,
+            coalesce=coalesce,
+        )
 
     # ##### Public API features #####
+    @cached()
     def get_markets(self, isDetails: bool = False) -> Union[List[Market], RawData]:
         """
         Instantiates the Bithumb Client.
@@ -76,7 +262,7 @@ class BithumbClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return [Market.model_validate(item) for item in response]
+        return self._decode_many(Market, response)
 
     def get_minute_candles(
         self,
@@ -84,23 +270,25 @@ class BithumbClient(RESTClient):
         to: Optional[datetime] = None,
         count: int = 1,
         unit: TimeUnit = TimeUnit(1),
-    ) -> Union[DFList[MinuteCandle], RawData]:
+        as_array: bool = False,
+    ) -> Union[DFList[MinuteCandle], CandleArray, RawData]:
         if count <= 0 or count > 200:
             raise APIError("You can only request betwewen 1 and 200 candles")
 
         data = locals().copy()
         data.pop("self")
         data.pop("unit")
+        data.pop("as_array")
         data = clean_and_format_data(data)
 
         response = self.get(f"/v1/candles/minutes/{unit}", is_private=False, data=data)
 
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
         if self._use_raw_data:
             return response
 
-        return DFList[MinuteCandle](
-            [MinuteCandle.model_validate(item) for item in response]
-        )
+        return DFList[MinuteCandle](self._decode_many(MinuteCandle, response))
 
     def get_day_candles(
         self,
@@ -108,56 +296,194 @@ class BithumbClient(RESTClient):
         to: Optional[datetime] = None,
         count: int = 1,
         convertingPriceUnit: Optional[Currency] = None,
-    ) -> Union[DFList[DayCandle], RawData]:
+        as_array: bool = False,
+    ) -> Union[DFList[DayCandle], CandleArray, RawData]:
         if count <= 0 or count > 200:
             raise APIError("You can only request betwewen 1 and 200 candles")
         data = locals().copy()
         data.pop("self")
+        data.pop("as_array")
         data = clean_and_format_data(data)
 
         response = self.get("/v1/candles/days", is_private=False, data=data)
 
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
         if self._use_raw_data:
             return response
 
-        return DFList[DayCandle]([DayCandle.model_validate(item) for item in response])
+        return DFList[DayCandle](self._decode_many(DayCandle, response))
 
     def get_week_candles(
-        self, market: MarketID, to: Optional[datetime] = None, count: int = 1
-    ) -> Union[DFList[WeekCandle], RawData]:
+        self,
+        market: MarketID,
+        to: Optional[datetime] = None,
+        count: int = 1,
+        as_array: bool = False,
+    ) -> Union[DFList[WeekCandle], CandleArray, RawData]:
         if count <= 0 or count > 200:
             raise APIError("You can only request betwewen 1 and 200 candles")
         data = locals().copy()
         data.pop("self")
+        data.pop("as_array")
         data = clean_and_format_data(data)
 
         response = self.get("/v1/candles/weeks", is_private=False, data=data)
 
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
         if self._use_raw_data:
             return response
 
-        return DFList[WeekCandle](
-            [WeekCandle.model_validate(item) for item in response]
-        )
+        return DFList[WeekCandle](self._decode_many(WeekCandle, response))
 
     def get_month_candles(
-        self, market: MarketID, to: Optional[datetime] = None, count: int = 1
-    ) -> Union[DFList[MonthCandle], RawData]:
+        self,
+        market: MarketID,
+        to: Optional[datetime] = None,
+        count: int = 1,
+        as_array: bool = False,
+    ) -> Union[DFList[MonthCandle], CandleArray, RawData]:
         if count <= 0 or count > 200:
             raise APIError("You can only request betwewen 1 and 200 candles")
         data = locals().copy()
         data.pop("self")
+        data.pop("as_array")
         data = clean_and_format_data(data)
 
-        response = self.get("/v1/candles/weeks", is_private=False, data=data)
+        response = self.get("/v1/candles/months", is_private=False, data=data)
 
+        if as_array:
+            return CandleArray.from_raw(response, market=market)
         if self._use_raw_data:
             return response
 
-        return DFList[MonthCandle](
-            [MonthCandle.model_validate(item) for item in response]
+        return DFList[MonthCandle](self._decode_many(MonthCandle, response))
+
+    def _get_candles(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        to: datetime,
+        count: int,
+        as_array: bool = False,
+    ) -> Union[DFList[Candle], CandleArray, RawData]:
+        if isinstance(unit, TimeUnit):
+            return self.get_minute_candles(
+                market, to=to, count=count, unit=unit, as_array=as_array
+            )
+        if unit == CandlePeriod.DAY:
+            return self.get_day_candles(market, to=to, count=count, as_array=as_array)
+        if unit == CandlePeriod.WEEK:
+            return self.get_week_candles(market, to=to, count=count, as_array=as_array)
+        return self.get_month_candles(market, to=to, count=count, as_array=as_array)
+
+    def _iter_candle_windows(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int,
+        as_array: bool = False,
+    ) -> Iterator[Tuple[CandleWindow, Union[DFList[Candle], CandleArray, RawData]]]:
+        """Yields every window of the range with its response, oldest first, fetching a few windows ahead."""
+        windows = iter(_candle_windows(unit, start, end))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+
+        def submit(window: CandleWindow) -> None:
+            _, window_end, count = window
+            pending.append(
+                (
+                    window,
+                    executor.submit(
+                        self._get_candles, market, unit, window_end, count, as_array
+                    ),
+                )
+            )
+
+        try:
+            for _, window in zip(range(max_workers * 2), windows):
+                submit(window)
+            while pending:
+                window, future = pending.popleft()
+                next_window = next(windows, None)
+                if next_window is not None:
+                    submit(next_window)
+                yield window, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_candles_range(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int = 8,
+    ) -> Iterator[Union[Candle, RawData]]:
+        """
+        Yields every candle in [start, end) in chronological order.
+        The range is split into windows of up to 200 candles which are fetched concurrently, a few windows ahead of
+        the one being consumed. Naive datetimes are assumed to be in KST.
+
+        Args:
+            market (MarketID): The market to fetch.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+            max_workers (int): The maximum number of windows fetched at the same time. Defaults to 8.
+
+        Returns:
+            Iterator[Union[Candle, RawData]]
+        """
+        for window, candles in self._iter_candle_windows(
+            market, unit, start, end, max_workers
+        ):
+            yield from _clip_candles(candles, window)
+
+    def get_candles_range(
+        self,
+        market: MarketID,
+        unit: Union[TimeUnit, CandlePeriod],
+        start: datetime,
+        end: datetime,
+        max_workers: int = 8,
+        as_array: bool = False,
+    ) -> Union[DFList[Candle], CandleArray, List[RawData]]:
+        """
+        Fetches every candle in [start, end) in chronological order, lifting the 200 candle limit of a single request.
+        See `iter_candles_range`.
+
+        Args:
+            market (MarketID): The market to fetch.
+            unit (Union[TimeUnit, CandlePeriod]): The minute unit, or a day, week or month period.
+            start (datetime): The start of the range (inclusive).
+            end (datetime): The end of the range (exclusive).
+            max_workers (int): The maximum number of windows fetched at the same time. Defaults to 8.
+            as_array (bool): Whether the candles are returned as a single CandleArray. Defaults to False.
+
+        Returns:
+            Union[DFList[Candle], CandleArray, List[RawData]]
+        """
+        if as_array:
+            return _join_candle_arrays(
+                market,
+                self._iter_candle_windows(
+                    market, unit, start, end, max_workers, as_array=True
+                ),
+            )
+
+        candles = list(
+            self.iter_candles_range(market, unit, start, end, max_workers=max_workers)
         )
 
+        if self._use_raw_data:
+            return candles
+
+        return DFList(candles)
+
     def get_trades(
         self,
         market: MarketID,
@@ -177,43 +503,98 @@ class BithumbClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return DFList[TradeInfo]([TradeInfo.model_validate(item) for item in response])
+        return DFList[TradeInfo](self._decode_many(TradeInfo, response))
 
     def get_snapshots(
-        self, markets: List[MarketID]
+        self,
+        markets: List[MarketID],
+        max_markets: int = MAX_MARKETS_PER_REQUEST,
+        max_query_length: int = MAX_MARKETS_QUERY_LENGTH,
+        max_workers: int = 8,
     ) -> Union[DFList[Snapshot], RawData]:
-        data = locals().copy()
-        data.pop("self")
-        data = clean_and_format_data(data)
+        """
+        Fetches the snapshots of markets.
+        Long market lists are split into requests of at most `max_markets` markets and `max_query_length` characters
+        of query, which are sent in parallel. The results are in the order of `markets`.
 
-        response = self.get("/v1/ticker", is_private=False, data=data)
+        Args:
+            markets (List[MarketID]): The markets to fetch.
+            max_markets (int): The maximum number of markets per request. Defaults to 100.
+            max_query_length (int): The maximum length of the encoded market list per request. Defaults to 2000.
+            max_workers (int): The maximum number of requests sent at the same time. Defaults to 8.
+
+        Returns:
+            Union[DFList[Snapshot], RawData]
+        """
+        chunks = _market_chunks(markets, max_markets, max_query_length)
+
+        def fetch(chunk: List[MarketID]) -> list:
+            data = clean_and_format_data({"markets": chunk})
+            return self.get("/v1/ticker", is_private=False, data=data)
+
+        if len(chunks) <= 1:
+            responses = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(chunks))
+            ) as executor:
+                responses = list(executor.map(fetch, chunks))
+        response = _in_market_order(markets, responses)
 
         if self._use_raw_data:
             return response
 
-        return DFList[Snapshot]([Snapshot.model_validate(item) for item in response])
+        return DFList[Snapshot](self._decode_many(Snapshot, response))
 
     def get_orderbooks(
-        self, markets: List[MarketID]
+        self,
+        markets: List[MarketID],
+        max_markets: int = MAX_MARKETS_PER_REQUEST,
+        max_query_length: int = MAX_MARKETS_QUERY_LENGTH,
+        max_workers: int = 8,
     ) -> Union[List[OrderBook], RawData]:
-        data = locals().copy()
-        data.pop("self")
-        data = clean_and_format_data(data)
+        """
+        Fetches the orderbooks of markets.
+        Long market lists are split into requests of at most `max_markets` markets and `max_query_length` characters
+        of query, which are sent in parallel. The results are in the order of `markets`.
 
-        response = self.get("/v1/orderbook", is_private=False, data=data)
+        Args:
+            markets (List[MarketID]): The markets to fetch.
+            max_markets (int): The maximum number of markets per request. Defaults to 100.
+            max_query_length (int): The maximum length of the encoded market list per request. Defaults to 2000.
+            max_workers (int): The maximum number of requests sent at the same time. Defaults to 8.
+
+        Returns:
+            Union[List[OrderBook], RawData]
+        """
+        chunks = _market_chunks(markets, max_markets, max_query_length)
+
+        def fetch(chunk: List[MarketID]) -> list:
+            data = clean_and_format_data({"markets": chunk})
+            return self.get("/v1/orderbook", is_private=False, data=data)
+
+        if len(chunks) <= 1:
+            responses = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(chunks))
+            ) as executor:
+                responses = list(executor.map(fetch, chunks))
+        response = _in_market_order(markets, responses)
 
         if self._use_raw_data:
             return response
 
-        return [OrderBook(**item) for item in response]
+        return self._decode_many(OrderBook, response)
 
+    @cached()
     def get_warning_markets(self) -> Union[List[WarningMarketInfo], RawData]:
         response = self.get("/v1/market/virtual_asset_warning", is_private=False)
 
         if self._use_raw_data:
             return response
 
-        return [WarningMarketInfo.model_validate(item) for item in response]
+        return self._decode_many(WarningMarketInfo, response)
 
     # ##### Private API features #####
     def get_accounts(self) -> Union[List[Account], RawData]:
@@ -222,8 +603,9 @@ class BithumbClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return [Account.model_validate(item) for item in response]
+        return self._decode_many(Account, response)
 
+    @cached(private=True)
     def get_order_available(self, market: MarketID) -> Union[OrderAvailable, RawData]:
         data = locals().copy()
         data.pop("self")
@@ -234,7 +616,7 @@ class BithumbClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return OrderAvailable.model_validate(response)
+        return self._decode_one(OrderAvailable, response)
 
     def get_order_info(
         self, uuid: Optional[OrderID] = None
@@ -248,7 +630,7 @@ class BithumbClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return DFList[OrderInfo]([OrderInfo.model_validate(item) for item in response])
+        return DFList[OrderInfo](self._decode_many(OrderInfo, response))
 
     def get_orders(
         self,
@@ -276,7 +658,57 @@ class BithumbClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return DFList[Order]([Order.model_validate(item) for item in response])
+        return DFList[Order](self._decode_many(Order, response))
+
+    def iter_orders(
+        self,
+        market: MarketID,
+        state: Optional[OrderState] = None,
+        states: Optional[Set[OrderState]] = None,
+        limit: int = 100,
+        order_by: OrderBy = OrderBy.DESC,
+        start_page: int = 1,
+    ) -> Iterator[Union[Order, RawData]]:
+        """
+        Yields the orders of a market page by page until a page comes back short.
+        The next page is requested in the background as soon as a full page arrives, so the request overlaps with
+        the consumption of the current page.
+
+        Args:
+            market (MarketID): The market of the orders.
+            state (OrderState, optional): The state of the orders.
+            states (Set[OrderState], optional): The states of the orders. Can not be used with `state`.
+            limit (int): The number of orders per page. Defaults to 100.
+            order_by (OrderBy): The order of the orders. Defaults to OrderBy.DESC.
+            start_page (int): The first page to fetch. Defaults to 1.
+
+        Returns:
+            Iterator[Union[Order, RawData]]
+        """
+
+        def fetch(page: int) -> Union[DFList[Order], RawData]:
+            return self.get_orders(
+                market,
+                state=state,
+                states=states,
+                page=page,
+                limit=limit,
+                order_by=order_by,
+            )
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        page = start_page
+        future = executor.submit(fetch, page)
+        try:
+            while future is not None:
+                orders = future.result()
+                future = None
+                if len(orders) >= limit:
+                    page += 1
+                    future = executor.submit(fetch, page)
+                yield from orders
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def cancel_order(self, uuid: OrderID) -> Union[Order, RawData]:
         data = locals().copy()
@@ -284,10 +716,13 @@ class BithumbClient(RESTClient):
         data = clean_and_format_data(data)
 
         response = self.delete("/v1/order", is_private=True, data=data)
+        if self._cache is not None:
+            # Balances and locked amounts change with every order.
+            self._cache.invalidate("get_order_available")
 
         if self._use_raw_data:
             return response
-        return Order.model_validate(response)
+        return self._decode_one(Order, response)
 
     def submit_order(
         self,
@@ -302,28 +737,95 @@ class BithumbClient(RESTClient):
         data = clean_and_format_data(data)
 
         response = self.post("/v1/orders", is_private=True, data=data)
+        if self._cache is not None:
+            # Balances and locked amounts change with every order.
+            self._cache.invalidate("get_order_available")
 
         if self._use_raw_data:
             return response
 
-        return Order.model_validate(response)
+        return self._decode_one(Order, response)
+
+    def submit_orders(
+        self,
+        orders: Iterable[Union[OrderRequest, RawData]],
+        max_concurrency: int = 10,
+    ) -> BatchResult[Union[Order, RawData]]:
+        """
+        Submits several orders concurrently.
+        At most `max_concurrency` requests are in flight at once, and each request still waits for the client's
+        rate limiter, if it has one. A failed order does not stop the others.
 
+        Args:
+            orders (Iterable[Union[OrderRequest, RawData]]): The orders, as OrderRequests or as dicts of
+                `submit_order` arguments.
+            max_concurrency (int): The maximum number of requests in flight. Defaults to 10.
+
+        Returns:
+            BatchResult[Union[Order, RawData]]: The order or the exception of each request, in input order, and the
+                wall time of the batch.
+        """
+        requests = [OrderRequest.of(order) for order in orders]
+
+        def submit(request: OrderRequest) -> Union[Order, RawData]:
+            return self.submit_order(
+                request.market,
+                request.side,
+                request.volume,
+                request.price,
+                request.ord_type,
+            )
+
+        return self._run_batch(submit, requests, max_concurrency)
+
+    def cancel_orders(
+        self, uuids: Iterable[OrderID], max_concurrency: int = 10
+    ) -> BatchResult[Union[Order, RawData]]:
+        """
+        Cancels several orders concurrently. See `submit_orders`.
+
+        Args:
+            uuids (Iterable[OrderID]): The orders to cancel.
+            max_concurrency (int): The maximum number of requests in flight. Defaults to 10.
+
+        Returns:
+            BatchResult[Union[Order, RawData]]: The cancelled order or the exception of each request, in input
+                order, and the wall time of the batch.
+        """
+        return self._run_batch(self.cancel_order, list(uuids), max_concurrency)
+
+    def _run_batch(
+        self, call: Callable[[Any], Any], items: List[Any], max_concurrency: int
+    ) -> BatchResult:
+        def run(item: Any) -> Any:
+            try:
+                return call(item)
+            except Exception as error:
+                return error
+
+        start = perf_counter()
+        if not items:
+            return BatchResult([], 0.0)
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(items))
+        ) as executor:
+            results = list(executor.map(run, items))
+        return BatchResult(results, perf_counter() - start)
+
+    @cached(private=True)
     def get_wallet_status(self) -> Union[DFList[WalletStatus], RawData]:
         response = self.get("/v1/status/wallet", is_private=True)
 
         if self._use_raw_data:
             return response
 
-        return DFList[WalletStatus](
-            [WalletStatus.model_validate(item) for item in response]
-        )
+        return DFList[WalletStatus](self._decode_many(WalletStatus, response))
 
+    @cached(private=True)
     def get_api_keys(self) -> Union[DFList[APIKeyInfo], RawData]:
         response = self.get("/v1/api_keys", is_private=True)
 
         if self._use_raw_data:
             return response
 
-        return DFList[APIKeyInfo](
-            [APIKeyInfo.model_validate(item) for item in response]
-        )
+        return DFList[APIKeyInfo](self._decode_many(APIKeyInfo, response))
@@ -9,3 +9,10 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 DATETIME_FORMAT_T = "%Y-%m-%dT%H:%M:%S"
 DATETIME_FORMAT_TZ = "%Y-%m-%dT%H:%M:%SZ"
 KST = timezone(timedelta(hours=9))
+
+"""The maximum number of candles returned by a single candle request."""
+MAX_CANDLE_COUNT = 200
+
+"""The default limits of the markets sent in one ticker or orderbook request, larger lists are split."""
+MAX_MARKETS_PER_REQUEST = 100
+MAX_MARKETS_QUERY_LENGTH = 2000
@@ -27,6 +27,9 @@ class APIError(Exception):
         http_error = self._http_error
         if http_error is not None and hasattr(http_error, "response"):
             return http_error.response.status_code
+        if http_error is not None and hasattr(http_error, "status"):
+            # aiohttp.ClientResponseError
+            return http_error.status
 
     @property
     def request(self):
@@ -37,3 +40,10 @@ class APIError(Exception):
     def response(self):
         if self._http_error is not None:
             return self._http_error.response
+
+
+class RateLimitError(APIError):
+    """
+    Raised when a request is rejected for exceeding a rate limit, either by the client side RateLimiter or by the
+    server with a 429 status code.
+    """
@@ -0,0 +1,520 @@
+"""
+Technical indicators over candle columns.
+
+The functions (`sma`, `ema`, `rsi`, `vwap`, `bollinger`) compute an indicator over a whole series with NumPy and
+return arrays aligned with their input, NaN where the window is not full yet. Prices are the `close` column of a
+`CandleArray` or any array of floats.
+
+The classes (`SMA`, `EMA`, `RSI`, `VWAP`, `BollingerBands`) hold the state of an indicator so that appending one
+candle with `update` costs O(1). `from_history` builds that state from the candles already fetched, so a live feed
+continues exactly where the vectorized result stops. Requires `numpy`.
+"""
+
+import math
+
+from collections import deque
+from typing import Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+from pybithumb2.arrays import CandleArray
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Prices = Union[CandleArray, "np.ndarray", Sequence[float]]
+
+# EMAs are computed in blocks whose weights stay above this, so that the blocked form can not overflow.
+_MIN_EMA_WEIGHT = 1e-100
+
+
+def _column(candles: CandleArray, name: str) -> "np.ndarray":
+    import numpy as np
+
+    values = getattr(candles, name)
+    if candles.scale is None:
+        return values
+    return values.astype(np.float64) / 10**candles.scale
+
+
+def _prices(values: Prices) -> "np.ndarray":
+    import numpy as np
+
+    if isinstance(values, CandleArray):
+        return _column(values, "close")
+    return np.asarray(values, dtype=np.float64)
+
+
+def _check_period(period: int) -> None:
+    if period < 1:
+        raise ValueError(f"period must be at least 1, not {period}")
+
+
+def _rolling_sum(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Returns the sum of every full window, `len(values) - period + 1` values."""
+    import numpy as np
+
+    # Sums relative to the first value keep the cumulative sum small for prices far from zero.
+    reference = values[0]
+    total = np.concatenate([[0.0], np.cumsum(values - reference)])
+    return total[period:] - total[:-period] + period * reference
+
+
+def _ema_from(values: "np.ndarray", alpha: float, start: float) -> "np.ndarray":
+    """Returns y[k] = (1 - alpha) * y[k - 1] + alpha * values[k] with y[-1] = start, without a Python loop per value."""
+    import numpy as np
+
+    decay = 1.0 - alpha
+    out = np.empty(len(values))
+    if decay == 0.0:
+        out[:] = values
+        return out
+    # y[k] = d^(k + 1) * (start + alpha * sum(values[j] / d^(j + 1) for j <= k)) inside a block.
+    block = max(1, int(math.log(_MIN_EMA_WEIGHT) / math.log(decay)))
+    state = start
+    for first in range(0, len(values), block):
+        chunk = values[first : first + block]
+        weights = decay ** np.arange(1, len(chunk) + 1)
+        chunk_out = weights * (state + alpha * np.cumsum(chunk / weights))
+        out[first : first + len(chunk)] = chunk_out
+        state = chunk_out[-1]
+    return out
+
+
+def _nan(length: int) -> "np.ndarray":
+    import numpy as np
+
+    return np.full(length, np.nan)
+
+
+def sma(values: Prices, period: int) -> "np.ndarray":
+    """
+    Simple moving average.
+
+    Args:
+        values (Union[CandleArray, np.ndarray, Sequence[float]]): The prices, or candles to use the close of.
+        period (int): The number of values averaged.
+
+    Returns:
+        np.ndarray: The average of the `period` values up to each value, NaN for the first `period - 1`.
+    """
+    _check_period(period)
+    values = _prices(values)
+    out = _nan(len(values))
+    if len(values) >= period:
+        out[period - 1 :] = _rolling_sum(values, period) / period
+    return out
+
+
+def ema(values: Prices, period: int) -> "np.ndarray":
+    """
+    Exponential moving average with alpha = 2 / (period + 1), started from the simple average of the first `period`
+    values.
+
+    Args:
+        values (Union[CandleArray, np.ndarray, Sequence[float]]): The prices, or candles to use the close of.
+        period (int): The span of the average.
+
+    Returns:
+        np.ndarray: The average at each value, NaN for the first `period - 1`.
+    """
+    _check_period(period)
+    values = _prices(values)
+    out = _nan(len(values))
+    if len(values) >= period:
+        seed = values[:period].mean()
+        out[period - 1] = seed
+        out[period:] = _ema_from(values[period:], 2.0 / (period + 1), seed)
+    return out
+
+
+def _rsi_averages(
+    close: "np.ndarray", period: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Returns Wilder's average gain and loss from the `period`-th change on."""
+    import numpy as np
+
+    changes = np.diff(close)
+    gains = np.maximum(changes, 0.0)
+    losses = np.maximum(-changes, 0.0)
+    averages = []
+    for moves in (gains, losses):
+        seed = moves[:period].mean()
+        averages.append(
+            np.concatenate([[seed], _ema_from(moves[period:], 1.0 / period, seed)])
+        )
+    return averages[0], averages[1]
+
+
+def _rsi_value(average_gain: "np.ndarray", average_loss: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + average_gain / average_loss)
+    # No loss is 100, and no move at all is neutral.
+    return np.where(average_loss == 0, np.where(average_gain == 0, 50.0, 100.0), rsi)
+
+
+def rsi(values: Prices, period: int = 14) -> "np.ndarray":
+    """
+    Relative strength index with Wilder's smoothing.
+
+    Args:
+        values (Union[CandleArray, np.ndarray, Sequence[float]]): The prices, or candles to use the close of.
+        period (int): The number of changes averaged. Defaults to 14.
+
+    Returns:
+        np.ndarray: The index between 0 and 100 at each value, NaN for the first `period`.
+    """
+    _check_period(period)
+    close = _prices(values)
+    out = _nan(len(close))
+    if len(close) > period:
+        out[period:] = _rsi_value(*_rsi_averages(close, period))
+    return out
+
+
+def vwap(candles: CandleArray, period: Optional[int] = None) -> "np.ndarray":
+    """
+    Volume weighted average price, from the traded value and volume of each candle.
+
+    Args:
+        candles (CandleArray): The candles.
+        period (int, optional): The number of candles in a rolling window. Defaults to None (from the first candle).
+
+    Returns:
+        np.ndarray: The average price at each candle, NaN before the window is full or while nothing traded.
+    """
+    import numpy as np
+
+    value = _column(candles, "value")
+    volume = _column(candles, "volume")
+    if period is None:
+        value_sum, volume_sum = np.cumsum(value), np.cumsum(volume)
+        out = np.empty(len(value))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(value_sum, volume_sum, out=out)
+        out[volume_sum <= 0] = np.nan
+        return out
+
+    _check_period(period)
+    out = _nan(len(value))
+    if len(value) >= period:
+        value_sum = _rolling_sum(value, period)
+        volume_sum = _rolling_sum(volume, period)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            window = value_sum / volume_sum
+        window[volume_sum <= 0] = np.nan
+        out[period - 1 :] = window
+    return out
+
+
+def bollinger(
+    values: Prices, period: int = 20, width: float = 2.0
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Bollinger bands: the simple moving average and `width` population standard deviations above and below it.
+
+    Args:
+        values (Union[CandleArray, np.ndarray, Sequence[float]]): The prices, or candles to use the close of.
+        period (int): The number of values in the window. Defaults to 20.
+        width (float): The distance of the bands in standard deviations. Defaults to 2.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The middle, upper and lower bands, NaN for the first
+            `period - 1` values.
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    _check_period(period)
+    values = _prices(values)
+    middle, deviation = _nan(len(values)), _nan(len(values))
+    if len(values) >= period:
+        windows = sliding_window_view(values, period)
+        middle[period - 1 :] = windows.mean(axis=1)
+        # The deviation of each window from its own mean, which stays exact for prices far from zero.
+        deviation[period - 1 :] = windows.std(axis=1)
+    return middle, middle + width * deviation, middle - width * deviation
+
+
+class SMA:
+    """
+    Simple moving average updated one value at a time, see `sma`.
+    The window sum is recomputed every `period` updates, so rounding errors do not accumulate.
+    """
+
+    __slots__ = ("period", "value", "_window", "_sum", "_updates")
+
+    def __init__(self, period: int):
+        _check_period(period)
+        self.period = period
+        self.value = math.nan
+        self._window: deque = deque(maxlen=period)
+        self._sum = 0.0
+        self._updates = 0
+
+    @classmethod
+    def from_history(cls, values: Prices, period: int) -> "SMA":
+        """Returns the state after `values`, without updating once per value."""
+        values = _prices(values)
+        indicator = cls(period)
+        indicator._window.extend(values[-period:].tolist())
+        indicator._sum = math.fsum(indicator._window)
+        if len(indicator._window) == period:
+            indicator.value = indicator._sum / period
+        return indicator
+
+    def update(self, value: float) -> float:
+        """Appends a value and returns the new average, NaN until `period` values were seen."""
+        if len(self._window) == self.period:
+            self._sum -= self._window[0]
+        self._window.append(value)
+        self._sum += value
+        self._updates += 1
+        if self._updates % self.period == 0:
+            self._sum = math.fsum(self._window)
+        if len(self._window) == self.period:
+            self.value = self._sum / self.period
+        return self.value
+
+
+class EMA:
+    """Exponential moving average updated one value at a time, see `ema`."""
+
+    __slots__ = ("period", "alpha", "value", "_count", "_seed")
+
+    def __init__(self, period: int):
+        _check_period(period)
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = math.nan
+        self._count = 0
+        self._seed = (
+            0.0  # The sum of the first values, until there are `period` of them.
+        )
+
+    @classmethod
+    def from_history(cls, values: Prices, period: int) -> "EMA":
+        """Returns the state after `values`, without updating once per value."""
+        values = _prices(values)
+        indicator = cls(period)
+        indicator._count = len(values)
+        if len(values) >= period:
+            indicator.value = float(ema(values, period)[-1])
+        else:
+            indicator._seed = math.fsum(values.tolist())
+        return indicator
+
+    def update(self, value: float) -> float:
+        """Appends a value and returns the new average, NaN until `period` values were seen."""
+        self._count += 1
+        if self._count > self.period:
+            self.value += self.alpha * (value - self.value)
+        else:
+            self._seed += value
+            if self._count == self.period:
+                self.value = self._seed / self.period
+        return self.value
+
+
+class RSI:
+    """Relative strength index updated one value at a time, see `rsi`."""
+
+    __slots__ = (
+        "period",
+        "value",
+        "_previous",
+        "_count",
+        "_average_gain",
+        "_average_loss",
+    )
+
+    def __init__(self, period: int = 14):
+        _check_period(period)
+        self.period = period
+        self.value = math.nan
+        self._previous: Optional[float] = None
+        self._count = 0  # The number of changes seen.
+        # Sums of the first changes until there are `period` of them, then Wilder's averages.
+        self._average_gain = 0.0
+        self._average_loss = 0.0
+
+    @classmethod
+    def from_history(cls, values: Prices, period: int = 14) -> "RSI":
+        """Returns the state after `values`, without updating once per value."""
+        close = _prices(values)
+        indicator = cls(period)
+        if not len(close):
+            return indicator
+        indicator._previous = float(close[-1])
+        indicator._count = len(close) - 1
+        if len(close) > period:
+            average_gain, average_loss = _rsi_averages(close, period)
+            indicator._average_gain = float(average_gain[-1])
+            indicator._average_loss = float(average_loss[-1])
+            indicator.value = float(_rsi_value(average_gain[-1:], average_loss[-1:])[0])
+        else:
+            changes = close[1:] - close[:-1]
+            indicator._average_gain = float(changes[changes > 0].sum())
+            indicator._average_loss = float(-changes[changes < 0].sum())
+        return indicator
+
+    def update(self, value: float) -> float:
+        """Appends a value and returns the new index, NaN until `period` changes were seen."""
+        previous, self._previous = self._previous, value
+        if previous is None:
+            return self.value
+        change = value - previous
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self._count += 1
+        if self._count > self.period:
+            self._average_gain += (gain - self._average_gain) / self.period
+            self._average_loss += (loss - self._average_loss) / self.period
+        else:
+            self._average_gain += gain
+            self._average_loss += loss
+            if self._count < self.period:
+                return self.value
+            self._average_gain /= self.period
+            self._average_loss /= self.period
+        if self._average_loss == 0:
+            self.value = 50.0 if self._average_gain == 0 else 100.0
+        else:
+            self.value = 100.0 - 100.0 / (1.0 + self._average_gain / self._average_loss)
+        return self.value
+
+
+class VWAP:
+    """Volume weighted average price updated one candle at a time, see `vwap`."""
+
+    __slots__ = ("period", "value", "_window", "_value", "_volume", "_updates")
+
+    def __init__(self, period: Optional[int] = None):
+        if period is not None:
+            _check_period(period)
+        self.period = period
+        self.value = math.nan
+        self._window: Optional[deque] = None if period is None else deque()
+        self._value = 0.0
+        self._volume = 0.0
+        self._updates = 0
+
+    @classmethod
+    def from_history(cls, candles: CandleArray, period: Optional[int] = None) -> "VWAP":
+        """Returns the state after `candles`, without updating once per candle."""
+        value = _column(candles, "value")
+        volume = _column(candles, "volume")
+        indicator = cls(period)
+        if period is not None:
+            value, volume = value[-period:], volume[-period:]
+            indicator._window.extend(zip(value.tolist(), volume.tolist()))
+        indicator._value = math.fsum(value.tolist())
+        indicator._volume = math.fsum(volume.tolist())
+        indicator._set_value()
+        return indicator
+
+    def _set_value(self) -> None:
+        full = self._window is None or len(self._window) == self.period
+        self.value = (
+            self._value / self._volume if full and self._volume > 0 else math.nan
+        )
+
+    def update(self, value: float, volume: float) -> float:
+        """
+        Appends a candle and returns the new average price.
+
+        Args:
+            value (float): The traded value of the candle (`candle_acc_trade_price`).
+            volume (float): The traded volume of the candle (`candle_acc_trade_volume`).
+
+        Returns:
+            float: The average price, NaN before the window is full or while nothing traded.
+        """
+        self._value += value
+        self._volume += volume
+        if self._window is not None:
+            if len(self._window) == self.period:
+                old_value, old_volume = self._window.popleft()
+                self._value -= old_value
+                self._volume -= old_volume
+            self._window.append((value, volume))
+            self._updates += 1
+            if self._updates % self.period == 0:
+                self._value = math.fsum(v for v, _ in self._window)
+                self._volume = math.fsum(v for _, v in self._window)
+        self._set_value()
+        return self.value
+
+
+class BollingerBands:
+    """
+    Bollinger bands updated one value at a time, see `bollinger`.
+    The window sums are taken relative to a recent value and recomputed every `period` updates, so the variance stays
+    accurate for prices far from zero.
+    """
+
+    __slots__ = (
+        "period",
+        "width",
+        "value",
+        "_window",
+        "_reference",
+        "_sum",
+        "_squares",
+        "_updates",
+    )
+
+    def __init__(self, period: int = 20, width: float = 2.0):
+        _check_period(period)
+        self.period = period
+        self.width = width
+        self.value: Tuple[float, float, float] = (math.nan, math.nan, math.nan)
+        self._window: deque = deque(maxlen=period)
+        self._reference = 0.0
+        self._sum = 0.0
+        self._squares = 0.0
+        self._updates = 0
+
+    @classmethod
+    def from_history(
+        cls, values: Prices, period: int = 20, width: float = 2.0
+    ) -> "BollingerBands":
+        """Returns the state after `values`, without updating once per value."""
+        values = _prices(values)
+        indicator = cls(period, width)
+        indicator._window.extend(values[-period:].tolist())
+        indicator._resum()
+        indicator._set_value()
+        return indicator
+
+    def _resum(self) -> None:
+        self._reference = self._window[0] if self._window else 0.0
+        shifted = [value - self._reference for value in self._window]
+        self._sum = math.fsum(shifted)
+        self._squares = math.fsum(value * value for value in shifted)
+
+    def _set_value(self) -> None:
+        if len(self._window) < self.period:
+            return
+        mean = self._sum / self.period
+        deviation = math.sqrt(max(self._squares / self.period - mean * mean, 0.0))
+        middle = self._reference + mean
+        self.value = (
+            middle,
+            middle + self.width * deviation,
+            middle - self.width * deviation,
+        )
+
+    def update(self, value: float) -> Tuple[float, float, float]:
+        """Appends a value and returns the new middle, upper and lower bands, NaN until `period` values were seen."""
+        if len(self._window) == self.period:
+            old = self._window[0] - self._reference
+            self._sum -= old
+            self._squares -= old * old
+        self._window.append(value)
+        shifted = value - self._reference
+        self._sum += shifted
+        self._squares += shifted * shifted
+        self._updates += 1
+        if self._updates % self.period == 0:
+            self._resum()
+        self._set_value()
+        return self.value
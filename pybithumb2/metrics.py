@@ -0,0 +1,311 @@
+import bisect
+import threading
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Seconds. Spans sub-millisecond parsing up to slow requests.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# The phases of a request, in the order they happen.
+STAGES = ("throttle", "dns", "connect", "server", "read", "decode")
+
+
+@dataclass
+class RequestEvent:
+    """
+    Timings and sizes of one HTTP request, passed to the hooks of `ClientMetrics`.
+    Durations are in seconds. `server` is the time from sending the request to receiving the response headers, minus
+    the time spent opening a connection, so it is the latency of Bithumb and of the network. `dns` is only measured by
+    the async client; the sync client counts name resolution in `connect`.
+    """
+
+    method: str
+    endpoint: str
+    status: int  # 0 if no response was received.
+    total: float
+    throttle: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    server: float = 0.0
+    read: float = 0.0
+    decode: float = 0.0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket bounds, in the layout of a Prometheus histogram."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # The last bucket is +Inf.
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile by linear interpolation inside its bucket, like `histogram_quantile` in Prometheus.
+        Returns None if nothing was observed.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+
+@dataclass
+class EndpointSummary:
+    requests: int
+    errors: int
+    p50: Optional[float]
+    p90: Optional[float]
+    p99: Optional[float]
+    # Mean seconds spent in each stage, see STAGES.
+    stages: Dict[str, float]
+    bytes_in: int
+    bytes_out: int
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+class ClientMetrics:
+    """
+    Thread-safe collector of per-request metrics, passed to a client as `metrics=`.
+    Records latency histograms per endpoint and per stage (throttle, dns, connect, server, read, decode), bytes in and
+    out, status codes, retries and the time spent validating responses into models. `summary()` answers whether the
+    tail latency comes from the server or from parsing, and `to_prometheus()` exports everything in the Prometheus
+    text format. Hooks are called with a `RequestEvent` after every request.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        hooks: Optional[List[Callable[[RequestEvent], None]]] = None,
+    ) -> None:
+        """
+        Args:
+            buckets (Sequence[float]): The upper bounds of the histogram buckets in seconds.
+            hooks (List[Callable[[RequestEvent], None]], optional): Called with every request event.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.hooks: List[Callable[[RequestEvent], None]] = list(hooks or [])
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drops every recorded value."""
+        with self._lock:
+            self._latency: Dict[Tuple[str, str], Histogram] = {}
+            self._stages: Dict[Tuple[str, str, str], Histogram] = {}
+            self._parse: Dict[str, Histogram] = {}
+            self._parsed_rows: Dict[str, int] = {}
+            self._statuses: Dict[Tuple[str, str, int], int] = {}
+            self._errors: Dict[Tuple[str, str], int] = {}
+            self._bytes: Dict[Tuple[str, str, str], int] = {}
+            self._retries: Dict[Tuple[str, str], int] = {}
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        self.hooks.append(hook)
+
+    def _histogram(self, histograms: dict, key: tuple) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def observe_request(self, event: RequestEvent) -> None:
+        """Records a finished request and passes it to the hooks."""
+        key = (event.method, event.endpoint)
+        with self._lock:
+            self._histogram(self._latency, key).observe(event.total)
+            for stage in STAGES:
+                self._histogram(self._stages, key + (stage,)).observe(
+                    getattr(event, stage)
+                )
+            status_key = key + (event.status,)
+            self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+            if event.error is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            for direction, size in (("in", event.bytes_in), ("out", event.bytes_out)):
+                self._bytes[key + (direction,)] = (
+                    self._bytes.get(key + (direction,), 0) + size
+                )
+            if event.retries:
+                self._retries[key] = self._retries.get(key, 0) + event.retries
+        for hook in self.hooks:
+            hook(event)
+
+    def observe_parse(self, model: str, seconds: float, rows: int = 1) -> None:
+        """Records the time spent converting a response into models."""
+        with self._lock:
+            self._histogram(self._parse, model).observe(seconds)
+            self._parsed_rows[model] = self._parsed_rows.get(model, 0) + rows
+
+    def summary(self) -> Dict[str, EndpointSummary]:
+        """
+        Returns the latency quantiles and mean stage durations of every endpoint, keyed by "METHOD /path".
+
+        Returns:
+            Dict[str, EndpointSummary]
+        """
+        with self._lock:
+            summaries = {}
+            for key, histogram in sorted(self._latency.items()):
+                summaries[" ".join(key)] = EndpointSummary(
+                    requests=histogram.count,
+                    errors=self._errors.get(key, 0),
+                    p50=histogram.quantile(0.5),
+                    p90=histogram.quantile(0.9),
+                    p99=histogram.quantile(0.99),
+                    stages={
+                        stage: self._stages[key + (stage,)].mean for stage in STAGES
+                    },
+                    bytes_in=self._bytes.get(key + ("in",), 0),
+                    bytes_out=self._bytes.get(key + ("out",), 0),
+                )
+            return summaries
+
+    def parse_summary(self) -> Dict[str, Tuple[int, Optional[float]]]:
+        """Returns the number of parsed rows and the mean seconds per parse of every model."""
+        with self._lock:
+            return {
+                model: (self._parsed_rows[model], histogram.mean)
+                for model, histogram in sorted(self._parse.items())
+            }
+
+    def to_prometheus(self, prefix: str = "pybithumb2") -> str:
+        """
+        Returns every metric in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix of the metric names. Defaults to "pybithumb2".
+
+        Returns:
+            str
+        """
+        lines: List[str] = []
+
+        def histogram(
+            name: str,
+            help: str,
+            histograms: Dict[tuple, Histogram],
+            names: Tuple[str, ...],
+        ) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for key, h in sorted(histograms.items()):
+                key = key if isinstance(key, tuple) else (key,)
+                labels = _labels(**dict(zip(names, key)))
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), h.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {cumulative}'
+                    )
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {h.sum!r}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {h.count}")
+
+        def counter(
+            name: str, help: str, values: Dict[tuple, int], names: Tuple[str, ...]
+        ) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, value in sorted(values.items()):
+                lines.append(
+                    f"{prefix}_{name}{{{_labels(**dict(zip(names, key)))}}} {value}"
+                )
+
+        with self._lock:
+            histogram(
+                "request_duration_seconds",
+                "Wall time of requests, from the rate limiter to the decoded response.",
+                self._latency,
+                ("method", "endpoint"),
+            )
+            histogram(
+                "request_stage_seconds",
+                "Time spent in each stage of requests.",
+                self._stages,
+                ("method", "endpoint", "stage"),
+            )
+            histogram(
+                "parse_duration_seconds",
+                "Time spent converting responses into models.",
+                self._parse,
+                ("model",),
+            )
+            counter(
+                "responses_total",
+                "Responses by status code, 0 when no response was received.",
+                self._statuses,
+                ("method", "endpoint", "status"),
+            )
+            counter(
+                "request_errors_total",
+                "Requests that raised an error.",
+                self._errors,
+                ("method", "endpoint"),
+            )
+            counter(
+                "transferred_bytes_total",
+                "Bytes of request queries and bodies sent and of response bodies received.",
+                self._bytes,
+                ("method", "endpoint", "direction"),
+            )
+            counter(
+                "request_retries_total",
+                "Retries made by the transport.",
+                self._retries,
+                ("method", "endpoint"),
+            )
+            counter(
+                "parsed_rows_total",
+                "Rows converted into models.",
+                {(model,): rows for model, rows in self._parsed_rows.items()},
+                ("model",),
+            )
+        return "\n".join(lines) + "\n"
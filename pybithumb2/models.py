@@ -1,13 +1,25 @@
+import inspect
+
+from enum import Enum
+from types import SimpleNamespace
 from datetime import datetime, date, time
 from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
     TypeVar,
     Generic,
     Optional,
     List,
+    Tuple,
+    Union,
     TYPE_CHECKING,
+    get_args,
+    get_origin,
 )
 from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from pybithumb2.types import (
     Currency,
@@ -22,16 +34,19 @@ from pybithumb2.types import (
     WalletState,
     BlockState,
     NetworkType,
+    _Interned,
+)
+from pybithumb2.utils import (
+    parse_date,
+    parse_datetime,
+    parse_time,
+    clean_and_format_data,
 )
-from pybithumb2.utils import parse_datetime, clean_and_format_data
 from pybithumb2.constants import (
-    DATE_FORMAT,
-    TIME_FORMAT,
     CONNECTED_DATE_FORMAT,
     CONNECTED_TIME_FORMAT,
 )
 
-
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -46,11 +61,64 @@ class DataFramable:
 T = TypeVar("T", bound="DataFramable")
 
 
+def _to_column(values: List[Any], decimal_as_float: bool) -> Any:
+    """Converts the values of one field into a typed column."""
+    import numpy as np
+    import pandas as pd
+
+    sample = next((v for v in values if v is not None), None)
+
+    if isinstance(sample, (datetime, date)):
+        return pd.to_datetime(values)
+    if isinstance(sample, Decimal):
+        if not decimal_as_float:
+            return values
+        if None in values:
+            values = [np.nan if v is None else v for v in values]
+        return np.array(values, dtype=np.float64)
+    if isinstance(sample, bool):
+        return values if None in values else np.array(values, dtype=np.bool_)
+    if isinstance(sample, int):
+        if None in values:
+            return pd.array(values, dtype="Int64")
+        return np.array(values, dtype=np.int64)
+    if isinstance(sample, TimeUnit):
+        return pd.array([v.minutes if v is not None else None for v in values], "Int64")
+    if isinstance(sample, (MarketID, Currency, NetworkType, Enum)):
+        return pd.Categorical([str(v) if v is not None else None for v in values])
+    if isinstance(sample, OrderID):
+        return [str(v) if v is not None else None for v in values]
+    return values
+
+
 class DFList(Generic[T], List[T]):
-    def df(self) -> "pd.DataFrame":
+    def df(self, decimal_as_float: bool = True) -> "pd.DataFrame":
+        """
+        Builds a DataFrame with one row per element, one column at a time.
+        Datetimes and dates become datetime64 columns, market ids, currencies and enums become categoricals.
+
+        Args:
+            decimal_as_float (bool): Whether Decimal fields are converted to float64 columns or kept as Decimal
+                objects. Defaults to True.
+
+        Returns:
+            pd.DataFrame
+        """
         import pandas as pd
 
-        return pd.concat([c.df() for c in self], ignore_index=True)
+        rows = [c._asdict() if isinstance(c, LazyView) else c.__dict__ for c in self]
+        # Fields holding None are removed from the models, so the columns are the union of the keys.
+        names = dict.fromkeys(name for row in rows for name in row)
+
+        return pd.DataFrame(
+            {
+                name: _to_column([row.get(name) for row in rows], decimal_as_float)
+                for name in names
+            }
+        )
+
+
+M = TypeVar("M", bound="FormattableBaseModel")
 
 
 class FormattableBaseModel(BaseModel, DataFramable):
@@ -77,6 +145,37 @@ class FormattableBaseModel(BaseModel, DataFramable):
 
         return value
 
+    @classmethod
+    def model_validate_many(cls: type[M], items: Iterable[dict]) -> List[M]:
+        """
+        Decodes a list of API rows, producing the same objects as `model_validate` on each row.
+        Rows are converted by a decoder compiled once per model from its field annotations and validators, and built
+        with `model_construct`. A row that the decoder can not convert exactly falls back to `model_validate`.
+
+        Args:
+            items (Iterable[dict]): The rows of a list response.
+
+        Returns:
+            List[M]
+        """
+        decode = _bulk_decoder(cls).decode
+        return [decode(item) for item in items]
+
+    @classmethod
+    def lazy_many(cls, items: Iterable[dict]) -> List["LazyView"]:
+        """
+        Wraps a list of API rows in views that convert a field only when it is first read.
+        See `LazyView`.
+
+        Args:
+            items (Iterable[dict]): The rows of a list response.
+
+        Returns:
+            List[LazyView]
+        """
+        view = _lazy_view_class(cls)
+        return [view(item) for item in items]
+
     def __repr__(self) -> str:
         field_strings = ", ".join(
             f"{name}={getattr(self, name)!r}" for name in self.__dict__
@@ -87,23 +186,446 @@ class FormattableBaseModel(BaseModel, DataFramable):
         return self.__repr__()
 
 
-class MarketID(FormattableBaseModel):
-    currency_from: Currency
-    currency_to: Currency
+class _Fallback(Exception):
+    """Raised by a bulk decoder when a value can not be converted exactly like pydantic would."""
+
+
+def _coerce_decimal(value: Any) -> Decimal:
+    if type(value) is int:
+        return Decimal(value)
+    if type(value) is float:
+        # pydantic converts floats through their shortest repr
+        value = Decimal(repr(value))
+    elif not isinstance(value, Decimal):
+        raise _Fallback
+    # pydantic rejects NaN and infinity
+    if not value.is_finite():
+        raise _Fallback
+    return value
+
+
+def _coercer(annotation: Any) -> Callable[[Any], Any]:
+    """Returns a function converting an already validated value to `annotation`, or raising _Fallback."""
+    origin = get_origin(annotation)
+
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _always_fallback
+        inner = _coercer(args[0])
+        return lambda value: None if value is None else inner(value)
+
+    if origin in (list, List):
+        (arg,) = get_args(annotation) or (Any,)
+        inner = _coercer(arg)
+
+        def coerce_list(value):
+            if type(value) is not list:
+                raise _Fallback
+            return [inner(v) for v in value]
+
+        return coerce_list
+
+    if annotation is Decimal:
+        return _coerce_decimal
+
+    if annotation in (int, str, bool, float):
+
+        def coerce_exact(value):
+            if type(value) is not annotation:
+                raise _Fallback
+            return value
+
+        return coerce_exact
+
+    if annotation is date:
+
+        def coerce_date(value):
+            if type(value) is not date:
+                raise _Fallback
+            return value
+
+        return coerce_date
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+
+        def coerce_enum(value):
+            if isinstance(value, annotation):
+                return value
+            try:
+                return annotation(value)
+            except ValueError:
+                raise _Fallback
+
+        return coerce_enum
+
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, FormattableBaseModel)
+        and annotation.__init__ is FormattableBaseModel.__init__
+    ):
+
+        def coerce_model(value):
+            if isinstance(value, annotation):
+                return value
+            if type(value) is not dict:
+                raise _Fallback
+            return _bulk_decoder(annotation).decode(value)
+
+        return coerce_model
+
+    if isinstance(annotation, type):
+        # datetime, time, dataclasses and models with their own __init__ are only accepted as instances.
+        def coerce_instance(value):
+            if not isinstance(value, annotation):
+                raise _Fallback
+            return value
+
+        return coerce_instance
+
+    return _always_fallback
+
+
+def _always_fallback(value: Any) -> Any:
+    raise _Fallback
+
+
+def _decimal_field(value: Any) -> Decimal:
+    """Wildcard validator and Decimal coercion of a plain Decimal field in one step."""
+    value_type = type(value)
+    if value_type is float:
+        value = Decimal(repr(value))
+    elif value_type is str or value_type is int:
+        value = Decimal(value)
+    elif value_type is not Decimal:
+        raise _Fallback
+    # pydantic rejects NaN and infinity
+    if not value.is_finite():
+        raise _Fallback
+    return value
+
+
+class _BulkDecoder:
+    def __init__(self, model: type[FormattableBaseModel]):
+        self._model = model
+        self._post_init = bool(model.__pydantic_post_init__)
+        validators = list(model.__pydantic_decorators__.field_validators.values())
+        # pydantic runs "before" validators from the last defined to the first defined.
+        validators.reverse()
+
+        self._fields: List[Tuple[str, Callable[[Any], Any], Any]] = []
+        for name, field in model.model_fields.items():
+            steps = [
+                validator
+                for validator in validators
+                if validator.info.mode == "before"
+                and (name in validator.info.fields or "*" in validator.info.fields)
+            ]
+            self._fields.append(
+                (name, self._converter(name, field.annotation, steps), field)
+            )
+
+    @staticmethod
+    def _is_wildcard(validator) -> bool:
+        return (
+            getattr(validator.func, "__func__", None)
+            is FormattableBaseModel.validate_field.__func__
+        )
+
+    @classmethod
+    def _converter(cls, name: str, annotation: Any, validators: list) -> Callable:
+        """Composes the field's validators and the final coercion into a single function."""
+        if (
+            annotation is Decimal
+            and len(validators) == 1
+            and cls._is_wildcard(validators[0])
+        ):
+            return _decimal_field
+
+        steps = [
+            cls._step(v.func, name, annotation, cls._is_wildcard(v)) for v in validators
+        ]
+        coerce = _coercer(annotation)
+
+        if not steps:
+            return coerce
+        if len(steps) == 1:
+            (step,) = steps
+            return lambda value: coerce(step(value))
+
+        def convert(value):
+            for step in steps:
+                value = step(value)
+            return coerce(value)
+
+        return convert
+
+    @staticmethod
+    def _step(
+        func: Callable, name: str, annotation: Any, is_wildcard: bool
+    ) -> Callable[[Any], Any]:
+        if is_wildcard:
+            # Inlined copy of `FormattableBaseModel.validate_field`.
+            if not isinstance(annotation, type):
+                return lambda value: value
+
+            def convert(value):
+                if isinstance(value, str):
+                    try:
+                        return annotation(value)
+                    except ValueError:
+                        pass
+                return value
+
+            return convert
+
+        if len(inspect.signature(func).parameters) > 1:
+            info = SimpleNamespace(field_name=name)
+            return lambda value: func(value, info)
+        return func
+
+    def decode(self, item: dict) -> FormattableBaseModel:
+        model = self._model
+        if type(item) is not dict:
+            return model.model_validate(item)
+
+        values = {}
+        fields_set = set()
+        try:
+            for name, convert, field in self._fields:
+                value = item.get(name, _Fallback)
+                if value is not _Fallback:
+                    values[name] = convert(value)
+                    fields_set.add(name)
+                elif field.is_required():
+                    raise _Fallback
+                else:
+                    values[name] = field.get_default(
+                        call_default_factory=True, validated_data=values
+                    )
+        except Exception:
+            # Let pydantic produce the exact result, or the exact error.
+            return model.model_validate(item)
+
+        # Same as `model_construct`, without its alias handling.
+        if self._post_init:
+            instance = model.model_construct(fields_set, **values)
+        else:
+            instance = model.__new__(model)
+            object.__setattr__(instance, "__dict__", values)
+            object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+            object.__setattr__(instance, "__pydantic_extra__", None)
+            object.__setattr__(instance, "__pydantic_private__", None)
+
+        instance_dict = instance.__dict__
+        for key in [key for key, value in instance_dict.items() if value is None]:
+            del instance_dict[key]
+        return instance
+
+
+_BULK_DECODERS: Dict[type, _BulkDecoder] = {}
+
+
+def _bulk_decoder(model: type[FormattableBaseModel]) -> _BulkDecoder:
+    decoder = _BULK_DECODERS.get(model)
+    if decoder is None:
+        decoder = _BULK_DECODERS[model] = _BulkDecoder(model)
+    return decoder
+
+
+class LazyView(DataFramable):
+    """
+    Read-only view over a raw API row with the attributes of its model.
+    A field is converted the first time it is read, using the same conversion as `model_validate_many`, and then
+    cached on the instance. Like the models, fields that are missing or None raise AttributeError.
+    """
+
+    _model: type[FormattableBaseModel]
+    _fields: Dict[str, Tuple[Optional[Callable[[Any], Any]], Any]]
+
+    def __init__(self, raw: dict):
+        self._raw = raw
+
+    def __getattr__(self, name: str) -> Any:
+        field = self._fields.get(name)
+        if field is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        convert, info = field
+        value = self._raw.get(name, _Fallback)
+        try:
+            if convert is None:
+                raise _Fallback
+            if value is not _Fallback:
+                value = convert(value)
+            elif info.is_required():
+                raise _Fallback
+            else:
+                value = info.get_default(call_default_factory=True, validated_data={})
+        except Exception:
+            # Let pydantic produce the exact value, or the exact error.
+            value = self.model().__dict__.get(name)
+
+        if value is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        self.__dict__[name] = value
+        return value
+
+    def model(self) -> FormattableBaseModel:
+        """Returns the fully validated model of the row."""
+        model = self.__dict__.get("_LazyView__model")
+        if model is None:
+            model = self.__dict__["_LazyView__model"] = self._model.model_validate(
+                self._raw
+            )
+        return model
+
+    def _asdict(self) -> dict:
+        values = {}
+        for name in self._fields:
+            try:
+                values[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return values
+
+    def df(self) -> "pd.DataFrame":
+        return DFList([self]).df()
+
+    def __repr__(self) -> str:
+        field_strings = ", ".join(
+            f"{name}={value!r}" for name, value in self._asdict().items()
+        )
+        return f"{self.__class__.__name__}({field_strings})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+_LAZY_VIEWS: Dict[type, type[LazyView]] = {}
+
+
+def _lazy_view_class(model: type[FormattableBaseModel]) -> type[LazyView]:
+    view = _LAZY_VIEWS.get(model)
+    if view is None:
+        # Fields of models with a post init hook are read from the validated model.
+        post_init = bool(model.__pydantic_post_init__)
+        fields = {
+            name: (None if post_init else convert, info)
+            for name, convert, info in _bulk_decoder(model)._fields
+        }
+        view = _LAZY_VIEWS[model] = type(
+            f"Lazy{model.__name__}",
+            (LazyView,),
+            {"_model": model, "_fields": fields},
+        )
+    return view
+
+
+class MarketID(_Interned):
+    """
+    A market such as KRW-BTC. Instances are interned, so parsing the same market string again is a dict lookup that
+    returns the same immutable object.
+    """
+
+    __slots__ = ("currency_from", "currency_to", "_str", "_hash")
+    _fields = ("currency_from", "currency_to")
+    _interned: Dict[Any, "MarketID"] = {}
+
+    def __new__(
+        cls,
+        currency_from: Union[Currency, str],
+        currency_to: Optional[Union[Currency, str]] = None,
+    ) -> "MarketID":
+        if currency_to is None:
+            if isinstance(currency_from, MarketID):
+                return currency_from
+            return cls.from_string(currency_from)
+
+        currency_from = Currency._validate(currency_from)
+        currency_to = Currency._validate(currency_to)
+        key = (currency_from, currency_to)
+        market = cls._interned.get(key)
+        if market is None:
+            market = object.__new__(cls)
+            market_str = f"{currency_from}-{currency_to}"
+            object.__setattr__(market, "currency_from", currency_from)
+            object.__setattr__(market, "currency_to", currency_to)
+            object.__setattr__(market, "_str", market_str)
+            object.__setattr__(market, "_hash", hash(market_str))
+            market = cls._interned.setdefault(key, market)
+        return market
 
     @classmethod
     def from_string(cls, market_str: str) -> "MarketID":
+        market = cls._interned.get(market_str)
+        if market is not None:
+            return market
         try:
             currency_from, currency_to = market_str.split("-")
-            return cls(
-                currency_from=Currency(code=currency_from),
-                currency_to=Currency(code=currency_to),
-            )
         except ValueError:
             raise ValueError(f"Invalid market format: {market_str}")
+        market = cls(Currency(currency_from), Currency(currency_to))
+        return cls._interned.setdefault(market_str, market)
+
+    def _serialize(self) -> dict:
+        return {
+            "currency_from": self.currency_from._serialize(),
+            "currency_to": self.currency_to._serialize(),
+        }
+
+    # MarketID used to be a pydantic model, so it keeps the model methods callers relied on.
+    @classmethod
+    def model_validate(cls, obj: Any) -> "MarketID":
+        return _market_id_adapter.validate_python(obj)
+
+    @classmethod
+    def model_validate_json(cls, json_data: Union[str, bytes]) -> "MarketID":
+        return _market_id_adapter.validate_json(json_data)
+
+    def model_dump(self, **kwargs) -> dict:
+        return _market_id_adapter.dump_python(self, **kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        return _market_id_adapter.dump_json(self, **kwargs).decode()
+
+    def model_copy(self, **kwargs) -> "MarketID":
+        update = kwargs.get("update")
+        if not update:
+            return self
+        return MarketID(**{**self._serialize(), **update})
+
+    def df(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        fields = {name: getattr(self, name) for name in self._fields}
+        return pd.DataFrame([clean_and_format_data(fields)])
+
+    def __reduce__(self):
+        return MarketID, (self.currency_from.code, self.currency_to.code)
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, MarketID):
+            return self._str == other._str
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"MarketID(currency_from={self.currency_from!r}, currency_to={self.currency_to!r})"
 
     def __str__(self) -> str:
-        return f"{self.currency_from}-{self.currency_to}"
+        return self._str
+
+
+_market_id_adapter = TypeAdapter(MarketID)
 
 
 class Market(FormattableBaseModel):
@@ -159,9 +681,9 @@ class Candle(FormattableBaseModel):
         mode="before",
         check_fields=False,
     )
-    def validate_datetime(cls, value):
+    def validate_datetime(cls, value, info):
         if isinstance(value, str):
-            return parse_datetime(value)
+            return parse_datetime(value, (cls, info.field_name))
         return value
 
 
@@ -188,7 +710,7 @@ class WeekCandle(Candle):
     @field_validator("first_day_of_period", mode="before", check_fields=False)
     def validate_date(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, DATE_FORMAT).date()
+            return parse_date(value)
         return value
 
 
@@ -198,7 +720,7 @@ class MonthCandle(Candle):
     @field_validator("first_day_of_period", mode="before", check_fields=False)
     def validate_date(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, DATE_FORMAT).date()
+            return parse_date(value)
         return value
 
 
@@ -223,13 +745,13 @@ class TradeInfo(FormattableBaseModel):
     @field_validator("trade_date_utc", mode="before", check_fields=False)
     def validate_date(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, DATE_FORMAT).date()
+            return parse_date(value)
         return value
 
     @field_validator("trade_time_utc", mode="before", check_fields=False)
     def validate_time(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, TIME_FORMAT).time()
+            return parse_time(value)
         return value
 
 
@@ -269,13 +791,13 @@ class Snapshot(FormattableBaseModel):
     @field_validator("trade_date", "trade_date_kst", mode="before", check_fields=False)
     def validate_connected_date(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, CONNECTED_DATE_FORMAT).date()
+            return parse_date(value, CONNECTED_DATE_FORMAT)
         return value
 
     @field_validator("trade_time", "trade_time_kst", mode="before", check_fields=False)
     def validate_connected_time(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, CONNECTED_TIME_FORMAT).time()
+            return parse_time(value, CONNECTED_TIME_FORMAT)
         return value
 
     @field_validator(
@@ -283,7 +805,7 @@ class Snapshot(FormattableBaseModel):
     )
     def validate_date(cls, value):
         if isinstance(value, str):
-            return datetime.strptime(value, DATE_FORMAT).date()
+            return parse_date(value)
         return value
 
 
@@ -327,9 +849,9 @@ class WarningMarketInfo(FormattableBaseModel):
         return value
 
     @field_validator("end_date", mode="before", check_fields=False)
-    def validate_datetime(cls, value):
+    def validate_datetime(cls, value, info):
         if isinstance(value, str):
-            return parse_datetime(value)
+            return parse_datetime(value, (cls, info.field_name))
         return value
 
 
@@ -400,9 +922,9 @@ class Order(FormattableBaseModel):
         return value
 
     @field_validator("created_at", mode="before", check_fields=False)
-    def validate_datetime(cls, value):
+    def validate_datetime(cls, value, info):
         if isinstance(value, str):
-            return parse_datetime(value)
+            return parse_datetime(value, (cls, info.field_name))
         return value
 
     @field_validator("side", mode="before", check_fields=False)
@@ -428,9 +950,9 @@ class Trade(FormattableBaseModel):
         return value
 
     @field_validator("created_at", mode="before", check_fields=False)
-    def validate_datetime(cls, value):
+    def validate_datetime(cls, value, info):
         if isinstance(value, str):
-            return parse_datetime(value)
+            return parse_datetime(value, (cls, info.field_name))
         return value
 
     @field_validator("side", mode="before", check_fields=False)
@@ -455,9 +977,9 @@ class WalletStatus(FormattableBaseModel):
     network_name: str
 
     @field_validator("block_updated_at", mode="before", check_fields=False)
-    def validate_datetime(cls, value):
+    def validate_datetime(cls, value, info):
         if isinstance(value, str):
-            return parse_datetime(value)
+            return parse_datetime(value, (cls, info.field_name))
         return value
 
 
@@ -466,7 +988,7 @@ class APIKeyInfo(FormattableBaseModel):
     expire_at: datetime
 
     @field_validator("expire_at", mode="before", check_fields=False)
-    def validate_datetime(cls, value):
+    def validate_datetime(cls, value, info):
         if isinstance(value, str):
-            return parse_datetime(value)
+            return parse_datetime(value, (cls, info.field_name))
         return value
@@ -0,0 +1,341 @@
+from typing import Iterable, Optional, Tuple, Union, TYPE_CHECKING
+
+from pybithumb2.models import MarketID, OrderBook
+from pybithumb2.types import RawData, TradeSide
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+Level = Tuple[float, float]
+
+
+class _BookSide:
+    """
+    The price levels of one side of the book, kept sorted in preallocated arrays.
+    Prices are stored as keys that sort ascending towards the best price (the negated price for asks), so the best
+    level is the last one and updates near the top of the book only move a few elements.
+    """
+
+    __slots__ = ("_sign", "_keys", "_sizes", "_n", "_cumulative")
+
+    def __init__(self, side: TradeSide, capacity: int):
+        import numpy as np
+
+        self._sign = -1.0 if side == TradeSide.ASK else 1.0
+        self._keys = np.empty(capacity, dtype=np.float64)
+        self._sizes = np.empty(capacity, dtype=np.float64)
+        self._n = 0
+        self._cumulative: Optional["np.ndarray"] = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _reserve(self, capacity: int) -> None:
+        import numpy as np
+
+        if capacity <= len(self._keys):
+            return
+        capacity = max(capacity, 2 * len(self._keys))
+        keys = np.empty(capacity, dtype=np.float64)
+        sizes = np.empty(capacity, dtype=np.float64)
+        keys[: self._n] = self._keys[: self._n]
+        sizes[: self._n] = self._sizes[: self._n]
+        self._keys, self._sizes = keys, sizes
+
+    def replace(self, prices: "np.ndarray", sizes: "np.ndarray") -> None:
+        keep = sizes > 0
+        keys = prices[keep] * self._sign
+        sizes = sizes[keep]
+        order = keys.argsort(kind="stable")
+
+        n = len(keys)
+        self._reserve(n)
+        self._keys[:n] = keys[order]
+        self._sizes[:n] = sizes[order]
+        self._n = n
+        self._cumulative = None
+
+    def set(self, price: float, size: float) -> None:
+        key = price * self._sign
+        n = self._n
+        keys, sizes = self._keys, self._sizes
+        i = int(keys[:n].searchsorted(key))
+
+        if i < n and keys[i] == key:
+            if size > 0:
+                sizes[i] = size
+            else:
+                keys[i : n - 1] = keys[i + 1 : n]
+                sizes[i : n - 1] = sizes[i + 1 : n]
+                self._n = n - 1
+        elif size > 0:
+            if n == len(keys):
+                self._reserve(n + 1)
+                keys, sizes = self._keys, self._sizes
+            keys[i + 1 : n + 1] = keys[i:n]
+            sizes[i + 1 : n + 1] = sizes[i:n]
+            keys[i] = key
+            sizes[i] = size
+            self._n = n + 1
+        else:
+            return
+        self._cumulative = None
+
+    def best(self) -> Optional[Level]:
+        n = self._n
+        if not n:
+            return None
+        return float(self._keys[n - 1] * self._sign), float(self._sizes[n - 1])
+
+    def levels(self, depth: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        n = self._n
+        start = 0 if depth is None else max(0, n - depth)
+        return (
+            self._keys[start:n][::-1] * self._sign,
+            self._sizes[start:n][::-1].copy(),
+        )
+
+    def size_at(self, price: float) -> float:
+        key = price * self._sign
+        n = self._n
+        i = int(self._keys[:n].searchsorted(key))
+        if i < n and self._keys[i] == key:
+            return float(self._sizes[i])
+        return 0.0
+
+    def _cumulative_sizes(self) -> "np.ndarray":
+        """Cumulative size from the best level outwards, recomputed only after the side changes."""
+        if self._cumulative is None:
+            self._cumulative = self._sizes[: self._n][::-1].cumsum()
+        return self._cumulative
+
+    def cumulative_size(
+        self, depth: Optional[int] = None, price: Optional[float] = None
+    ) -> float:
+        n = self._n
+        if price is not None:
+            # Number of levels at the given price or better.
+            count = n - int(self._keys[:n].searchsorted(price * self._sign))
+        else:
+            count = n if depth is None else min(depth, n)
+        if count <= 0:
+            return 0.0
+        return float(self._cumulative_sizes()[count - 1])
+
+    def price_for_size(self, size: float) -> Optional[float]:
+        cumulative = self._cumulative_sizes()
+        i = int(cumulative.searchsorted(size))
+        if i >= self._n:
+            return None
+        return float(self._keys[self._n - 1 - i] * self._sign)
+
+
+class LocalOrderBook:
+    """
+    Order book of one market that is kept up to date locally.
+    Each side is a pair of float64 arrays sorted by price with spare capacity, so snapshots and single level deltas
+    are applied in place. Best prices and sizes at a price are answered in O(1) and O(log n), and cumulative sizes in
+    O(log n) from a running sum that is only rebuilt after the book changes.
+    """
+
+    def __init__(self, market: Optional[MarketID] = None, capacity: int = 64):
+        """
+        Args:
+            market (MarketID, optional): The market of the book. Defaults to the market of the first snapshot.
+            capacity (int): The number of levels per side allocated up front. Grows when exceeded. Defaults to 64.
+        """
+        self.market = market
+        self.timestamp = 0
+        self._asks = _BookSide(TradeSide.ASK, capacity)
+        self._bids = _BookSide(TradeSide.BID, capacity)
+
+    def _side(self, side: Union[TradeSide, str]) -> _BookSide:
+        return (
+            self._asks if TradeSide(str(side).upper()) == TradeSide.ASK else self._bids
+        )
+
+    def apply_snapshot(self, orderbook: Union[OrderBook, RawData]) -> bool:
+        """
+        Replaces both sides with a snapshot from `get_orderbooks` or from the orderbook stream.
+        Snapshots older than the last applied one are ignored.
+
+        Args:
+            orderbook (Union[OrderBook, RawData]): The snapshot, as a model or as raw data.
+
+        Returns:
+            bool: Whether the snapshot was applied.
+        """
+        import numpy as np
+
+        if isinstance(orderbook, OrderBook):
+            market, timestamp = orderbook.market, orderbook.timestamp
+            units = [
+                (u.ask_price, u.ask_size, u.bid_price, u.bid_size)
+                for u in orderbook.orderbook_units
+            ]
+        else:
+            market = orderbook.get("market", orderbook.get("code"))
+            timestamp = orderbook.get("timestamp", 0)
+            units = [
+                (u["ask_price"], u["ask_size"], u["bid_price"], u["bid_size"])
+                for u in orderbook["orderbook_units"]
+            ]
+
+        if timestamp and timestamp < self.timestamp:
+            return False
+        if self.market is None and market is not None:
+            self.market = (
+                MarketID.from_string(market) if isinstance(market, str) else market
+            )
+
+        columns = np.array(units, dtype=np.float64).reshape(-1, 4)
+        self._asks.replace(columns[:, 0], columns[:, 1])
+        self._bids.replace(columns[:, 2], columns[:, 3])
+        self.timestamp = timestamp or self.timestamp
+        return True
+
+    def apply_delta(
+        self,
+        side: Union[TradeSide, str],
+        price: float,
+        size: float,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Sets the size of one price level. A size of zero removes the level.
+
+        Args:
+            side (Union[TradeSide, str]): The side of the level, ASK or BID.
+            price (float): The price of the level.
+            size (float): The new total size at the price.
+            timestamp (int, optional): The time of the update in milliseconds.
+        """
+        self._side(side).set(float(price), float(size))
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+    def apply_deltas(
+        self, deltas: Iterable[Tuple[Union[TradeSide, str], float, float]]
+    ) -> None:
+        """
+        Applies several level updates. See `apply_delta`.
+
+        Args:
+            deltas (Iterable[Tuple[Union[TradeSide, str], float, float]]): (side, price, size) updates.
+        """
+        for side, price, size in deltas:
+            self._side(side).set(float(price), float(size))
+
+    @property
+    def best_ask(self) -> Optional[Level]:
+        """The lowest ask as (price, size), or None if there are no asks."""
+        return self._asks.best()
+
+    @property
+    def best_bid(self) -> Optional[Level]:
+        """The highest bid as (price, size), or None if there are no bids."""
+        return self._bids.best()
+
+    @property
+    def spread(self) -> Optional[float]:
+        ask, bid = self._asks.best(), self._bids.best()
+        if ask is None or bid is None:
+            return None
+        return ask[0] - bid[0]
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        ask, bid = self._asks.best(), self._bids.best()
+        if ask is None or bid is None:
+            return None
+        return (ask[0] + bid[0]) / 2
+
+    def asks(self, depth: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Returns the prices and sizes of the asks, best first.
+
+        Args:
+            depth (int, optional): The number of levels. Defaults to every level.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]
+        """
+        return self._asks.levels(depth)
+
+    def bids(self, depth: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Returns the prices and sizes of the bids, best first.
+
+        Args:
+            depth (int, optional): The number of levels. Defaults to every level.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]
+        """
+        return self._bids.levels(depth)
+
+    def size_at(self, side: Union[TradeSide, str], price: float) -> float:
+        """Returns the size resting at a price, 0 if there is no level at that price."""
+        return self._side(side).size_at(float(price))
+
+    def cumulative_size(
+        self,
+        side: Union[TradeSide, str],
+        depth: Optional[int] = None,
+        price: Optional[float] = None,
+    ) -> float:
+        """
+        Returns the total size of the best levels of a side.
+
+        Args:
+            side (Union[TradeSide, str]): ASK or BID.
+            depth (int, optional): The number of levels counted from the best one. Defaults to every level.
+            price (float, optional): Counts the levels at this price or better instead of a number of levels.
+
+        Returns:
+            float
+        """
+        return self._side(side).cumulative_size(depth, price)
+
+    def price_for_size(
+        self, side: Union[TradeSide, str], size: float
+    ) -> Optional[float]:
+        """
+        Returns the worst price reached when taking `size` from a side, or None if the side is not deep enough.
+
+        Args:
+            side (Union[TradeSide, str]): ASK to buy from the asks, BID to sell into the bids.
+            size (float): The size to take.
+
+        Returns:
+            Optional[float]
+        """
+        return self._side(side).price_for_size(size)
+
+    def df(self, depth: Optional[int] = None) -> "pd.DataFrame":
+        """Returns the book with one row per level, best first, in the layout of `OrderBook.orderbook_units`."""
+        import pandas as pd
+
+        ask_prices, ask_sizes = self.asks(depth)
+        bid_prices, bid_sizes = self.bids(depth)
+        return pd.DataFrame(
+            {
+                "ask_price": pd.Series(ask_prices),
+                "bid_price": pd.Series(bid_prices),
+                "ask_size": pd.Series(ask_sizes),
+                "bid_size": pd.Series(bid_sizes),
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self._asks) + len(self._bids)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(market={self.market!r}, "
+            f"best_bid={self.best_bid!r}, best_ask={self.best_ask!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
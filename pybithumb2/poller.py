@@ -0,0 +1,270 @@
+import threading
+
+from dataclasses import dataclass
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from pybithumb2.models import MarketID, Snapshot
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# The last state of each market, one row per market. A snapshot is a change when any of these fields moved.
+TICKER_STATE_DTYPE = [
+    ("trade_timestamp", "<i8"),
+    ("trade_price", "<f8"),
+    ("acc_trade_volume", "<f8"),
+    ("known", "?"),  # False until the market is seen once.
+]
+
+
+@dataclass
+class TickerChange:
+    """A market whose ticker moved between two polls. The previous values are None the first time it is seen."""
+
+    market: MarketID
+    snapshot: Snapshot
+    previous_trade_timestamp: Optional[int]
+    previous_trade_price: Optional[float]
+    previous_acc_trade_volume: Optional[float]
+
+
+class TickerPoller:
+    """
+    Polls `get_snapshots` for many markets and reports only the markets whose ticker changed.
+    The last trade timestamp, trade price and accumulated trade volume of every market are kept in one structured
+    NumPy array, and each poll compares the whole response against it in a single vectorized pass. Only the changed
+    rows are converted into `Snapshot`s, so with a client created with `use_raw_data=True` quiet markets are never
+    validated. The poll interval follows the smoothed number of changed markets per second: the next poll is due
+    once about `fill` of the markets are expected to have changed, between `min_interval` and `max_interval`.
+    Requires `numpy`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        markets: Optional[Iterable[MarketID]] = None,
+        min_interval: float = 0.2,
+        max_interval: float = 10.0,
+        fill: float = 0.1,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            client (BithumbClient): The client used to poll `get_snapshots`.
+            markets (Iterable[MarketID], optional): The markets to poll. Defaults to every market of `get_markets`,
+                listed on the first poll.
+            min_interval (float): The shortest time between two polls in seconds. Defaults to 0.2.
+            max_interval (float): The longest time between two polls in seconds. Defaults to 10.
+            fill (float): The share of markets expected to have changed at the next poll. Defaults to 0.1.
+            smoothing (float): The weight of the latest poll in the smoothed change rate. Defaults to 0.3.
+        """
+        import numpy as np
+
+        if not 0 < fill <= 1:
+            raise ValueError(f"fill must be in (0, 1], not {fill}")
+        self._client = client
+        self.markets: Optional[List[MarketID]] = (
+            None if markets is None else list(dict.fromkeys(markets))
+        )
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.fill = fill
+        self.smoothing = smoothing
+        self.interval = min_interval
+        self.rate: Optional[float] = None  # Changed markets per second, smoothed.
+        self._last_poll: Optional[float] = None
+        self._state = np.zeros(0, dtype=TICKER_STATE_DTYPE)
+        self._rows: Dict[str, int] = {}
+        self._row_markets: List[MarketID] = []
+        # The market order of the last response and its rows in the state.
+        self._last_keys: List[str] = []
+        self._last_index = np.zeros(0, dtype=np.intp)
+        self._stop = threading.Event()
+
+    def _list_markets(self) -> List[MarketID]:
+        return [
+            (
+                MarketID.from_string(market["market"])
+                if isinstance(market, dict)
+                else market.market
+            )
+            for market in self._client.get_markets()
+        ]
+
+    def _index(self, keys: List[str]) -> "np.ndarray":
+        """Returns the state row of every response row, adding rows for markets seen for the first time."""
+        import numpy as np
+
+        if keys == self._last_keys:
+            return self._last_index
+        added = 0
+        for key in keys:
+            if key not in self._rows:
+                self._rows[key] = len(self._rows)
+                self._row_markets.append(MarketID.from_string(key))
+                added += 1
+        if added:
+            self._state = np.concatenate(
+                [self._state, np.zeros(added, dtype=self._state.dtype)]
+            )
+        index = np.fromiter(
+            (self._rows[key] for key in keys), dtype=np.intp, count=len(keys)
+        )
+        self._last_keys, self._last_index = keys, index
+        return index
+
+    def poll(self) -> List[TickerChange]:
+        """
+        Polls the markets once and schedules the next poll.
+
+        Returns:
+            List[TickerChange]: The markets that changed since the previous poll, in the order of the response. Every
+                market is a change on the first poll.
+        """
+        import numpy as np
+
+        if self.markets is None:
+            self.markets = self._list_markets()
+        now = monotonic()
+        rows = list(self._client.get_snapshots(self.markets))
+        if not rows:
+            self._schedule(now, 0)
+            return []
+
+        raw = isinstance(rows[0], dict)
+        get = dict.__getitem__ if raw else getattr
+        keys = [str(get(row, "market")) for row in rows]
+        timestamps = np.array(
+            [get(row, "trade_timestamp") for row in rows], dtype=np.int64
+        )
+        prices = np.array([get(row, "trade_price") for row in rows], dtype=np.float64)
+        volumes = np.array(
+            [get(row, "acc_trade_volume") for row in rows], dtype=np.float64
+        )
+
+        index = self._index(keys)
+        state = self._state[index]
+        changed = np.flatnonzero(
+            ~state["known"]
+            | (state["trade_timestamp"] != timestamps)
+            | (state["trade_price"] != prices)
+            | (state["acc_trade_volume"] != volumes)
+        )
+        previous = state[changed]
+        rows_changed = index[changed]
+        self._state["trade_timestamp"][rows_changed] = timestamps[changed]
+        self._state["trade_price"][rows_changed] = prices[changed]
+        self._state["acc_trade_volume"][rows_changed] = volumes[changed]
+        self._state["known"][rows_changed] = True
+
+        changed_rows = [rows[i] for i in changed.tolist()]
+        if raw:
+            changed_rows = Snapshot.model_validate_many(changed_rows)
+        changes = [
+            TickerChange(
+                self._row_markets[row],
+                snapshot,
+                *(
+                    (int(before[0]), float(before[1]), float(before[2]))
+                    if before[3]
+                    else (None, None, None)
+                ),
+            )
+            for row, snapshot, before in zip(
+                rows_changed.tolist(), changed_rows, previous.tolist()
+            )
+        ]
+        self._schedule(now, len(changes))
+        return changes
+
+    def _schedule(self, now: float, changes: int) -> None:
+        if self._last_poll is not None:
+            rate = changes / max(now - self._last_poll, 1e-3)
+            self.rate = (
+                rate
+                if self.rate is None
+                else self.smoothing * rate + (1 - self.smoothing) * self.rate
+            )
+        self._last_poll = now
+
+        if not self.rate:
+            # Nothing moved, back off gradually.
+            interval = self.interval * 2
+        else:
+            interval = self.fill * max(len(self._rows), 1) / self.rate
+            # Avoid jumping from a busy burst straight to the longest interval.
+            interval = min(interval, self.interval * 2)
+        self.interval = min(self.max_interval, max(self.min_interval, interval))
+
+    def run(
+        self,
+        on_change: Callable[[TickerChange], None],
+        duration: Optional[float] = None,
+    ) -> None:
+        """
+        Polls until `stop()` is called or `duration` seconds have passed, calling `on_change` with every change.
+        Errors of a poll or of `on_change` are not caught.
+
+        Args:
+            on_change (Callable[[TickerChange], None]): Called with each changed market.
+            duration (float, optional): How long to poll for in seconds. Defaults to until stopped.
+        """
+        self._stop.clear()
+        deadline = None if duration is None else monotonic() + duration
+        while True:
+            for change in self.poll():
+                on_change(change)
+            wait = self.interval
+            if deadline is not None:
+                wait = min(wait, deadline - monotonic())
+            if wait <= 0 or self._stop.wait(wait):
+                return
+            if deadline is not None and monotonic() >= deadline:
+                return
+
+    def stop(self) -> None:
+        """Stops `run()` from another thread."""
+        self._stop.set()
+
+    def state(self) -> "np.ndarray":
+        """Returns a copy of the last known state, one row per market in the order of `state_markets()`."""
+        return self._state.copy()
+
+    def state_markets(self) -> List[MarketID]:
+        """Returns the market of every row of `state()`."""
+        return list(self._row_markets)
+
+    def df(self) -> "pd.DataFrame":
+        """Returns the last known state of every seen market as a DataFrame indexed by market."""
+        import pandas as pd
+
+        known = self._state["known"]
+        return pd.DataFrame(
+            {
+                name: self._state[name][known]
+                for name in ("trade_timestamp", "trade_price", "acc_trade_volume")
+            },
+            index=pd.Index(
+                [str(m) for m, k in zip(self._row_markets, known) if k], name="market"
+            ),
+        )
+
+    def __repr__(self) -> str:
+        markets = None if self.markets is None else len(self.markets)
+        return (
+            f"{self.__class__.__name__}(markets={markets}, "
+            f"interval={self.interval!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
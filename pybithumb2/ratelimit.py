@@ -0,0 +1,157 @@
+import time
+import asyncio
+import threading
+
+from typing import Dict, Optional
+
+from pybithumb2.types import FormattableEnum
+from pybithumb2.exceptions import RateLimitError
+
+
+class EndpointGroup(FormattableEnum):
+    """Bithumb counts requests against separate limits for each of these groups."""
+
+    PUBLIC = "public"
+    PRIVATE = "private"
+    ORDER = "order"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Tokens are reserved under a lock that is only held while doing arithmetic, so the same bucket can be shared by
+    threads and by coroutines without blocking the event loop.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate (float): The number of tokens added per second.
+            burst (int, optional): The maximum number of tokens the bucket holds. Defaults to `rate`.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, not {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        if self.capacity < 1:
+            raise ValueError(f"burst must be at least 1, not {burst}")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, max_wait: Optional[float]) -> Optional[float]:
+        """
+        Takes a token and returns how long the caller has to wait before using it.
+        Returns None without taking a token if the wait would exceed `max_wait`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            # The balance may go negative: later callers queue behind this reservation.
+            self._tokens -= 1
+            return wait
+
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Takes a token, sleeping until one is available.
+
+        Args:
+            max_wait (float, optional): The longest the caller is willing to wait. None waits as long as needed.
+
+        Returns:
+            bool: Whether a token was taken.
+        """
+        wait = self._reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Takes a token, awaiting until one is available.
+
+        Args:
+            max_wait (float, optional): The longest the caller is willing to wait. None waits as long as needed.
+
+        Returns:
+            bool: Whether a token was taken.
+        """
+        wait = self._reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+
+class RateLimiter:
+    """
+    Client side rate limiter with one token bucket per endpoint group.
+    The defaults follow Bithumb's published limits of 150 public and 140 private requests per second.
+    """
+
+    def __init__(
+        self,
+        public_rate: float = 150,
+        public_burst: Optional[int] = None,
+        private_rate: float = 140,
+        private_burst: Optional[int] = None,
+        order_rate: float = 140,
+        order_burst: Optional[int] = None,
+        block: bool = True,
+        max_wait: Optional[float] = None,
+    ):
+        """
+        Args:
+            public_rate (float): Requests per second for public endpoints. Defaults to 150.
+            public_burst (int, optional): Burst size for public endpoints. Defaults to `public_rate`.
+            private_rate (float): Requests per second for private, non order endpoints. Defaults to 140.
+            private_burst (int, optional): Burst size for private endpoints. Defaults to `private_rate`.
+            order_rate (float): Requests per second for order submission and cancellation. Defaults to 140.
+            order_burst (int, optional): Burst size for order endpoints. Defaults to `order_rate`.
+            block (bool): Whether to queue requests until the limit allows them. If False, a request that would
+                have to wait raises RateLimitError instead. Defaults to True.
+            max_wait (float, optional): When blocking, the longest a request may be queued before RateLimitError is
+                raised. Defaults to None (no limit).
+        """
+        self._buckets: Dict[EndpointGroup, TokenBucket] = {
+            EndpointGroup.PUBLIC: TokenBucket(public_rate, public_burst),
+            EndpointGroup.PRIVATE: TokenBucket(private_rate, private_burst),
+            EndpointGroup.ORDER: TokenBucket(order_rate, order_burst),
+        }
+        self._max_wait = max_wait if block else 0.0
+
+    def bucket(self, group: EndpointGroup) -> TokenBucket:
+        return self._buckets[group]
+
+    def acquire(self, group: EndpointGroup) -> None:
+        """Waits for a request slot of the given group, or raises RateLimitError."""
+        if not self._buckets[group].acquire(self._max_wait):
+            raise RateLimitError(
+                f"Client side rate limit reached for {group} endpoints"
+            )
+
+    async def acquire_async(self, group: EndpointGroup) -> None:
+        """Awaits a request slot of the given group, or raises RateLimitError."""
+        if not await self._buckets[group].acquire_async(self._max_wait):
+            raise RateLimitError(
+                f"Client side rate limit reached for {group} endpoints"
+            )
+
+    @staticmethod
+    def group_of(method: str, path: str, is_private: bool) -> EndpointGroup:
+        """Classifies a request into the endpoint group whose limit it counts against."""
+        if not is_private:
+            return EndpointGroup.PUBLIC
+        if method.upper() in ["POST", "DELETE"] and path in ["/v1/orders", "/v1/order"]:
+            return EndpointGroup.ORDER
+        return EndpointGroup.PRIVATE
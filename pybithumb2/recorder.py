@@ -0,0 +1,382 @@
+import os
+import heapq
+import bisect
+import threading
+
+from datetime import datetime
+from pathlib import Path
+from time import monotonic
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from pybithumb2.arrays import _epoch_ms
+from pybithumb2.models import MarketID, TradeInfo
+from pybithumb2.types import RawData, TradeSide
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# One record per tick, little endian and unpadded so the log is portable.
+TICK_DTYPE = [
+    ("timestamp", "<i8"),
+    ("sequential_id", "<i8"),
+    ("price", "<f8"),
+    ("volume", "<f8"),
+    ("side", "i1"),  # 1 for BID, 0 for ASK.
+]
+
+Tick = Tuple[int, int, float, float, int]
+
+
+def _tick(trade: Union[TradeInfo, RawData]) -> Tick:
+    if isinstance(trade, dict):
+        return (
+            int(trade["timestamp"]),
+            int(trade.get("sequential_id") or 0),
+            float(trade["trade_price"]),
+            float(trade["trade_volume"]),
+            int(str(trade["ask_bid"]).upper() == str(TradeSide.BID)),
+        )
+    return (
+        int(trade.timestamp),
+        int(trade.sequential_id or 0),
+        float(trade.trade_price),
+        float(trade.trade_volume),
+        int(trade.ask_bid == TradeSide.BID),
+    )
+
+
+class TickLog:
+    """
+    Append-only binary log of the trade ticks of one market, in (timestamp, sequential_id) order.
+    Ticks are fixed size records (see `TICK_DTYPE`) in a `.ticks` file. A `.idx` file next to it holds the timestamp
+    of every `index_stride`-th record, so a time range is located by a binary search over the small index followed by
+    one over a single block of the memory-mapped log. Requires `numpy`.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], index_stride: int = 4096):
+        """
+        Args:
+            path (Union[str, os.PathLike]): The log file. Created with its parent directories if missing.
+            index_stride (int): The number of records between index entries. Defaults to 4096.
+        """
+        import numpy as np
+
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+        self.index_stride = index_stride
+        self._dtype = np.dtype(TICK_DTYPE)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+        size = self.path.stat().st_size
+        if size % self._dtype.itemsize:
+            # A write was cut short, drop the partial record.
+            os.truncate(self.path, size - size % self._dtype.itemsize)
+        self._count = self.path.stat().st_size // self._dtype.itemsize
+        self._index = self._load_index()
+
+    def _load_index(self) -> List[int]:
+        import numpy as np
+
+        expected = -(-self._count // self.index_stride)
+        if self.index_path.exists():
+            index = np.fromfile(self.index_path, dtype="<i8").tolist()
+            if len(index) == expected:
+                return index
+        # Missing or out of date after a crash: rebuild it from the log.
+        index = (
+            self._records()["timestamp"][:: self.index_stride].tolist()
+            if self._count
+            else []
+        )
+        np.array(index, dtype="<i8").tofile(self.index_path)
+        return index
+
+    def _records(self) -> "np.ndarray":
+        import numpy as np
+
+        if not self._count:
+            return np.empty(0, dtype=self._dtype)
+        return np.memmap(self.path, dtype=self._dtype, mode="r", shape=(self._count,))
+
+    def append(self, ticks: Iterable[Tick]) -> int:
+        """
+        Appends ticks at the end of the log. They must not be older than the last recorded tick.
+
+        Args:
+            ticks (Iterable[Tick]): (timestamp, sequential_id, price, volume, side) tuples, in order.
+
+        Returns:
+            int: The number of appended ticks.
+        """
+        import numpy as np
+
+        records = np.array(list(ticks), dtype=self._dtype)
+        if not len(records):
+            return 0
+        with self._lock:
+            first = self._count
+            with open(self.path, "ab") as f:
+                f.write(records.tobytes())
+            self._count += len(records)
+
+            start = -(-first // self.index_stride) * self.index_stride
+            new_entries = records["timestamp"][start - first :: self.index_stride]
+            if len(new_entries):
+                with open(self.index_path, "ab") as f:
+                    f.write(new_entries.astype("<i8").tobytes())
+                self._index.extend(new_entries.tolist())
+        return len(records)
+
+    def last(self, count: int = 1) -> "np.ndarray":
+        """Returns the last `count` records."""
+        return self._records()[max(0, self._count - count) :]
+
+    def read(
+        self,
+        start: Optional[Union[datetime, int]] = None,
+        end: Optional[Union[datetime, int]] = None,
+    ) -> "np.ndarray":
+        """
+        Returns the ticks with a timestamp in [start, end) as a read-only view of the memory-mapped log.
+
+        Args:
+            start (Union[datetime, int], optional): The start of the range, as a datetime (naive means KST) or in
+                milliseconds since the epoch. Defaults to the first tick.
+            end (Union[datetime, int], optional): The end of the range. Defaults to after the last tick.
+
+        Returns:
+            np.ndarray: A structured array with the fields of `TICK_DTYPE`.
+        """
+        records = self._records()
+        first = 0 if start is None else self._locate(records, start)
+        last = self._count if end is None else self._locate(records, end)
+        return records[first:last]
+
+    def _locate(self, records: "np.ndarray", value: Union[datetime, int]) -> int:
+        """Returns the position of the first record at or after the given time."""
+        timestamp = _epoch_ms(value) if isinstance(value, datetime) else int(value)
+        # The record is in the last block that starts before the given time.
+        block = max(0, bisect.bisect_left(self._index, timestamp) - 1)
+        lo = block * self.index_stride
+        hi = min(self._count, lo + self.index_stride)
+        return lo + int(records["timestamp"][lo:hi].searchsorted(timestamp))
+
+    def df(
+        self,
+        start: Optional[Union[datetime, int]] = None,
+        end: Optional[Union[datetime, int]] = None,
+    ) -> "pd.DataFrame":
+        """Returns the ticks in [start, end) as a DataFrame with a datetime64[ms] UTC-naive `time` column."""
+        import pandas as pd
+
+        records = self.read(start, end)
+        df = pd.DataFrame({name: records[name] for name in records.dtype.names})
+        df.insert(0, "time", df["timestamp"].values.view("datetime64[ms]"))
+        return df
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, len={self._count})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+class _MarketState:
+    """The polling schedule and deduplication state of one market."""
+
+    __slots__ = ("market", "log", "interval", "rate", "last_poll", "last", "seen")
+
+    def __init__(self, market: MarketID, log: TickLog, interval: float):
+        self.market = market
+        self.log = log
+        self.interval = interval
+        self.rate: Optional[float] = None  # Trades per second, smoothed.
+        self.last_poll: Optional[float] = None
+        self.last: Tuple[int, int] = (-1, -1)
+        # Sequential ids already recorded at the timestamp of the last tick.
+        self.seen: Set[int] = set()
+        if len(log):
+            tail = log.last(64)
+            self.last = (int(tail["timestamp"][-1]), int(tail["sequential_id"][-1]))
+            self.seen = set(
+                tail["sequential_id"][tail["timestamp"] == self.last[0]].tolist()
+            )
+
+
+class TradeRecorder:
+    """
+    Records the trade tape of one or many markets by polling `get_trades`.
+    Every poll overlaps the previous one; ticks are deduplicated on (timestamp, sequential_id) and appended to a
+    `TickLog` per market. Each market is polled again once about `fill` of a response worth of trades is expected,
+    based on its smoothed trade rate, so busy markets are polled often and quiet ones back off to `max_interval`.
+    When a full response holds no tick that was already recorded, some ticks may have been missed: the market is
+    counted in `gaps` and polled at `min_interval` until it catches up.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: Union[str, os.PathLike],
+        markets: Iterable[MarketID],
+        count: int = 200,
+        min_interval: float = 0.5,
+        max_interval: float = 60.0,
+        fill: float = 0.5,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            client (BithumbClient): The client used to poll `get_trades`.
+            path (Union[str, os.PathLike]): The directory of the logs, one `<market>.ticks` file per market.
+            markets (Iterable[MarketID]): The markets to record.
+            count (int): The number of ticks requested per poll. Defaults to 200.
+            min_interval (float): The shortest time between two polls of a market in seconds. Defaults to 0.5.
+            max_interval (float): The longest time between two polls of a market in seconds. Defaults to 60.
+            fill (float): The share of `count` expected to be new at the next poll. Defaults to 0.5.
+            smoothing (float): The weight of the latest poll in the smoothed trade rate. Defaults to 0.3.
+        """
+        if not 0 < fill <= 1:
+            raise ValueError(f"fill must be in (0, 1], not {fill}")
+        self._client = client
+        self.path = Path(path)
+        self.count = count
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.fill = fill
+        self.smoothing = smoothing
+        self.gaps: Dict[MarketID, int] = {}
+        self._markets: Dict[MarketID, _MarketState] = {
+            market: _MarketState(
+                market, TickLog(self.path / f"{market}.ticks"), min_interval
+            )
+            for market in markets
+        }
+        self._stop = threading.Event()
+
+    def log(self, market: MarketID) -> TickLog:
+        """Returns the tick log of a market."""
+        return self._markets[market].log
+
+    def interval(self, market: MarketID) -> float:
+        """Returns the current time between two polls of a market in seconds."""
+        return self._markets[market].interval
+
+    def poll(self, market: MarketID) -> int:
+        """
+        Polls a market once, records its new ticks and schedules its next poll.
+
+        Args:
+            market (MarketID): The market to poll.
+
+        Returns:
+            int: The number of new ticks.
+        """
+        state = self._markets[market]
+        now = monotonic()
+        ticks = sorted(
+            _tick(t) for t in self._client.get_trades(market, count=self.count)
+        )
+
+        new_ticks = self._deduplicate(state, ticks)
+        state.log.append(new_ticks)
+        # A full response of new ticks does not reach back to the last recorded tick, so some may be missing.
+        gap = state.last[0] >= 0 and len(new_ticks) == len(ticks) >= self.count
+        if gap:
+            self.gaps[market] = self.gaps.get(market, 0) + 1
+        self._schedule(state, now, len(new_ticks), gap)
+        if new_ticks:
+            last_timestamp = new_ticks[-1][0]
+            if last_timestamp != state.last[0]:
+                state.seen = set()
+            state.seen.update(t[1] for t in new_ticks if t[0] == last_timestamp)
+            state.last = new_ticks[-1][:2]
+        return len(new_ticks)
+
+    @staticmethod
+    def _deduplicate(state: _MarketState, ticks: List[Tick]) -> List[Tick]:
+        last_timestamp = state.last[0]
+        return [
+            t
+            for t in ticks
+            if t[0] > last_timestamp
+            or (t[0] == last_timestamp and t[1] not in state.seen)
+        ]
+
+    def _schedule(
+        self, state: _MarketState, now: float, new_ticks: int, gap: bool
+    ) -> None:
+        if state.last_poll is not None:
+            rate = new_ticks / max(now - state.last_poll, 1e-3)
+            state.rate = (
+                rate
+                if state.rate is None
+                else self.smoothing * rate + (1 - self.smoothing) * state.rate
+            )
+        state.last_poll = now
+
+        if gap:
+            interval = self.min_interval
+        elif not state.rate:
+            # No trades seen yet, back off gradually.
+            interval = state.interval * 2
+        else:
+            interval = self.fill * self.count / state.rate
+            # Avoid jumping from a busy burst straight to the longest interval.
+            interval = min(interval, state.interval * 2)
+        state.interval = min(self.max_interval, max(self.min_interval, interval))
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Polls every market when it is due until `stop()` is called or `duration` seconds have passed.
+        Errors of a poll are not caught.
+
+        Args:
+            duration (float, optional): How long to record for in seconds. Defaults to until stopped.
+        """
+        self._stop.clear()
+        deadline = None if duration is None else monotonic() + duration
+        now = monotonic()
+        due = [(now, str(market), market) for market in self._markets]
+        heapq.heapify(due)
+        while due:
+            at, key, market = due[0]
+            if deadline is not None and at >= deadline:
+                wait = deadline - monotonic()
+                if wait > 0:
+                    self._stop.wait(wait)
+                return
+            if self._stop.wait(max(0.0, at - monotonic())):
+                return
+            self.poll(market)
+            heapq.heapreplace(
+                due, (monotonic() + self._markets[market].interval, key, market)
+            )
+
+    def stop(self) -> None:
+        """Stops `run()` from another thread."""
+        self._stop.set()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(path={str(self.path)!r}, "
+            f"markets={list(self._markets)!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
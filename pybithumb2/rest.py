@@ -1,31 +1,373 @@
-import jwt
-import uuid
-import time
-import hashlib
+import json
+import socket
+import threading
 
 from abc import ABC
-from typing import List, Optional, Union
-from requests import Session, HTTPError
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, List, Optional, Tuple, Union, TYPE_CHECKING
+from requests import Response, Session, HTTPError, RequestException
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from pybithumb2.types import HTTPResult
-from pybithumb2.exceptions import APIError
+from pybithumb2.exceptions import APIError, RateLimitError
+from pybithumb2.ratelimit import RateLimiter
+from pybithumb2.cache import ResponseCache, SingleFlight, _copy
+from pybithumb2.auth import JWTSigner
+from pybithumb2.metrics import ClientMetrics, RequestEvent
 
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Seconds the current thread spent opening connections during its last request.
+_connect_time = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.value = (
+                getattr(_connect_time, "value", 0.0) + perf_counter() - start
+            )
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.value = (
+                getattr(_connect_time, "value", 0.0) + perf_counter() - start
+            )
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+def _retries(response: Response) -> int:
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+
+def _trace_config() -> "aiohttp.TraceConfig":
+    """Builds the aiohttp tracing hooks that time name resolution and connection setup of a request."""
+    import aiohttp
+
+    def span(name: str):
+        async def start(session, context, params) -> None:
+            timings = context.trace_request_ctx
+            if timings is not None:
+                timings[name] = timings.get(name, 0.0) - perf_counter()
+
+        async def end(session, context, params) -> None:
+            timings = context.trace_request_ctx
+            if timings is not None:
+                timings[name] += perf_counter()
+
+        return start, end
+
+    config = aiohttp.TraceConfig()
+    dns_start, dns_end = span("dns")
+    config.on_dns_resolvehost_start.append(dns_start)
+    config.on_dns_resolvehost_end.append(dns_end)
+    # Includes the name resolution, which is subtracted afterwards.
+    connect_start, connect_end = span("connect")
+    config.on_connection_create_start.append(connect_start)
+    config.on_connection_create_end.append(connect_end)
+    return config
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keep-alive probes on pooled connections, and optionally times new connections."""
+
+    def __init__(
+        self,
+        keep_alive_timeout: Optional[float] = None,
+        time_connections: bool = False,
+        **kwargs,
+    ):
+        self._keep_alive_timeout = keep_alive_timeout
+        self._time_connections = time_connections
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._keep_alive_timeout is not None:
+            idle = max(1, int(self._keep_alive_timeout))
+            socket_options = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+            # Not every platform exposes the tuning knobs (e.g. TCP_KEEPIDLE is missing on macOS).
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+            kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+        if self._time_connections:
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": _TimedHTTPConnectionPool,
+                "https": _TimedHTTPSConnectionPool,
+            }
+
+
+class BaseRESTClient(ABC):
+    """Transport independent state and helpers shared by the sync and async REST clients."""
 
-class RESTClient(ABC):
     def __init__(
         self,
         base_url: str,
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         use_raw_data: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_timeout: Optional[float] = 15.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        lazy: bool = False,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[ClientMetrics] = None,
+        coalesce: bool = False,
     ):
+        """
+        Args:
+            base_url (str): The API base url.
+            api_key (str, optional): The API key for the client.
+            secret_key (str, optional): The secret key for the client.
+            use_raw_data (bool): Whether the API response is returned as raw data or in pydantic models.
+            pool_connections (int): The number of per-host connection pools to keep. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept open per host. Defaults to 10.
+            pool_block (bool): Whether to wait for a free pooled connection instead of opening (and later discarding)
+                an extra one when the pool is exhausted. Only used by the sync client, aiohttp always waits.
+                Defaults to False.
+            keep_alive (bool): Whether connections are reused between requests. Defaults to True.
+            keep_alive_timeout (float, optional): Seconds an idle pooled connection is kept alive. The async client
+                closes idle connections after this long, the sync client sends TCP keep-alive probes after this much
+                idle time so that pooled connections are not silently dropped. Defaults to 15 seconds.
+            connect_timeout (float, optional): Seconds to wait for a connection to be established. Defaults to None.
+            read_timeout (float, optional): Seconds to wait between bytes received from the server. Defaults to None.
+            rate_limiter (RateLimiter, optional): Throttles requests per endpoint group before they are sent.
+                Defaults to None (no client side limit).
+            lazy (bool): Whether list responses are returned as lazy views that convert a field on first access
+                instead of fully validated models. Defaults to False.
+            cache (ResponseCache, optional): Caches the responses of rarely changing endpoints. Defaults to None.
+            metrics (ClientMetrics, optional): Records the latency, stages and sizes of every request and the time
+                spent parsing responses. Defaults to None.
+            coalesce (bool): Whether concurrent identical public GET requests share one request and its decoded
+                response. Defaults to False.
+        """
         self._base_url = base_url
         self._api_key = api_key
         self._secret_key = secret_key
         self._has_credentials = bool(self._api_key and self._secret_key)
+        self._signer = (
+            JWTSigner(self._api_key, self._secret_key)
+            if self._has_credentials
+            else None
+        )
         self._use_raw_data = use_raw_data
-        self._session: Session = Session()
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._keep_alive_timeout = keep_alive_timeout
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._rate_limiter = rate_limiter
+        self._lazy = lazy
+        self._cache = cache
+        self._metrics = metrics
+        self._flight = SingleFlight() if coalesce else None
+
+    def _coalesce_key(
+        self,
+        method: str,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, str]],
+        doseq: bool,
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Returns the key under which a request is shared with identical ones, or None if it is not shared."""
+        if self._flight is None or is_private or method.upper() != "GET":
+            return None
+        if data is None or isinstance(data, str):
+            return path, data
+        return path, urlencode(data, doseq)
+
+    def _decode_one(self, model: type, response: dict) -> Any:
+        """
+        Converts an object response into a model, timing it when the client has metrics.
+
+        Args:
+            model (type): The FormattableBaseModel subclass of the response.
+            response (dict): The decoded JSON response.
+
+        Returns:
+            FormattableBaseModel
+        """
+        if self._metrics is None:
+            return model.model_validate(response)
+
+        start = perf_counter()
+        result = model.model_validate(response)
+        self._metrics.observe_parse(model.__name__, perf_counter() - start)
+        return result
+
+    def _decode_many(self, model: type, response: List[dict]) -> list:
+        """
+        Converts the rows of a list response into models, or into lazy views of them when the client is lazy.
+
+        Args:
+            model (type): The FormattableBaseModel subclass of the rows.
+            response (List[dict]): The decoded JSON response.
+
+        Returns:
+            list
+        """
+        if self._metrics is None:
+            return (
+                model.lazy_many(response)
+                if self._lazy
+                else model.model_validate_many(response)
+            )
+
+        start = perf_counter()
+        result = (
+            model.lazy_many(response)
+            if self._lazy
+            else model.model_validate_many(response)
+        )
+        self._metrics.observe_parse(
+            model.__name__, perf_counter() - start, len(response)
+        )
+        return result
+
+    def _prepare_request(
+        self,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, str]] = None,
+        doseq: bool = False,
+    ) -> Tuple[str, Optional[str], dict]:
+        """
+        Builds the url, the urlencoded query and the headers of a request.
+
+        Args:
+            path (str): The API endpoint path
+            is_private (bool): Whether the request should use authentication headers.
+            data (Union[dict, str], optional): The request payload. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            Tuple[str, Optional[str], dict]: The url, the query string and the headers.
+        """
+        if is_private and not self._has_credentials:
+            raise APIError("invalid_jwt")
+
+        url: str = self._base_url + path
+        query = urlencode(data, doseq) if data is not None else None
+
+        headers = self._generate_headers(is_private, query)
+
+        return url, query, headers
+
+    def _generate_headers(self, is_private: bool, query: Optional[str]) -> dict:
+        """
+        Generates the appropriate HTTP headers for the API request.
+
+        Args:
+            is_private (bool): Whether the request requires authentication.
+            query (str, optional): The query string (the part after '?') used in the request. Required to generate
+                query hash for authenticated private requests.
+
+        Returns:
+            dict: A dictionary containing HTTP headers, including Authorization if private.
+        """
+        if not is_private:
+            return {"accept": "application/json"}
+        jwt_token = self._signer.token(query)
+        authorization_token = f"Bearer {jwt_token}"
+
+        return {"Authorization": authorization_token}
+
+
+class RESTClient(BaseRESTClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session: Session = self._create_session()
+
+    def _create_session(self) -> Session:
+        """Creates a session whose connection pool is configured from the client options."""
+        session = Session()
+        adapter = _KeepAliveAdapter(
+            keep_alive_timeout=self._keep_alive_timeout if self._keep_alive else None,
+            time_connections=self._metrics is not None,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def _timeout(self) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        if self._connect_timeout is None and self._read_timeout is None:
+            return None
+        return (self._connect_timeout, self._read_timeout)
+
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """
+        Opens pooled connections (including the TLS handshake) ahead of the first real request, by sending
+        concurrent HEAD requests to the API host.
+
+        Args:
+            connections (int, optional): The number of connections to open. Defaults to `pool_maxsize`.
+
+        Returns:
+            int: The number of warm-up requests that succeeded. They run concurrently, so each one normally opens its
+                own connection, but this counts requests rather than connections.
+        """
+        connections = min(connections or self._pool_maxsize, self._pool_maxsize)
+
+        def touch(_) -> bool:
+            try:
+                self._session.head(
+                    self._base_url, allow_redirects=False, timeout=self._timeout
+                )
+                return True
+            except RequestException:
+                return False
+
+        # Concurrent requests each check out their own connection, so the pool fills up to `connections`.
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(touch, range(connections)))
+
+    def close(self) -> None:
+        """Closes the underlying connection pool."""
+        self._session.close()
 
     def _request(
         self,
@@ -37,6 +379,7 @@ class RESTClient(ABC):
     ) -> HTTPResult:
         """
         Prepares and submits HTTP requests to given API endpoint and returns response.
+        When the client coalesces requests, an identical public GET that is already in flight is waited for instead.
 
         Args:
             method (str): The API endpoint HTTP method
@@ -49,17 +392,35 @@ class RESTClient(ABC):
         Returns:
             HTTPResult: The response from the API
         """
-        if is_private and not self._has_credentials:
-            raise APIError("invalid_jwt")
-
-        url: str = self._base_url + path
-        query = urlencode(data, doseq) if data is not None else None
+        key = self._coalesce_key(method, path, is_private, data, doseq)
+        if key is None:
+            return self._send(method, path, is_private, data, doseq)
+        result, shared = self._flight.do(
+            key, lambda: self._send(method, path, is_private, data, doseq)
+        )
+        return _copy(result) if shared else result
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, str]] = None,
+        doseq: bool = False,
+    ) -> HTTPResult:
+        """Submits one HTTP request. See `_request`."""
+        metrics = self._metrics
+        started = perf_counter()
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(RateLimiter.group_of(method, path, is_private))
+        throttled = perf_counter()
 
-        headers = self._generate_headers(is_private, query)
+        url, query, headers = self._prepare_request(path, is_private, data, doseq)
 
         opts = {
             "headers": headers,
             "allow_redirects": False,
+            "timeout": self._timeout,
         }
 
         if method.upper() in ["GET", "DELETE"]:
@@ -72,54 +433,69 @@ class RESTClient(ABC):
         # else:
         #     print(url)
 
-        response = self._session.request(method, url, **opts)
-
+        _connect_time.value = 0.0
         try:
-            response.raise_for_status()
-        except HTTPError as http_error:
-            error = response.text
-            raise APIError(error, http_error)
-
-        if response.text != "":
-            obj = response.json()
-            if "error" in obj:
-                """Sometimes the response is an error but with a success status code."""
-                raise APIError(obj["error"])
-            return obj
-        else:
-            raise APIError("Response is empty")
-
-    def _generate_headers(self, is_private: bool, query: Optional[str]) -> dict:
-        """
-        Generates the appropriate HTTP headers for the API request.
+            response = self._session.request(method, url, **opts)
+        except RequestException as error:
+            if metrics is not None:
+                metrics.observe_request(
+                    RequestEvent(
+                        method,
+                        path,
+                        0,
+                        perf_counter() - started,
+                        throttle=throttled - started,
+                        connect=_connect_time.value,
+                        error=type(error).__name__,
+                    )
+                )
+            raise
+        received = perf_counter()
+
+        event = None
+        if metrics is not None:
+            connect = _connect_time.value
+            # Measured by requests from sending the request until the headers are parsed.
+            headers_received = response.elapsed.total_seconds()
+            event = RequestEvent(
+                method,
+                path,
+                response.status_code,
+                0.0,
+                throttle=throttled - started,
+                connect=connect,
+                server=max(0.0, headers_received - connect),
+                read=max(0.0, received - throttled - headers_received),
+                # The query is only sent, in the url, by GET and DELETE. Other methods send a JSON body.
+                bytes_out=(
+                    len(query or "")
+                    if method.upper() in ["GET", "DELETE"]
+                    else len(response.request.body or b"")
+                ),
+                bytes_in=len(response.content),
+                retries=_retries(response),
+            )
 
-        Args:
-            is_private (bool): Whether the request requires authentication.
-            query (str, optional): The query string (the part after '?') used in the request. Required to generate
-                query hash for authenticated private requests.
-
-        Returns:
-            dict: A dictionary containing HTTP headers, including Authorization if private.
-        """
-        if not is_private:
-            return {"accept": "application/json"}
-        # Generate access token
-        payload = {
-            "access_key": self._api_key,
-            "nonce": str(uuid.uuid4()),
-            "timestamp": round(time.time() * 1000),
-        }
-        if query:
-            hash = hashlib.sha512()
-            hash.update(query.encode())
-            query_hash = hash.hexdigest()
-            payload["query_hash"] = query_hash
-            payload["query_hash_alg"] = "SHA512"
-
-        jwt_token = jwt.encode(payload, self._secret_key)
-        authorization_token = f"Bearer {jwt_token}"
-
-        return {"Authorization": authorization_token}
+        try:
+            try:
+                response.raise_for_status()
+            except HTTPError as http_error:
+                error = response.text
+                if response.status_code == 429:
+                    raise RateLimitError(error, http_error)
+                raise APIError(error, http_error)
+
+            return _decode_content(response.content)
+        except Exception as error:
+            if event is not None:
+                event.error = type(error).__name__
+            raise
+        finally:
+            if event is not None:
+                finished = perf_counter()
+                event.decode = finished - received
+                event.total = finished - started
+                metrics.observe_request(event)
 
     def get(
         self,
@@ -225,3 +601,324 @@ class RESTClient(ABC):
             dict: The response
         """
         return self._request("DELETE", path, is_private, data, doseq)
+
+
+class AsyncRESTClient(BaseRESTClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Returns the shared aiohttp session, creating it on first use.
+        The session has to be created inside a running event loop, so it can not be built in `__init__`.
+        """
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError(
+                    "aiohttp is required for the async client. Install it with `pip install pybithumb2[async]`."
+                )
+
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_connections * self._pool_maxsize,
+                limit_per_host=self._pool_maxsize,
+                force_close=not self._keep_alive,
+                keepalive_timeout=(
+                    self._keep_alive_timeout if self._keep_alive else None
+                ),
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self._connect_timeout, sock_read=self._read_timeout
+            )
+            trace_configs = [_trace_config()] if self._metrics is not None else None
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, trace_configs=trace_configs
+            )
+        return self._session
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """
+        Opens pooled connections (including the TLS handshake) ahead of the first real request, by sending
+        concurrent HEAD requests to the API host.
+
+        Args:
+            connections (int, optional): The number of connections to open. Defaults to `pool_maxsize`.
+
+        Returns:
+            int: The number of warm-up requests that succeeded. They run concurrently, so each one normally opens its
+                own connection, but this counts requests rather than connections.
+        """
+        import asyncio
+        from aiohttp import ClientError
+
+        connections = min(connections or self._pool_maxsize, self._pool_maxsize)
+        session = self._get_session()
+
+        async def touch() -> bool:
+            try:
+                async with session.head(self._base_url, allow_redirects=False):
+                    return True
+            except (ClientError, asyncio.TimeoutError):
+                return False
+
+        results = await asyncio.gather(*(touch() for _ in range(connections)))
+        return sum(results)
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, str]] = None,
+        doseq: bool = False,
+    ) -> HTTPResult:
+        """
+        Prepares and submits HTTP requests to given API endpoint and returns response.
+        When the client coalesces requests, an identical public GET that is already in flight is awaited instead.
+
+        Args:
+            method (str): The API endpoint HTTP method
+            is_private (bool): Whether the request should use authentication headers.
+            path (str): The API endpoint path
+            data (Union[dict, str], optional): Either the payload in json format, query params urlencoded, or a dict
+             of values to be converted to appropriate format based on `method`. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            HTTPResult: The response from the API
+        """
+        key = self._coalesce_key(method, path, is_private, data, doseq)
+        if key is None:
+            return await self._send(method, path, is_private, data, doseq)
+        result, shared = await self._flight.do_async(
+            key, lambda: self._send(method, path, is_private, data, doseq)
+        )
+        return _copy(result) if shared else result
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, str]] = None,
+        doseq: bool = False,
+    ) -> HTTPResult:
+        """Submits one HTTP request. See `_request`."""
+        from yarl import URL
+
+        metrics = self._metrics
+        started = perf_counter()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(
+                RateLimiter.group_of(method, path, is_private)
+            )
+        throttled = perf_counter()
+
+        url, query, headers = self._prepare_request(path, is_private, data, doseq)
+
+        opts = {
+            "headers": headers,
+            "allow_redirects": False,
+        }
+
+        if method.upper() in ["GET", "DELETE"]:
+            # The query is passed pre-encoded so that it matches the signed query hash exactly.
+            if query:
+                url = f"{url}?{query}"
+        else:
+            opts["json"] = data
+
+        if metrics is None:
+            async with self._get_session().request(
+                method, URL(url, encoded=True), **opts
+            ) as response:
+                content = await response.read()
+                _raise_for_status(response, content)
+            return _decode_content(content)
+
+        timings: dict = {}
+        headers_received = received = None
+        event = RequestEvent(
+            method,
+            path,
+            0,
+            0.0,
+            throttle=throttled - started,
+            bytes_out=(len(json.dumps(data)) if "json" in opts else len(query or "")),
+        )
+        try:
+            async with self._get_session().request(
+                method, URL(url, encoded=True), trace_request_ctx=timings, **opts
+            ) as response:
+                headers_received = perf_counter()
+                event.status = response.status
+                content = await response.read()
+                received = perf_counter()
+                event.bytes_in = len(content)
+                _raise_for_status(response, content)
+            return _decode_content(content)
+        except Exception as error:
+            event.error = type(error).__name__
+            raise
+        finally:
+            finished = perf_counter()
+            event.dns = timings.get("dns", 0.0)
+            event.connect = max(0.0, timings.get("connect", 0.0) - event.dns)
+            if received is not None:
+                event.server = max(
+                    0.0, headers_received - throttled - event.dns - event.connect
+                )
+                event.read = received - headers_received
+                event.decode = finished - received
+            event.total = finished - started
+            metrics.observe_request(event)
+
+    async def get(
+        self,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, str]] = None,
+        doseq: bool = False,
+    ) -> HTTPResult:
+        """
+        Performs a single GET request
+
+        Args:
+            path (str): The API endpoint path
+            is_private (bool): Whether the request should use authentication headers.
+            data (Union[dict, str], optional): Query parameters to send. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("GET", path, is_private, data, doseq)
+
+    async def post(
+        self,
+        path: str,
+        is_private: bool,
+        data: Optional[Union[dict, List[dict]]] = None,
+        doseq: bool = False,
+    ) -> HTTPResult:
+        """
+        Performs a single POST request
+
+        Args:
+            path (str): The API endpoint path
+            is_private (bool): Whether the request should use authentication headers.
+            data (Union[dict, str], optional): The json payload as a dict of values to be converted. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("POST", path, is_private, data, doseq)
+
+    async def put(
+        self,
+        path: str,
+        is_private: bool,
+        data: Optional[dict] = None,
+        doseq: bool = False,
+    ) -> dict:
+        """
+        Performs a single PUT request
+
+        Args:
+            path (str): The API endpoint path
+            is_private (bool): Whether the request should use authentication headers.
+            data (Union[dict, str], optional): The json payload as a dict of values to be converted. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("PUT", path, is_private, data, doseq)
+
+    async def patch(
+        self,
+        path: str,
+        is_private: bool,
+        data: Optional[dict] = None,
+        doseq: bool = False,
+    ) -> dict:
+        """
+        Performs a single PATCH request
+
+        Args:
+            path (str): The API endpoint path
+            is_private (bool): Whether the request should use authentication headers.
+            data (Union[dict, str], optional): The json payload as a dict of values to be converted. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("PATCH", path, is_private, data, doseq)
+
+    async def delete(
+        self,
+        path,
+        is_private: bool,
+        data: Optional[Union[dict, str]] = None,
+        doseq: bool = False,
+    ) -> dict:
+        """
+        Performs a single DELETE request
+
+        Args:
+            path (str): The API endpoint path
+            is_private (bool): Whether the request should use authentication headers.
+            data (Union[dict, str], optional): Query parameters to send. Defaults to None.
+            doseq (bool): Whether list should be expanded into multiple parameters. Defaults to False.
+
+        Returns:
+            dict: The response
+        """
+        return await self._request("DELETE", path, is_private, data, doseq)
+
+
+def _raise_for_status(response: "aiohttp.ClientResponse", content: bytes) -> None:
+    from aiohttp import ClientResponseError
+
+    try:
+        response.raise_for_status()
+    except ClientResponseError as http_error:
+        text = content.decode("utf-8", "replace")
+        if http_error.status == 429:
+            raise RateLimitError(text, http_error)
+        raise APIError(text, http_error)
+
+
+def _decode_content(content: bytes) -> HTTPResult:
+    """
+    Parses a response body straight from its bytes, without decoding it to str first, and checks it for errors.
+    Uses orjson when it is installed.
+    """
+    if not content:
+        raise APIError("Response is empty")
+    try:
+        obj = _json_loads(content)
+    except ValueError:
+        # Recent orjson versions reject integers beyond 64 bits, which the standard library accepts. Invalid JSON
+        # raises again here.
+        obj = json.loads(content)
+    if isinstance(obj, dict) and "error" in obj:
+        """Sometimes the response is an error but with a success status code."""
+        raise APIError(obj["error"])
+    return obj
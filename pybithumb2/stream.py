@@ -0,0 +1,287 @@
+import json
+import uuid
+import asyncio
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pybithumb2.__env__ import STREAM_URL
+from pybithumb2.constants import CONNECTED_DATE_FORMAT, CONNECTED_TIME_FORMAT, KST
+from pybithumb2.exceptions import APIError
+from pybithumb2.models import (
+    FormattableBaseModel,
+    MarketID,
+    OrderBook,
+    Snapshot,
+    TradeInfo,
+    _bulk_decoder,
+)
+from pybithumb2.types import RawData, StreamChannel
+
+StreamMessage = Union[Snapshot, TradeInfo, OrderBook, RawData]
+
+
+def _import_websockets():
+    try:
+        import websockets
+    except ImportError:
+        raise ImportError(
+            "websockets is required for the stream. Install it with `pip install pybithumb2[stream]`."
+        )
+    return websockets
+
+
+def _ticker_payload(message: RawData) -> RawData:
+    payload = dict(message, market=message["code"])
+    # The stream only sends the UTC trade date and time.
+    if "trade_date_kst" not in payload and "trade_timestamp" in payload:
+        traded = datetime.fromtimestamp(payload["trade_timestamp"] / 1000, KST)
+        payload["trade_date_kst"] = traded.strftime(CONNECTED_DATE_FORMAT)
+        payload["trade_time_kst"] = traded.strftime(CONNECTED_TIME_FORMAT)
+    return payload
+
+
+def _trade_payload(message: RawData) -> RawData:
+    return dict(
+        message,
+        market=message["code"],
+        trade_date_utc=message["trade_date"],
+        trade_time_utc=message["trade_time"],
+        timestamp=message.get("trade_timestamp", message.get("timestamp")),
+    )
+
+
+def _orderbook_payload(message: RawData) -> RawData:
+    return dict(message, market=message["code"])
+
+
+_CHANNELS: Dict[
+    str, Tuple[type[FormattableBaseModel], Callable[[RawData], RawData]]
+] = {
+    str(StreamChannel.TICKER): (Snapshot, _ticker_payload),
+    str(StreamChannel.TRADE): (TradeInfo, _trade_payload),
+    str(StreamChannel.ORDERBOOK): (OrderBook, _orderbook_payload),
+}
+
+
+class BithumbStream:
+    """
+    Client of the public WebSocket stream.
+    Subscriptions are kept on the client, so when the connection drops it is reopened and every channel is
+    subscribed again before the next message is read. Iterate over the stream, or await `recv()`, to receive ticker,
+    trade and orderbook messages as `Snapshot`, `TradeInfo` and `OrderBook` models. Requires `websockets`.
+    """
+
+    def __init__(
+        self,
+        url: str = STREAM_URL,
+        use_raw_data: bool = False,
+        reconnect: bool = True,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        max_retries: Optional[int] = None,
+        ping_interval: Optional[float] = 20.0,
+        open_timeout: Optional[float] = 10.0,
+    ) -> None:
+        """
+        Args:
+            url (str): The stream url. Defaults to the public Bithumb stream.
+            use_raw_data (bool): Whether messages are returned as raw dicts or in pydantic models.
+            reconnect (bool): Whether the connection is reopened when it fails or drops. Defaults to True.
+            reconnect_delay (float): Seconds to wait before the first retry. Doubles with every failed attempt.
+                Defaults to 1 second.
+            max_reconnect_delay (float): The longest wait between retries in seconds. Defaults to 30 seconds.
+            max_retries (int, optional): The number of failed attempts in a row after which the error is raised.
+                A connection that closes before a message is received counts as a failed attempt.
+                Defaults to None (retry forever).
+            ping_interval (float, optional): Seconds between keep-alive pings. Defaults to 20 seconds.
+            open_timeout (float, optional): Seconds to wait for the connection to open. Defaults to 10 seconds.
+        """
+        self._url = url
+        self._use_raw_data = use_raw_data
+        self._reconnect = reconnect
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._max_retries = max_retries
+        self._ping_interval = ping_interval
+        self._open_timeout = open_timeout
+        self._subscriptions: Dict[StreamChannel, Dict[str, MarketID]] = {}
+        self._ws = None
+        self._closed = False
+        # Failed attempts in a row, reset once a message is received.
+        self._attempt = 0
+
+    @property
+    def subscriptions(self) -> Dict[StreamChannel, List[MarketID]]:
+        """The subscribed markets of each channel."""
+        return {
+            channel: list(markets.values())
+            for channel, markets in self._subscriptions.items()
+            if markets
+        }
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    async def subscribe(
+        self, channel: Union[StreamChannel, str], markets: Iterable[MarketID]
+    ) -> None:
+        """
+        Adds markets to a channel. Takes effect immediately if the stream is connected.
+
+        Args:
+            channel (Union[StreamChannel, str]): The channel to subscribe to.
+            markets (Iterable[MarketID]): The markets to add.
+        """
+        subscribed = self._subscriptions.setdefault(StreamChannel(channel), {})
+        for market in markets:
+            subscribed[str(market)] = market
+        if self._ws is not None:
+            await self._ws.send(self._subscription_message())
+
+    async def unsubscribe(
+        self,
+        channel: Union[StreamChannel, str],
+        markets: Optional[Iterable[MarketID]] = None,
+    ) -> None:
+        """
+        Removes markets from a channel. Takes effect immediately if the stream is connected.
+        Removing the last subscription closes the connection and ends iteration over the stream.
+
+        Args:
+            channel (Union[StreamChannel, str]): The channel to unsubscribe from.
+            markets (Iterable[MarketID], optional): The markets to remove. Defaults to every market of the channel.
+        """
+        subscribed = self._subscriptions.get(StreamChannel(channel), {})
+        if markets is None:
+            subscribed.clear()
+        for market in markets or ():
+            subscribed.pop(str(market), None)
+
+        if self._ws is None:
+            return
+        if self.subscriptions:
+            await self._ws.send(self._subscription_message())
+        else:
+            # A subscription request replaces the previous one, but an empty request is rejected.
+            ws, self._ws = self._ws, None
+            await ws.close()
+
+    def _subscription_message(self) -> str:
+        request: List[dict] = [{"ticket": str(uuid.uuid4())}]
+        for channel, markets in self.subscriptions.items():
+            request.append({"type": str(channel), "codes": [str(m) for m in markets]})
+        request.append({"format": "DEFAULT"})
+        return json.dumps(request)
+
+    def _retry_delay(self, attempt: int) -> float:
+        return min(
+            self._reconnect_delay * 2 ** (attempt - 1), self._max_reconnect_delay
+        )
+
+    async def _wait_to_retry(self) -> bool:
+        """Counts a failed attempt and waits before the next one, or returns False if no retries are left."""
+        self._attempt += 1
+        if not self._reconnect or (
+            self._max_retries is not None and self._attempt > self._max_retries
+        ):
+            return False
+        await asyncio.sleep(self._retry_delay(self._attempt))
+        return True
+
+    async def connect(self) -> None:
+        """
+        Opens the connection and sends the subscriptions, retrying according to the reconnect settings.
+        Called automatically by `recv()`.
+        """
+        websockets = _import_websockets()
+
+        self._closed = False
+        while True:
+            try:
+                ws = await websockets.connect(
+                    self._url,
+                    ping_interval=self._ping_interval,
+                    open_timeout=self._open_timeout,
+                    max_size=None,
+                )
+                if self.subscriptions:
+                    await ws.send(self._subscription_message())
+                self._ws = ws
+                return
+            except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+                if not await self._wait_to_retry():
+                    raise
+
+    async def close(self) -> None:
+        """Closes the connection. Iteration over the stream stops."""
+        self._closed = True
+        self._attempt = 0
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+
+    async def recv(self) -> StreamMessage:
+        """
+        Returns the next ticker, trade or orderbook message, connecting or reconnecting first if needed.
+        Raises `APIError` once the stream is closed or every subscription has been removed.
+
+        Returns:
+            Union[Snapshot, TradeInfo, OrderBook, RawData]
+        """
+        message = await self._recv()
+        if message is None:
+            raise APIError("The stream is closed or has no subscriptions")
+        return message
+
+    async def _recv(self) -> Optional[StreamMessage]:
+        ConnectionClosed = _import_websockets().ConnectionClosed
+
+        while not self._closed:
+            if self._ws is None:
+                if not self.subscriptions:
+                    # Unsubscribed from everything, reconnecting would wait forever.
+                    break
+                await self.connect()
+            ws = self._ws
+            try:
+                frame = await ws.recv()
+            except ConnectionClosed:
+                if self._ws is ws:
+                    self._ws = None
+                if self._closed or not self.subscriptions:
+                    break
+                if not await self._wait_to_retry():
+                    raise
+                continue
+
+            self._attempt = 0
+            message = json.loads(frame)
+            if "error" in message:
+                raise APIError(json.dumps(message["error"]))
+            channel = _CHANNELS.get(message.get("type"))
+            if channel is None:
+                # Status messages such as {"status": "UP"}
+                continue
+            if self._use_raw_data:
+                return message
+            model, to_payload = channel
+            return _bulk_decoder(model).decode(to_payload(message))
+        return None
+
+    def __aiter__(self) -> "BithumbStream":
+        return self
+
+    async def __anext__(self) -> StreamMessage:
+        message = await self._recv()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+    async def __aenter__(self) -> "BithumbStream":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -1,7 +1,11 @@
+import weakref
+
 from enum import Enum
 from dataclasses import dataclass
 from typing import Any, Dict, List, Union
 
+from pydantic_core import core_schema
+
 RawData = Dict[str, Any]
 
 HTTPResult = Union[dict, List[dict], Any]
@@ -15,12 +19,86 @@ class FormattableEnum(Enum):
         return self.value
 
 
-@dataclass(frozen=True)
-class Currency:
-    code: str
+class _Interned:
+    """
+    Base of immutable identifiers that are interned: constructing one that already exists returns the existing
+    instance, so equal identifiers are usually the same object and compare and hash in O(1).
+    """
 
-    def __post_init__(self):
-        object.__setattr__(self, "code", self.code.upper())
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def _validate(cls, value: Any):
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls(value)
+        if isinstance(value, dict):
+            return cls(**value)
+        raise ValueError(f"Can not convert {value!r} to {cls.__name__}")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any):
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize
+            ),
+        )
+
+    def _serialize(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class Currency(_Interned):
+    __slots__ = ("code", "_hash")
+    _fields = ("code",)
+    _interned: Dict[str, "Currency"] = {}
+
+    def __new__(cls, code: Union[str, "Currency"]) -> "Currency":
+        currency = cls._interned.get(code)
+        if currency is not None:
+            return currency
+        if isinstance(code, Currency):
+            return code
+
+        upper = code.upper()
+        currency = cls._interned.get(upper)
+        if currency is None:
+            currency = object.__new__(cls)
+            object.__setattr__(currency, "code", upper)
+            object.__setattr__(currency, "_hash", hash(upper))
+            currency = cls._interned.setdefault(upper, currency)
+        cls._interned[code] = currency
+        return currency
+
+    def __reduce__(self):
+        return Currency, (self.code,)
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Currency):
+            return self.code == other.code
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Currency(code={self.code!r})"
 
     def __str__(self) -> str:
         return self.code
@@ -102,9 +180,40 @@ class BlockState(FormattableEnum):
     INACTIVE = "inactive"
 
 
-@dataclass(frozen=True)
-class OrderID:
-    id: str
+class OrderID(_Interned):
+    # Orders come and go, so instances are only interned while they are referenced.
+    __slots__ = ("id", "_hash", "__weakref__")
+    _fields = ("id",)
+    _interned: "weakref.WeakValueDictionary[str, OrderID]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __new__(cls, id: Union[str, "OrderID"]) -> "OrderID":
+        if isinstance(id, OrderID):
+            return id
+        order_id = cls._interned.get(id)
+        if order_id is None:
+            order_id = object.__new__(cls)
+            object.__setattr__(order_id, "id", id)
+            object.__setattr__(order_id, "_hash", hash(id))
+            order_id = cls._interned.setdefault(id, order_id)
+        return order_id
+
+    def __reduce__(self):
+        return OrderID, (self.id,)
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, OrderID):
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"OrderID(id={self.id!r})"
 
     def __str__(self) -> str:
         return self.id
@@ -113,3 +222,19 @@ class OrderID:
 class OrderBy(FormattableEnum):
     ASC = "asc"
     DESC = "desc"
+
+
+class CandlePeriod(FormattableEnum):
+    """Candle intervals longer than the minute candles selected by `TimeUnit`."""
+
+    DAY = "days"
+    WEEK = "weeks"
+    MONTH = "months"
+
+
+class StreamChannel(FormattableEnum):
+    """Channels of the public WebSocket stream."""
+
+    TICKER = "ticker"
+    TRADE = "trade"
+    ORDERBOOK = "orderbook"
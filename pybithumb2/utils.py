@@ -1,10 +1,13 @@
-from typing import Any
-from datetime import datetime, time
-from dateutil import parser
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from datetime import date, datetime, time
+from dateutil import parser, tz
 from decimal import Decimal
 
 from pybithumb2.constants import (
+    DATE_FORMAT,
+    CONNECTED_DATE_FORMAT,
     TIME_FORMAT,
+    CONNECTED_TIME_FORMAT,
     DATETIME_FORMAT,
     DATETIME_FORMAT_T,
     DATETIME_FORMAT_TZ,
@@ -44,8 +47,89 @@ def clean_and_format_data(data: dict) -> dict:
     return map_values(data)
 
 
-def parse_datetime(datetime_str: str) -> datetime:
-    """Handles datetime fields inconsistencies across endpoints"""
+def _datetime_at(value: str, separator: str) -> Optional[datetime]:
+    """Parses `YYYY-mm-dd<separator>HH:MM:SS` by position, or returns None if `value` has another layout."""
+    if (
+        value[4] != "-"
+        or value[7] != "-"
+        or value[10] != separator
+        or value[13] != ":"
+        or value[16] != ":"
+        or value[11:13] == "24"
+    ):
+        return None
+    try:
+        # With the layout fixed, fromisoformat accepts exactly what strptime accepts, in C.
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _fast_datetime(value: str) -> Optional[datetime]:
+    if len(value) == 19:
+        return _datetime_at(value, " ") or _datetime_at(value, "T")
+    return None
+
+
+def _fast_datetime_z(value: str) -> Optional[datetime]:
+    if len(value) == 20 and value[19] == "Z":
+        return _datetime_at(value[:19], "T")
+    return None
+
+
+def _fast_datetime_offset(value: str) -> Optional[datetime]:
+    """Parses `YYYY-mm-ddTHH:MM:SS+HH:MM` the way dateutil does (a cached `tzoffset`)."""
+    if len(value) != 25 or value[19] not in "+-" or value[22] != ":":
+        return None
+    offset = value[20:22] + value[23:25]
+    if not (offset.isascii() and offset.isdigit()):
+        return None
+    seconds = int(value[20:22]) * 3600 + int(value[23:25]) * 60
+    if seconds == 0 or value[10] not in " T":
+        # dateutil maps a zero offset to the local zone, which the slow path reproduces.
+        return None
+    parsed = _datetime_at(value[:19], value[10])
+    if parsed is None:
+        return None
+    return parsed.replace(
+        tzinfo=tz.tzoffset(None, seconds if value[19] == "+" else -seconds)
+    )
+
+
+_DATETIME_PARSERS: List[Callable[[str], Optional[datetime]]] = [
+    _fast_datetime,
+    _fast_datetime_z,
+    _fast_datetime_offset,
+]
+
+_learned_datetime_parsers: Dict[Hashable, int] = {}
+
+
+def parse_datetime(datetime_str: str, field: Optional[Hashable] = None) -> datetime:
+    """
+    Handles datetime fields inconsistencies across endpoints.
+    The layouts used by the API are parsed by position. The layout that matched is remembered per `field`, so each
+    field only tries the layout it actually uses. Values in any other layout go through strptime and dateutil.
+    """
+    learned = _learned_datetime_parsers.get(field)
+    if learned is not None:
+        result = _DATETIME_PARSERS[learned](datetime_str)
+        if result is not None:
+            return result
+
+    for index, fast_parser in enumerate(_DATETIME_PARSERS):
+        if index == learned:
+            continue
+        result = fast_parser(datetime_str)
+        if result is not None:
+            if field is not None:
+                _learned_datetime_parsers[field] = index
+            return result
+
+    return _parse_datetime(datetime_str)
+
+
+def _parse_datetime(datetime_str: str) -> datetime:
     formats = [DATETIME_FORMAT, DATETIME_FORMAT_T, DATETIME_FORMAT_TZ]
 
     for fmt in formats:
@@ -61,3 +145,59 @@ def parse_datetime(datetime_str: str) -> datetime:
         pass
 
     raise ValueError(f"Invalid datetime format: {datetime_str}")
+
+
+def parse_date(date_str: str, fmt: str = DATE_FORMAT) -> date:
+    """Same as `datetime.strptime(date_str, fmt).date()`, parsing the API date layouts by position."""
+    if fmt == DATE_FORMAT:
+        if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
+    elif fmt == CONNECTED_DATE_FORMAT:
+        if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+            try:
+                return date(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
+            except ValueError:
+                pass
+    return datetime.strptime(date_str, fmt).date()
+
+
+def parse_time(time_str: str, fmt: str = TIME_FORMAT) -> time:
+    """Same as `datetime.strptime(time_str, fmt).time()`, parsing the API time layouts by position."""
+    if fmt == TIME_FORMAT:
+        if (
+            len(time_str) == 8
+            and time_str[2] == ":"
+            and time_str[5] == ":"
+            and time_str[0:2] != "24"
+        ):
+            try:
+                return time.fromisoformat(time_str)
+            except ValueError:
+                pass
+    elif fmt == CONNECTED_TIME_FORMAT:
+        if len(time_str) == 6 and time_str.isascii() and time_str.isdigit():
+            try:
+                return time(int(time_str[0:2]), int(time_str[2:4]), int(time_str[4:6]))
+            except ValueError:
+                pass
+    return datetime.strptime(time_str, fmt).time()
+
+
+def to_kst(value: datetime) -> datetime:
+    """Converts a datetime to a naive KST datetime. Naive datetimes are assumed to already be in KST."""
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        return value
+    return value.astimezone(KST).replace(tzinfo=None)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shifts a datetime by a number of calendar months, clamping the day to the length of the target month."""
+    import calendar
+
+    month_index = value.year * 12 + value.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(value.day, calendar.monthrange(year, month + 1)[1])
+    return value.replace(year=year, month=month + 1, day=day)
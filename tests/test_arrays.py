@@ -0,0 +1,123 @@
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pybithumb2.arrays import CandleArray
+from pybithumb2.models import MarketID, MinuteCandle
+
+
+def candle(minute: int, market: str = "KRW-BTC") -> dict:
+    return {
+        "market": market,
+        "candle_date_time_utc": f"2024-12-31T15:{minute:02d}:00",
+        "candle_date_time_kst": f"2025-01-01T00:{minute:02d}:00",
+        "opening_price": 140000000.0 + minute,
+        "high_price": 140100000,
+        "low_price": 139900000.5,
+        "trade_price": 140050000,
+        "timestamp": 1735689600000 + minute * 60000,
+        "candle_acc_trade_price": 1234567.89123456,
+        "candle_acc_trade_volume": 0.01234567,
+        "unit": 1,
+    }
+
+
+# The API returns the newest candle first.
+PAYLOAD = [candle(minute) for minute in reversed(range(10))]
+
+
+def test_from_raw():
+    array = CandleArray.from_raw(PAYLOAD)
+
+    assert array.market == MarketID.from_string("KRW-BTC")
+    assert len(array) == 10
+    assert array.time.dtype == np.int64 and array.open.dtype == np.float64
+    assert (np.diff(array.time) == 60000).all()
+    assert array[0] == {
+        "time": 1735657200000,
+        "open": 140000000.0,
+        "high": 140100000.0,
+        "low": 139900000.5,
+        "close": 140050000.0,
+        "volume": 0.01234567,
+        "value": 1234567.89123456,
+        "timestamp": 1735689600000,
+    }
+
+
+def test_from_candles():
+    raw = CandleArray.from_raw(PAYLOAD)
+    models = CandleArray.from_candles(MinuteCandle.model_validate_many(PAYLOAD))
+
+    for name in ("time", "open", "low", "volume", "value", "timestamp"):
+        assert (getattr(raw, name) == getattr(models, name)).all()
+
+
+def test_scaled():
+    array = CandleArray.from_raw(PAYLOAD, scale=8)
+
+    assert array.low.dtype == np.int64
+    assert array.low[0] == 13990000050000000
+    assert array.volume[0] == 1234567
+
+
+def test_slice_and_concat():
+    array = CandleArray.from_raw(PAYLOAD)
+
+    assert np.shares_memory(array[2:5].open, array.open)
+    joined = CandleArray.concat([array[:6], array[4:]])
+    assert len(joined) == 10
+    assert (joined.time == array.time).all()
+
+    with pytest.raises(ValueError):
+        CandleArray.concat([array, CandleArray.from_raw([candle(0, "KRW-ETH")])])
+    with pytest.raises(ValueError):
+        CandleArray.from_raw(PAYLOAD + [candle(11, "KRW-ETH")])
+
+
+def test_between():
+    array = CandleArray.from_raw(PAYLOAD)
+
+    selected = array.between(datetime(2025, 1, 1, 0, 3), datetime(2025, 1, 1, 0, 7))
+    assert len(selected) == 4
+    assert selected[0]["open"] == 140000003.0
+
+
+def test_df_is_zero_copy():
+    array = CandleArray.from_raw(PAYLOAD)
+    df = array.df()
+
+    assert list(df.columns) == [
+        "time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "value",
+        "timestamp",
+    ]
+    assert df["time"].iloc[0] == datetime(2024, 12, 31, 15, 0)
+    assert np.shares_memory(df["open"].to_numpy(), array.open)
+    assert np.shares_memory(df["time"].to_numpy(), array.time)
+
+
+def test_scaled_is_exact_above_float_precision():
+    # 100000000.00000001 * 10 ** 8 is odd and above 2 ** 53, a float64 multiply rounds it.
+    row = candle(0) | {"low_price": Decimal("100000000.00000001")}
+
+    array = CandleArray.from_raw([row], scale=8)
+
+    assert array.low[0] == 10000000000000001
+    assert array.open[0] == 14000000000000000
+
+
+def test_scaled_overflow():
+    # A busy KRW-BTC minute trades over 100 billion KRW, 1e19 at scale 8 does not fit in int64.
+    row = candle(0) | {"candle_acc_trade_price": 123456789012.34567}
+
+    with pytest.raises(OverflowError):
+        CandleArray.from_raw([row], scale=8)
+    assert CandleArray.from_raw([row], scale=4).value[0] == 1234567890123457
@@ -0,0 +1,29 @@
+import asyncio
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import MarketID, Snapshot
+
+
+def test_get_snapshots_async(api_client: BithumbClient):
+    markets: list[MarketID] = [
+        MarketID.from_string("KRW-BTC"),
+        MarketID.from_string("KRW-ETH"),
+    ]
+
+    async def run():
+        async with AsyncBithumbClient(
+            api_client._api_key, api_client._secret_key
+        ) as client:
+            return await asyncio.gather(
+                client.get_snapshots(markets), client.get_accounts()
+            )
+
+    snapshots, accounts = asyncio.run(run())
+
+    assert len(snapshots) == len(markets)
+    assert len(accounts) > 0
+
+    test_item: Snapshot = snapshots[0]
+
+    assert str(test_item.market) == str(markets[0])
@@ -0,0 +1,57 @@
+import hashlib
+
+import jwt
+import pytest
+
+from pybithumb2.auth import JWTSigner
+from pybithumb2.client import BithumbClient
+
+
+@pytest.mark.parametrize(
+    "api_key, secret_key",
+    [
+        ("access", "secret"),
+        ("a" * 40, "b" * 64),
+        ('key "with" \\ escapes', "sécret ✓"),
+        ("ключ", "s"),
+    ],
+)
+@pytest.mark.parametrize(
+    "query", [None, "", "market=KRW-BTC", "uuids[]=a&uuids[]=b&state=wait"]
+)
+def test_token_matches_pyjwt(api_key, secret_key, query):
+    nonce = "3c3c4e1c-7d5c-4b8e-9b5c-1a2b3c4d5e6f"
+    timestamp = 1735693323000
+    payload = {"access_key": api_key, "nonce": nonce, "timestamp": timestamp}
+    if query:
+        payload["query_hash"] = hashlib.sha512(query.encode()).hexdigest()
+        payload["query_hash_alg"] = "SHA512"
+
+    token = JWTSigner(api_key, secret_key).token(query, nonce, timestamp)
+
+    assert token == jwt.encode(payload, secret_key)
+
+
+def test_token_claims():
+    signer = JWTSigner("access", "secret")
+
+    first = jwt.decode(signer.token("a=1"), "secret", algorithms=["HS256"])
+    second = jwt.decode(signer.token("a=1"), "secret", algorithms=["HS256"])
+
+    assert first["access_key"] == "access"
+    assert first["query_hash_alg"] == "SHA512"
+    assert first["nonce"] != second["nonce"]
+
+
+def test_client_headers():
+    client = BithumbClient("access", "secret")
+
+    _, query, headers = client._prepare_request(
+        "/v1/orders/chance", True, {"market": "KRW-BTC"}
+    )
+    scheme, token = headers["Authorization"].split(" ")
+
+    assert scheme == "Bearer"
+    claims = jwt.decode(token, "secret", algorithms=["HS256"])
+    assert claims["access_key"] == "access"
+    assert query == "market=KRW-BTC"
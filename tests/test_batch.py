@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+
+from decimal import Decimal
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.batch import BatchResult, OrderRequest
+from pybithumb2.client import BithumbClient
+from pybithumb2.exceptions import APIError
+from pybithumb2.models import MarketID
+from pybithumb2.types import OrderID, OrderType, TradeSide
+
+MARKET = MarketID.from_string("KRW-BTC")
+DELAY = 0.05
+
+
+def ladder(count: int) -> list:
+    return [
+        OrderRequest(
+            MARKET, TradeSide.BID, Decimal("0.001"), Decimal(100 - i), OrderType.LIMIT
+        )
+        for i in range(count)
+    ]
+
+
+class FakeClient(BithumbClient):
+    """Answers orders after a fixed delay and records how many are in flight."""
+
+    def __init__(self):
+        super().__init__("access", "secret")
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def _call(self, result):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(DELAY)
+        with self.lock:
+            self.in_flight -= 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def submit_order(self, market, side, volume, price, ord_type):
+        if price == 98:
+            return self._call(APIError("insufficient_funds"))
+        return self._call(price)
+
+    def cancel_order(self, uuid):
+        return self._call(str(uuid))
+
+
+class FakeAsyncClient(AsyncBithumbClient):
+    def __init__(self):
+        super().__init__("access", "secret")
+        self.in_flight = 0
+        self.peak = 0
+
+    async def submit_order(self, market, side, volume, price, ord_type):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(DELAY)
+        self.in_flight -= 1
+        if price == 98:
+            raise APIError("insufficient_funds")
+        return price
+
+
+def test_submit_orders():
+    client = FakeClient()
+
+    result = client.submit_orders(ladder(20), max_concurrency=10)
+
+    assert isinstance(result, BatchResult)
+    assert len(result) == 20
+    assert result[0] == 100 and result[19] == 81
+    assert list(result.errors) == [2]
+    assert isinstance(result[2], APIError)
+    assert not result.ok
+    assert len(result.succeeded) == 19
+    assert client.peak == 10
+    # Two rounds of ten concurrent requests instead of twenty sequential ones.
+    assert DELAY * 2 <= result.elapsed < DELAY * 10
+
+
+def test_submit_orders_from_dicts():
+    client = FakeClient()
+    orders = [
+        {
+            "market": MARKET,
+            "side": TradeSide.ASK,
+            "volume": Decimal(1),
+            "price": Decimal(100),
+            "ord_type": OrderType.LIMIT,
+        }
+    ]
+
+    assert client.submit_orders(orders).results == [100]
+
+
+def test_cancel_orders():
+    client = FakeClient()
+
+    result = client.cancel_orders([OrderID(f"C{i}") for i in range(5)])
+
+    assert result.ok
+    assert result.results == [f"C{i}" for i in range(5)]
+    assert client.cancel_orders([]).results == []
+
+
+def test_submit_orders_async():
+    client = FakeAsyncClient()
+
+    result = asyncio.run(client.submit_orders(ladder(12), max_concurrency=4))
+
+    assert result[0] == 100
+    assert list(result.errors) == [2]
+    assert client.peak == 4
+    assert result.elapsed >= DELAY * 3
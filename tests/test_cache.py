@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pybithumb2.cache import ResponseCache, SingleFlight, cached
+
+
+class Client:
+    """Stand-in for a REST client that counts the requests it makes."""
+
+    _use_raw_data = False
+    _lazy = False
+
+    def __init__(self, cache, api_key="key", delay=0.0):
+        self._cache = cache
+        self._api_key = api_key
+        self.delay = delay
+        self.requests = 0
+
+    @cached()
+    def get_markets(self, isDetails: bool = False):
+        self.requests += 1
+        time.sleep(self.delay)
+        return [isDetails, self.requests]
+
+    @cached(private=True)
+    def get_api_keys(self):
+        self.requests += 1
+        return [self._api_key]
+
+    @cached()
+    async def get_warning_markets(self):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return [self.requests]
+
+
+def test_cache_hits_and_arguments():
+    cache = ResponseCache()
+    client = Client(cache)
+
+    first = client.get_markets()
+    assert client.get_markets() == first
+    assert client.get_markets(isDetails=False) == first
+    assert client.get_markets(True) == [True, 2]
+    assert client.requests == 2
+
+    stats = cache.stats("get_markets")
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert stats.hit_ratio == 0.5
+
+
+def test_cache_returns_copies():
+    client = Client(ResponseCache())
+
+    client.get_markets().append("changed")
+    assert client.get_markets() == [False, 1]
+
+
+def test_cache_ttl_and_invalidate():
+    cache = ResponseCache(ttls={"get_markets": 0.05, "get_api_keys": 0})
+    client = Client(cache)
+
+    client.get_markets()
+    time.sleep(0.06)
+    client.get_markets()
+    assert client.requests == 2
+
+    client.get_api_keys()
+    client.get_api_keys()
+    assert client.requests == 4
+
+    cache.invalidate("get_markets")
+    client.get_markets()
+    assert client.requests == 5
+
+
+def test_cache_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    client = Client(cache)
+
+    client.get_markets(False)
+    client.get_markets(True)
+    client.get_markets(False)
+    client.get_api_keys()  # Evicts get_markets(True), the least recently used.
+
+    assert len(cache) == 2
+    assert cache.stats().evictions == 1
+    client.get_markets(False)
+    assert client.requests == 3
+    client.get_markets(True)
+    assert client.requests == 4
+
+
+def test_private_endpoints_are_cached_per_key():
+    cache = ResponseCache()
+
+    assert Client(cache, "a").get_api_keys() == ["a"]
+    assert Client(cache, "b").get_api_keys() == ["b"]
+
+
+def test_concurrent_misses_share_one_request():
+    client = Client(ResponseCache(), delay=0.1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_markets(), range(8)))
+
+    assert client.requests == 1
+    assert all(result == [False, 1] for result in results)
+    stats = client._cache.stats()
+    assert stats.misses + stats.shared + stats.hits == 8
+    assert stats.misses == 1
+
+
+def test_concurrent_async_misses_share_one_request():
+    client = Client(ResponseCache(), delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*(client.get_warning_markets() for _ in range(5)))
+
+    assert asyncio.run(run()) == [[1]] * 5
+    assert client.requests == 1
+    assert client._cache.stats("get_warning_markets").shared == 4
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise ValueError("failed")
+
+    def follow():
+        started.wait()
+        threading.Timer(0.05, release.set).start()
+        return flight.do("key", lambda: "not called")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fail)
+        follower = executor.submit(follow)
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            follower.result()
+
+
+def test_single_flight_leader_cancelled():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.ensure_future(flight.do_async("key", fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        return leader, followers, results
+
+    leader, followers, results = asyncio.run(run())
+
+    assert leader.cancelled()
+    assert not any(follower.cancelled() for follower in followers)
+    # One follower made the call again and the others shared it.
+    assert sorted(results) == [(2, False), (2, True), (2, True)]
+    assert len(calls) == 2
+
+
+def test_no_cache():
+    client = Client(None)
+
+    client.get_markets()
+    client.get_markets()
+    assert client.requests == 2
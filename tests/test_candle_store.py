@@ -0,0 +1,173 @@
+import asyncio
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from pybithumb2.arrays import CandleArray
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.candle_store import CandleStore
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import MarketID, TimeUnit
+
+MARKET = MarketID.from_string("KRW-BTC")
+UNIT = TimeUnit(1)
+START = datetime(2025, 1, 1, 9)
+
+
+def minute_candles(to: datetime, count: int) -> list:
+    """The `count` minute candles before `to` up to now, newest first, without the minutes where nothing traded."""
+    now = datetime.utcnow() + timedelta(hours=9)
+    rows = []
+    for i in range(1, count + 1):
+        kst = to - timedelta(minutes=i)
+        if kst.minute % 7 == 3 or kst > now:
+            continue
+        utc = kst - timedelta(hours=9)
+        rows.append(
+            {
+                "market": str(MARKET),
+                "candle_date_time_utc": utc.isoformat(),
+                "candle_date_time_kst": kst.isoformat(),
+                "opening_price": kst.minute,
+                "high_price": kst.minute + 1,
+                "low_price": kst.minute - 1,
+                "trade_price": kst.minute,
+                "timestamp": 0,
+                "candle_acc_trade_price": 1.0,
+                "candle_acc_trade_volume": 1.0,
+            }
+        )
+    return rows
+
+
+class FakeClient(BithumbClient):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def get_minute_candles(self, market, to=None, count=1, unit=UNIT, as_array=False):
+        self.requests.append(to)
+        return CandleArray.from_raw(minute_candles(to, count), market=market)
+
+
+class FakeAsyncClient(AsyncBithumbClient):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    async def get_minute_candles(
+        self, market, to=None, count=1, unit=UNIT, as_array=False
+    ):
+        self.requests.append(to)
+        return CandleArray.from_raw(minute_candles(to, count), market=market)
+
+
+def expected_minutes(start: datetime, end: datetime) -> list:
+    minutes = []
+    while start < end:
+        if start.minute % 7 != 3:
+            minutes.append(start)
+        start += timedelta(minutes=1)
+    return minutes
+
+
+def kst_times(candles: CandleArray) -> list:
+    return [
+        datetime.utcfromtimestamp(t / 1000) + timedelta(hours=9) for t in candles.time
+    ]
+
+
+def test_sync_fetches_only_missing_ranges(tmp_path):
+    store = CandleStore(tmp_path)
+    client = FakeClient()
+    end = START + timedelta(minutes=300)
+
+    candles = store.sync(client, MARKET, UNIT, START, end)
+
+    assert kst_times(candles) == expected_minutes(START, end)
+    assert store.ranges(MARKET, UNIT) == [(START, end)]
+    assert store.missing(MARKET, UNIT, START, end) == []
+
+    client.requests.clear()
+    again = store.sync(client, MARKET, UNIT, START + timedelta(minutes=10), end)
+    assert client.requests == []
+    assert kst_times(again) == expected_minutes(START + timedelta(minutes=10), end)
+
+    later = end + timedelta(minutes=100)
+    store.sync(client, MARKET, UNIT, START, later)
+    # Only the 100 new minutes are requested.
+    assert client.requests == [later]
+    assert store.ranges(MARKET, UNIT) == [(START, later)]
+    assert kst_times(store.read(MARKET, UNIT)) == expected_minutes(START, later)
+
+
+def test_sync_fills_gaps_between_ranges(tmp_path):
+    store = CandleStore(tmp_path)
+    client = FakeClient()
+    store.sync(client, MARKET, UNIT, START, START + timedelta(minutes=50))
+    store.sync(
+        client,
+        MARKET,
+        UNIT,
+        START + timedelta(minutes=100),
+        START + timedelta(minutes=150),
+    )
+
+    assert store.missing(MARKET, UNIT, START, START + timedelta(minutes=150)) == [
+        (START + timedelta(minutes=50), START + timedelta(minutes=100))
+    ]
+
+    client.requests.clear()
+    candles = store.sync(client, MARKET, UNIT, START, START + timedelta(minutes=150))
+
+    assert client.requests == [START + timedelta(minutes=100)]
+    assert kst_times(candles) == expected_minutes(START, START + timedelta(minutes=150))
+    assert (np.diff(candles.time) > 0).all()
+
+
+def test_read_is_memory_mapped(tmp_path):
+    store = CandleStore(tmp_path)
+    store.sync(FakeClient(), MARKET, UNIT, START, START + timedelta(minutes=30))
+
+    candles = CandleStore(tmp_path).read(MARKET, UNIT)
+
+    # Views of the read-only mapping, while mmap=False reads the candles into memory.
+    assert not candles.open.flags.writeable
+    assert store.read(MARKET, UNIT, mmap=False).open.flags.writeable
+    assert candles.market == MARKET
+    df = store.df(MARKET, UNIT, START, START + timedelta(minutes=10))
+    assert len(df) == len(expected_minutes(START, START + timedelta(minutes=10)))
+
+
+def test_read_empty(tmp_path):
+    store = CandleStore(tmp_path)
+
+    assert len(store.read(MARKET, UNIT)) == 0
+    assert store.ranges(MARKET, UNIT) == []
+
+
+def test_sync_does_not_cover_the_forming_candle(tmp_path):
+    store = CandleStore(tmp_path)
+    # Naive datetimes are in KST, so shift the local time of the test machine.
+    now = datetime.utcnow().replace(second=0, microsecond=0) + timedelta(hours=9)
+    start = now - timedelta(minutes=20)
+
+    store.sync(FakeClient(), MARKET, UNIT, start, now + timedelta(minutes=5))
+
+    (covered,) = store.ranges(MARKET, UNIT)
+    assert covered[0] == start
+    # The candle of the current minute is requested again by the next sync.
+    assert covered[1] <= now
+    assert store.missing(MARKET, UNIT, start, now + timedelta(minutes=1)) != []
+
+
+def test_sync_async(tmp_path):
+    store = CandleStore(tmp_path)
+    client = FakeAsyncClient()
+    end = START + timedelta(minutes=300)
+
+    candles = asyncio.run(store.sync_async(client, MARKET, UNIT, START, end))
+
+    assert kst_times(candles) == expected_minutes(START, end)
+    assert store.missing(MARKET, UNIT, START, end) == []
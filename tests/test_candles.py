@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 
-from pybithumb2.client import BithumbClient
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient, _candle_windows
 from pybithumb2.utils import parse_datetime
 from pybithumb2.models import (
     Currency,
@@ -11,8 +14,9 @@ from pybithumb2.models import (
     WeekCandle,
     MonthCandle,
     MarketID,
+    TimeUnit,
 )
-from pybithumb2.types import RawData
+from pybithumb2.types import CandlePeriod, RawData
 from pybithumb2.exceptions import APIError
 
 
@@ -95,3 +99,77 @@ def test_fails_get_candles(api_client: BithumbClient):
         api_client.get_minute_candles(market, count=-1)
     with pytest.raises(APIError):
         api_client.get_minute_candles(market, count=201)
+
+
+def test_candle_windows():
+    start = datetime(2025, 1, 1)
+    end = datetime(2025, 1, 2)
+    windows = _candle_windows(TimeUnit(1), start, end)
+
+    assert windows[0][0] == start
+    assert windows[-1][1] == end
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+    assert all(count <= 200 for _, _, count in windows)
+    assert sum(count - 1 for _, _, count in windows) == 24 * 60
+
+    assert len(_candle_windows(CandlePeriod.MONTH, datetime(2000, 1, 1), end)) == 2
+
+
+def test_get_candles_range(api_client: BithumbClient):
+    market: MarketID = MarketID.from_string("KRW-BTC")
+    end = datetime.now().replace(second=0, microsecond=0)
+    start = end - timedelta(minutes=500)
+    response = api_client.get_candles_range(market, TimeUnit(1), start, end)
+
+    assert len(response) > 200
+
+    times = [candle.candle_date_time_kst for candle in response]
+
+    assert times == sorted(set(times))
+    assert start <= times[0] and times[-1] < end
+
+
+class SlowAsyncClient(AsyncBithumbClient):
+    """Answers the first window at once, fails the second if asked to, and leaves the others in flight."""
+
+    def __init__(self, fail: bool = False):
+        super().__init__(use_raw_data=True)
+        self.fail = fail
+        self.calls = 0
+
+    async def get_minute_candles(self, market, to=None, count=1, unit=None, **kwargs):
+        self.calls += 1
+        if self.calls == 2 and self.fail:
+            raise APIError("window failed")
+        if self.calls > 1:
+            await asyncio.sleep(10)
+        return [
+            {"candle_date_time_kst": (to - timedelta(minutes=i)).isoformat()}
+            for i in range(1, count + 1)
+        ]
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_iter_candles_range_leaves_no_tasks(fail):
+    market = MarketID.from_string("KRW-BTC")
+    start = datetime(2025, 1, 1)
+
+    async def run():
+        client = SlowAsyncClient(fail)
+        candles = client.iter_candles_range(
+            market, TimeUnit(1), start, start + timedelta(days=1), max_workers=2
+        )
+        try:
+            assert await candles.__anext__()
+            await asyncio.sleep(0)
+            if fail:
+                with pytest.raises(APIError):
+                    async for _ in candles:
+                        pass
+        finally:
+            await candles.aclose()
+        return [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,155 @@
+import json
+import time
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient
+from pybithumb2.exceptions import APIError
+from pybithumb2.models import MarketID
+
+MARKETS = [MarketID.from_string("KRW-BTC"), MarketID.from_string("KRW-ETH")]
+SERVER_DELAY = 0.2
+
+TICKER = {
+    "market": "KRW-BTC",
+    "trade_date": "20250101",
+    "trade_time": "010203",
+    "trade_date_kst": "20250101",
+    "trade_time_kst": "100203",
+    "trade_timestamp": 1735693323000,
+    "opening_price": 140000000,
+    "high_price": 141000000,
+    "low_price": 139000000,
+    "trade_price": 140500000.5,
+    "prev_closing_price": 140000000,
+    "change": "RISE",
+    "change_price": 500000,
+    "change_rate": 0.0036,
+    "signed_change_price": 500000,
+    "signed_change_rate": 0.0036,
+    "trade_volume": 0.0123,
+    "acc_trade_price": 123456789.123,
+    "acc_trade_price_24h": 223456789.1,
+    "acc_trade_volume": 12.5,
+    "acc_trade_volume_24h": 25.1,
+    "highest_52_week_price": 160000000,
+    "highest_52_week_date": "2024-12-17",
+    "lowest_52_week_price": 60000000,
+    "lowest_52_week_date": "2024-01-23",
+    "timestamp": 1735693323500,
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        time.sleep(SERVER_DELAY)
+        if self.path.startswith("/v1/ticker"):
+            status, body = 200, json.dumps([TICKER]).encode()
+        else:
+            status, body = 404, b'{"error": {"name": "not_found", "message": ""}}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url():
+    Handler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_threads_share_one_request(server_url):
+    client = BithumbClient(coalesce=True)
+    client._base_url = server_url
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(
+            pool.map(lambda markets: client.get_snapshots(markets), [MARKETS] * 4)
+        )
+        other = pool.submit(client.get_snapshots, MARKETS[:1])
+        other.result()
+
+    assert len(Handler.hits) == 2
+    assert all(result == results[0] for result in results)
+    # Every caller gets its own list.
+    assert len({id(result) for result in results}) == 4
+    client.close()
+
+
+def test_errors_are_shared(server_url):
+    client = BithumbClient(coalesce=True)
+    client._base_url = server_url
+
+    def call():
+        with pytest.raises(APIError):
+            client.get("/v1/unknown", is_private=False)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for future in [pool.submit(call) for _ in range(3)]:
+            future.result()
+
+    assert len(Handler.hits) == 1
+    client.close()
+
+
+def test_not_coalesced_by_default(server_url):
+    client = BithumbClient()
+    client._base_url = server_url
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda _: client.get_snapshots(MARKETS), range(3)))
+
+    assert len(Handler.hits) == 3
+    client.close()
+
+
+def test_asyncio_tasks_share_one_request(server_url):
+    async def run():
+        async with AsyncBithumbClient(coalesce=True) as client:
+            client._base_url = server_url
+            return await asyncio.gather(
+                *(client.get_snapshots(MARKETS) for _ in range(5)),
+                client.get_orderbooks(MARKETS),
+                return_exceptions=True,
+            )
+
+    *snapshots, orderbooks = asyncio.run(run())
+
+    assert sorted(path.split("?")[0] for path in Handler.hits) == [
+        "/v1/orderbook",
+        "/v1/ticker",
+    ]
+    assert all(result == snapshots[0] for result in snapshots)
+    assert isinstance(orderbooks, APIError)
+
+
+def test_coalesce_key():
+    client = BithumbClient(coalesce=True)
+
+    key = client._coalesce_key(
+        "GET", "/v1/ticker", False, {"markets": "KRW-BTC"}, False
+    )
+    assert key == ("/v1/ticker", "markets=KRW-BTC")
+    assert client._coalesce_key("GET", "/v1/accounts", True, None, False) is None
+    assert client._coalesce_key("POST", "/v1/orders", False, None, False) is None
+    assert (
+        BithumbClient()._coalesce_key("GET", "/v1/ticker", False, None, False) is None
+    )
@@ -0,0 +1,90 @@
+import time
+import asyncio
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import MarketID
+
+
+def test_warmup():
+    client = BithumbClient(pool_maxsize=4, connect_timeout=5, read_timeout=10)
+
+    assert client.warmup() == 4
+
+    response = client.get_snapshots([MarketID.from_string("KRW-BTC")])
+
+    assert len(response) == 1
+    client.close()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_HEAD(self):
+        # Long enough for the warm-up requests to overlap.
+        time.sleep(0.1)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+def test_warmup_offline(server):
+    client = BithumbClient(pool_maxsize=4, connect_timeout=5)
+    client._base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    assert client.warmup() == 4
+    assert server.connections == 4
+
+    client.get_snapshots([MarketID.from_string("KRW-BTC")])
+    # The request reuses a warmed connection.
+    assert server.connections == 4
+    client.close()
+
+
+def test_warmup_failures_are_not_counted():
+    client = BithumbClient(pool_maxsize=2, connect_timeout=1)
+    # Nothing listens on the discard port.
+    client._base_url = "http://127.0.0.1:9"
+
+    assert client.warmup() == 0
+
+
+def test_async_warmup_offline(server):
+    async def run():
+        async with AsyncBithumbClient(pool_maxsize=3, connect_timeout=5) as client:
+            client._base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            warmed = await client.warmup()
+            await client.get_snapshots([MarketID.from_string("KRW-BTC")])
+            return warmed
+
+    assert asyncio.run(run()) == 3
+    assert server.connections == 3
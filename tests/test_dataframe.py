@@ -0,0 +1,64 @@
+import pytest
+
+from decimal import Decimal
+
+from pybithumb2.models import DFList, Snapshot
+
+pd = pytest.importorskip("pandas")
+
+
+SNAPSHOT = {
+    "market": "KRW-BTC",
+    "trade_date": "20250101",
+    "trade_time": "010203",
+    "trade_date_kst": "20250101",
+    "trade_time_kst": "100203",
+    "trade_timestamp": 1735693323000,
+    "opening_price": 140000000,
+    "high_price": 141000000,
+    "low_price": 139000000,
+    "trade_price": 140500000.5,
+    "prev_closing_price": 140000000,
+    "change": "RISE",
+    "change_price": 500000,
+    "change_rate": 0.0036,
+    "signed_change_price": 500000,
+    "signed_change_rate": 0.0036,
+    "trade_volume": 0.0123,
+    "acc_trade_price": 123456789.123,
+    "acc_trade_price_24h": 223456789.1,
+    "acc_trade_volume": 12.5,
+    "acc_trade_volume_24h": 25.1,
+    "highest_52_week_price": 160000000,
+    "highest_52_week_date": "2024-12-17",
+    "lowest_52_week_price": 60000000,
+    "lowest_52_week_date": "2024-01-23",
+    "timestamp": 1735693323500,
+}
+
+
+def test_df_columns():
+    snapshots = DFList[Snapshot](
+        [
+            Snapshot.model_validate(SNAPSHOT),
+            Snapshot.model_validate(dict(SNAPSHOT, market="KRW-ETH", change="FALL")),
+        ]
+    )
+    df = snapshots.df()
+
+    assert len(df) == 2
+    assert list(df.columns) == list(snapshots[0].__dict__)
+    assert isinstance(df["market"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["change"].dtype, pd.CategoricalDtype)
+    assert list(df["market"]) == ["KRW-BTC", "KRW-ETH"]
+    assert df["trade_price"].dtype == "float64"
+    assert df["trade_timestamp"].dtype == "int64"
+    assert pd.api.types.is_datetime64_any_dtype(df["highest_52_week_date"])
+
+
+def test_df_keeps_decimals():
+    df = DFList[Snapshot]([Snapshot.model_validate(SNAPSHOT)]).df(
+        decimal_as_float=False
+    )
+
+    assert df["trade_price"][0] == Decimal("140500000.5")
@@ -0,0 +1,193 @@
+import math
+
+import numpy as np
+import pytest
+
+from pybithumb2 import indicators
+from pybithumb2.arrays import CandleArray
+from pybithumb2.indicators import RSI, SMA, EMA, VWAP, BollingerBands
+from pybithumb2.models import MarketID
+
+MARKET = MarketID.from_string("KRW-BTC")
+
+
+def make_candles(rows: int = 500, scale=None) -> CandleArray:
+    rng = np.random.default_rng(7)
+    close = 140_000_000 + np.cumsum(rng.normal(0, 50_000, rows)).round()
+    volume = rng.uniform(0, 2, rows).round(4)
+    volume[10] = 0.0
+    time = 1735689600000 + np.arange(rows) * 60_000
+    candles = CandleArray(
+        MARKET,
+        time,
+        close,
+        close + 10_000,
+        close - 10_000,
+        close,
+        volume,
+        close * volume,
+        time + 59_000,
+    )
+    if scale is None:
+        return candles
+    return CandleArray(
+        MARKET,
+        candles.time,
+        *(
+            np.rint(getattr(candles, name) * 10**scale).astype(np.int64)
+            for name in ("open", "high", "low", "close", "volume", "value")
+        ),
+        candles.timestamp,
+        scale=scale,
+    )
+
+
+def naive_sma(values, period):
+    return [
+        sum(values[i + 1 - period : i + 1]) / period if i >= period - 1 else math.nan
+        for i in range(len(values))
+    ]
+
+
+def naive_ema(values, period):
+    out, alpha = [], 2 / (period + 1)
+    for i, value in enumerate(values):
+        if i < period - 1:
+            out.append(math.nan)
+        elif i == period - 1:
+            out.append(sum(values[:period]) / period)
+        else:
+            out.append(out[-1] + alpha * (value - out[-1]))
+    return out
+
+
+def naive_rsi(values, period):
+    out = [math.nan] * len(values)
+    changes = [b - a for a, b in zip(values, values[1:])]
+    gain = sum(max(c, 0) for c in changes[:period]) / period
+    loss = sum(max(-c, 0) for c in changes[:period]) / period
+    for i in range(period, len(values)):
+        if i > period:
+            change = changes[i - 1]
+            gain = (gain * (period - 1) + max(change, 0)) / period
+            loss = (loss * (period - 1) + max(-change, 0)) / period
+        out[i] = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+    return out
+
+
+def test_functions_match_naive_loops():
+    candles = make_candles()
+    close = candles.close.tolist()
+
+    np.testing.assert_allclose(
+        indicators.sma(candles, 20), naive_sma(close, 20), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        indicators.ema(candles, 20), naive_ema(close, 20), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        indicators.rsi(candles, 14), naive_rsi(close, 14), rtol=1e-9
+    )
+
+    middle, upper, lower = indicators.bollinger(candles, 20, 2.0)
+    std = [np.std(close[i - 19 : i + 1]) for i in range(19, len(close))]
+    np.testing.assert_allclose(middle, naive_sma(close, 20), rtol=1e-12)
+    np.testing.assert_allclose(upper[19:], middle[19:] + 2 * np.array(std))
+    np.testing.assert_allclose(lower[19:], middle[19:] - 2 * np.array(std))
+
+
+def test_short_series_are_nan():
+    assert np.isnan(indicators.sma([1.0, 2.0], 3)).all()
+    assert np.isnan(indicators.ema([1.0, 2.0], 3)).all()
+    assert np.isnan(indicators.rsi([1.0, 2.0, 3.0], 3)).all()
+    assert indicators.rsi([1.0, 2.0, 3.0, 4.0], 3)[-1] == 100.0
+    assert indicators.rsi([1.0] * 5, 3)[-1] == 50.0
+    with pytest.raises(ValueError):
+        indicators.sma([1.0], 0)
+
+
+def test_long_ema_stays_finite():
+    values = np.linspace(100.0, 200.0, 100_000)
+
+    result = indicators.ema(values, 2)
+
+    assert np.isfinite(result[1:]).all()
+    np.testing.assert_allclose(result[-1], values[-1], rtol=1e-4)
+
+
+def test_vwap():
+    candles = make_candles()
+    value, volume = candles.value.tolist(), candles.volume.tolist()
+
+    cumulative = indicators.vwap(candles)
+    rolling = indicators.vwap(candles, 10)
+
+    np.testing.assert_allclose(cumulative[-1], sum(value) / sum(volume))
+    np.testing.assert_allclose(
+        rolling[-1], sum(value[-10:]) / sum(volume[-10:]), rtol=1e-12
+    )
+    assert np.isnan(rolling[:9]).all()
+
+
+def test_scaled_candles():
+    floats = make_candles()
+    scaled = make_candles(scale=4)
+
+    np.testing.assert_allclose(indicators.sma(scaled, 5), indicators.sma(floats, 5))
+    np.testing.assert_allclose(
+        indicators.vwap(scaled), indicators.vwap(floats), rtol=1e-9
+    )
+
+
+@pytest.mark.parametrize(
+    "indicator, function",
+    [
+        (lambda: SMA(20), lambda c: indicators.sma(c, 20)),
+        (lambda: EMA(20), lambda c: indicators.ema(c, 20)),
+        (lambda: RSI(14), lambda c: indicators.rsi(c, 14)),
+        (lambda: BollingerBands(20), lambda c: indicators.bollinger(c, 20)[1]),
+    ],
+)
+def test_updates_match_functions(indicator, function):
+    candles = make_candles()
+    expected = function(candles)
+
+    state = indicator()
+    values = [state.update(close) for close in candles.close.tolist()]
+    if isinstance(state, BollingerBands):
+        values = [upper for _, upper, _ in values]
+
+    np.testing.assert_allclose(values, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("split", [3, 15, 300])
+def test_from_history_continues_updates(split):
+    candles = make_candles()
+    close = candles.close
+    history = candles[:split]
+
+    for indicator, expected in (
+        (SMA.from_history(history, 20), indicators.sma(candles, 20)),
+        (EMA.from_history(history, 20), indicators.ema(candles, 20)),
+        (RSI.from_history(history, 14), indicators.rsi(candles, 14)),
+    ):
+        values = [indicator.update(value) for value in close[split:].tolist()]
+        np.testing.assert_allclose(values, expected[split:], rtol=1e-9)
+
+    bands = BollingerBands.from_history(history, 20)
+    values = [bands.update(value)[0] for value in close[split:].tolist()]
+    np.testing.assert_allclose(
+        values, indicators.bollinger(candles, 20)[0][split:], rtol=1e-9
+    )
+
+    for period in (None, 10):
+        vwap = VWAP.from_history(history, period)
+        values = [
+            vwap.update(value, volume)
+            for value, volume in zip(
+                candles.value[split:].tolist(), candles.volume[split:].tolist()
+            )
+        ]
+        np.testing.assert_allclose(
+            values, indicators.vwap(candles, period)[split:], rtol=1e-9
+        )
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import MarketID
+from pybithumb2.types import OrderBy, OrderState
+
+MARKET = MarketID.from_string("KRW-BTC")
+TOTAL = 25
+DELAY = 0.05
+
+
+def page_of(page: int, limit: int) -> list:
+    start = (page - 1) * limit
+    return [{"uuid": str(i)} for i in range(start, min(start + limit, TOTAL))]
+
+
+class FakeClient(BithumbClient):
+    """Serves TOTAL orders in pages after a fixed delay and records the requested pages."""
+
+    def __init__(self):
+        super().__init__("access", "secret", use_raw_data=True)
+        self.pages = []
+        self.arguments = []
+
+    def get_orders(
+        self,
+        market,
+        uuids=None,
+        state=None,
+        states=None,
+        page=1,
+        limit=100,
+        order_by=OrderBy.DESC,
+    ):
+        self.pages.append(page)
+        self.arguments.append((market, state, states, order_by))
+        time.sleep(DELAY)
+        return page_of(page, limit)
+
+
+class FakeAsyncClient(AsyncBithumbClient):
+    def __init__(self):
+        super().__init__("access", "secret", use_raw_data=True)
+        self.pages = []
+
+    async def get_orders(
+        self,
+        market,
+        uuids=None,
+        state=None,
+        states=None,
+        page=1,
+        limit=100,
+        order_by=OrderBy.DESC,
+    ):
+        self.pages.append(page)
+        await asyncio.sleep(DELAY)
+        return page_of(page, limit)
+
+
+def test_iter_orders_pages_until_short_page():
+    client = FakeClient()
+
+    orders = list(
+        client.iter_orders(
+            MARKET, state=OrderState.DONE, limit=10, order_by=OrderBy.ASC
+        )
+    )
+
+    assert [o["uuid"] for o in orders] == [str(i) for i in range(TOTAL)]
+    assert client.pages == [1, 2, 3]
+    assert client.arguments[0] == (MARKET, OrderState.DONE, None, OrderBy.ASC)
+
+
+def test_iter_orders_stops_on_empty_page():
+    client = FakeClient()
+
+    orders = list(client.iter_orders(MARKET, limit=5))
+
+    assert len(orders) == TOTAL
+    assert client.pages == [1, 2, 3, 4, 5, 6]
+
+
+def test_iter_orders_prefetches_next_page():
+    client = FakeClient()
+    orders = client.iter_orders(MARKET, limit=10)
+
+    next(orders)
+    # The second page is already requested while the first one is being consumed.
+    time.sleep(DELAY / 2)
+    assert client.pages == [1, 2]
+
+    start = time.perf_counter()
+    for _ in range(9):
+        next(orders)
+        time.sleep(DELAY / 10)
+    next(orders)
+    # Consuming the first page took about as long as fetching the second one, so it barely waits.
+    assert time.perf_counter() - start < DELAY * 1.5
+    orders.close()
+
+
+def test_iter_orders_async():
+    async def run():
+        client = FakeAsyncClient()
+        orders = [o async for o in client.iter_orders(MARKET, limit=10)]
+        return client, orders
+
+    client, orders = asyncio.run(run())
+
+    assert [o["uuid"] for o in orders] == [str(i) for i in range(TOTAL)]
+    assert client.pages == [1, 2, 3]
+
+
+def test_iter_orders_async_prefetches_next_page():
+    async def run():
+        client = FakeAsyncClient()
+        orders = client.iter_orders(MARKET, limit=10)
+        await orders.__anext__()
+        await asyncio.sleep(0)
+        pages = list(client.pages)
+        await orders.aclose()
+        return pages
+
+    assert asyncio.run(run()) == [1, 2]
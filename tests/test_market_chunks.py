@@ -0,0 +1,97 @@
+import json
+import asyncio
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient, _market_chunks
+from pybithumb2.models import MarketID
+
+MARKETS = [MarketID.from_string(f"KRW-COIN{i}") for i in range(25)]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    queries = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        markets = parse_qs(url.query)["markets"][0].split(",")
+        self.queries.append(markets)
+        # The API does not keep the order of the request.
+        body = json.dumps([{"market": market} for market in reversed(markets)])
+        body = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url():
+    Handler.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_market_chunks():
+    assert _market_chunks([], 10, 100) == []
+    assert [len(chunk) for chunk in _market_chunks(MARKETS, 10, 10_000)] == [
+        10,
+        10,
+        5,
+    ]
+    # Repeated markets are requested once.
+    assert _market_chunks(MARKETS[:2] + MARKETS[:2], 10, 10_000) == [MARKETS[:2]]
+
+    for chunk in _market_chunks(MARKETS, 100, 50):
+        assert len("%2C".join(str(market) for market in chunk)) <= 50
+    # A market longer than the limit is still requested, on its own.
+    assert _market_chunks(MARKETS[:2], 10, 5) == [[MARKETS[0]], [MARKETS[1]]]
+
+
+def test_sync_chunks_are_merged_in_market_order(server_url):
+    client = BithumbClient(use_raw_data=True)
+    client._base_url = server_url
+
+    snapshots = client.get_snapshots(MARKETS, max_markets=10)
+    orderbooks = client.get_orderbooks(MARKETS, max_query_length=60)
+
+    assert [item["market"] for item in snapshots] == [str(m) for m in MARKETS]
+    assert [item["market"] for item in orderbooks] == [str(m) for m in MARKETS]
+    assert sorted(len(markets) for markets in Handler.queries[:3]) == [5, 10, 10]
+    assert sorted(sum(Handler.queries[3:], [])) == sorted(str(m) for m in MARKETS)
+    client.close()
+
+
+def test_single_chunk_is_one_request(server_url):
+    client = BithumbClient(use_raw_data=True)
+    client._base_url = server_url
+
+    snapshots = client.get_snapshots(MARKETS[:3])
+
+    assert [item["market"] for item in snapshots] == [str(m) for m in MARKETS[:3]]
+    assert Handler.queries == [[str(m) for m in MARKETS[:3]]]
+    client.close()
+
+
+def test_async_chunks_are_merged_in_market_order(server_url):
+    async def run():
+        async with AsyncBithumbClient(use_raw_data=True) as client:
+            client._base_url = server_url
+            return await client.get_snapshots(MARKETS, max_markets=4, max_workers=2)
+
+    snapshots = asyncio.run(run())
+
+    assert [item["market"] for item in snapshots] == [str(m) for m in MARKETS]
+    assert len(Handler.queries) == 7
@@ -0,0 +1,263 @@
+import json
+import time
+import asyncio
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pybithumb2.async_client import AsyncBithumbClient
+from pybithumb2.client import BithumbClient
+from pybithumb2.exceptions import APIError
+from pybithumb2.metrics import ClientMetrics, Histogram, RequestEvent
+from pybithumb2.models import MarketID
+from pybithumb2.types import OrderType, TradeSide
+
+MARKET = MarketID.from_string("KRW-BTC")
+SERVER_DELAY = 0.05
+
+TICKER = {
+    "market": "KRW-BTC",
+    "trade_date": "20250101",
+    "trade_time": "010203",
+    "trade_date_kst": "20250101",
+    "trade_time_kst": "100203",
+    "trade_timestamp": 1735693323000,
+    "opening_price": 140000000,
+    "high_price": 141000000,
+    "low_price": 139000000,
+    "trade_price": 140500000.5,
+    "prev_closing_price": 140000000,
+    "change": "RISE",
+    "change_price": 500000,
+    "change_rate": 0.0036,
+    "signed_change_price": 500000,
+    "signed_change_rate": 0.0036,
+    "trade_volume": 0.0123,
+    "acc_trade_price": 123456789.123,
+    "acc_trade_price_24h": 223456789.1,
+    "acc_trade_volume": 12.5,
+    "acc_trade_volume_24h": 25.1,
+    "highest_52_week_price": 160000000,
+    "highest_52_week_date": "2024-12-17",
+    "lowest_52_week_price": 60000000,
+    "lowest_52_week_date": "2024-01-23",
+    "timestamp": 1735693323500,
+}
+
+ORDER = {
+    "uuid": "C0101000000001234567",
+    "side": "bid",
+    "ord_type": "limit",
+    "price": "28000",
+    "state": "wait",
+    "market": "KRW-SUI",
+    "created_at": "2025-01-01T10:00:00+09:00",
+    "volume": "0.21428571",
+    "remaining_volume": "0.21428571",
+    "reserved_fee": "15",
+    "remaining_fee": "15",
+    "paid_fee": "0",
+    "locked": "6015",
+    "executed_volume": "0",
+    "trades_count": 0,
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(SERVER_DELAY)
+        if self.path.startswith("/v1/ticker"):
+            status, body = 200, json.dumps([TICKER]).encode()
+        else:
+            status, body = 404, b'{"error": {"name": "not_found", "message": ""}}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps(ORDER).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_histogram_quantile():
+    histogram = Histogram((0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3, 1.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.quantile(0.5) == pytest.approx(0.1 + 0.1 * 1.5 / 2)
+    assert histogram.quantile(1.0) == 0.4
+    assert Histogram().quantile(0.5) is None
+
+
+def test_sync_client_metrics(server_url):
+    events = []
+    metrics = ClientMetrics(hooks=[events.append])
+    client = BithumbClient(metrics=metrics)
+    client._base_url = server_url
+
+    client.get_snapshots([MARKET])
+    client.get_snapshots([MARKET])
+    with pytest.raises(APIError):
+        client.get("/v1/unknown", is_private=False)
+
+    first, second, failed = events
+    assert isinstance(first, RequestEvent)
+    assert (first.method, first.endpoint, first.status) == ("GET", "/v1/ticker", 200)
+    # The connection is opened once and reused.
+    assert first.connect > 0 and second.connect == 0
+    assert first.server >= SERVER_DELAY * 0.9
+    assert first.total >= first.server + first.connect
+    assert first.bytes_in == len(json.dumps([TICKER]))
+    assert first.bytes_out == len("markets=KRW-BTC")
+    assert first.error is None
+    assert (failed.status, failed.error) == (404, "APIError")
+
+    summary = metrics.summary()["GET /v1/ticker"]
+    assert summary.requests == 2 and summary.errors == 0
+    assert summary.p50 >= SERVER_DELAY * 0.5
+    assert summary.stages["server"] >= SERVER_DELAY * 0.9
+    assert metrics.summary()["GET /v1/unknown"].errors == 1
+    rows, parse_time = metrics.parse_summary()["Snapshot"]
+    assert rows == 2 and parse_time > 0
+    client.close()
+
+
+def submit_order(client):
+    return client.submit_order(
+        MarketID.from_string("KRW-SUI"),
+        TradeSide.BID,
+        0.21428571,
+        28000,
+        OrderType.LIMIT,
+    )
+
+
+def test_post_bytes_out_and_object_parse(server_url):
+    events = []
+    metrics = ClientMetrics(hooks=[events.append])
+    client = BithumbClient("a" * 40, "b" * 64, metrics=metrics)
+    client._base_url = server_url
+
+    submit_order(client)
+
+    (event,) = events
+    # Only the JSON body is sent, the query is only signed.
+    assert event.bytes_out == len(Handler.bodies[-1])
+    rows, parse_time = metrics.parse_summary()["Order"]
+    assert rows == 1 and parse_time > 0
+    client.close()
+
+    events.clear()
+
+    async def run():
+        async with AsyncBithumbClient("a" * 40, "b" * 64, metrics=metrics) as client:
+            client._base_url = server_url
+            await submit_order(client)
+
+    asyncio.run(run())
+    (event,) = events
+    assert event.bytes_out == len(Handler.bodies[-1])
+    assert metrics.parse_summary()["Order"][0] == 2
+
+
+def test_sync_client_connection_error():
+    metrics = ClientMetrics()
+    client = BithumbClient(metrics=metrics, connect_timeout=1)
+    # Nothing listens on the discard port.
+    client._base_url = "http://127.0.0.1:9"
+
+    with pytest.raises(Exception):
+        client.get_snapshots([MARKET])
+
+    assert metrics.summary()["GET /v1/ticker"].errors == 1
+    assert 'status="0"' in metrics.to_prometheus()
+
+
+def test_async_client_metrics(server_url):
+    events = []
+    metrics = ClientMetrics(hooks=[events.append])
+
+    async def run():
+        async with AsyncBithumbClient(metrics=metrics) as client:
+            client._base_url = server_url
+            await client.get_snapshots([MARKET])
+            await client.get_snapshots([MARKET])
+
+    asyncio.run(run())
+
+    first, second = events
+    assert (first.endpoint, first.status) == ("/v1/ticker", 200)
+    assert first.connect > 0 and second.connect == 0
+    assert first.server >= SERVER_DELAY * 0.9
+    assert first.bytes_in == len(json.dumps([TICKER]))
+    assert first.bytes_out == len("markets=KRW-BTC")
+
+
+def test_prometheus_export():
+    metrics = ClientMetrics(buckets=(0.1, 1.0))
+    metrics.observe_request(
+        RequestEvent("GET", "/v1/ticker", 200, 0.5, server=0.4, bytes_in=100)
+    )
+    metrics.observe_request(
+        RequestEvent("GET", "/v1/ticker", 429, 0.05, error="RateLimitError")
+    )
+    metrics.observe_parse("Snapshot", 0.002, rows=10)
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE pybithumb2_request_duration_seconds histogram" in text
+    assert (
+        'pybithumb2_request_duration_seconds_bucket{method="GET",endpoint="/v1/ticker",le="0.1"} 1'
+        in text
+    )
+    assert (
+        'pybithumb2_request_duration_seconds_bucket{method="GET",endpoint="/v1/ticker",le="+Inf"} 2'
+        in text
+    )
+    assert (
+        'pybithumb2_request_duration_seconds_count{method="GET",endpoint="/v1/ticker"} 2'
+        in text
+    )
+    assert (
+        'pybithumb2_request_stage_seconds_sum{method="GET",endpoint="/v1/ticker",stage="server"} 0.4'
+        in text
+    )
+    assert (
+        'pybithumb2_responses_total{method="GET",endpoint="/v1/ticker",status="429"} 1'
+        in text
+    )
+    assert (
+        'pybithumb2_request_errors_total{method="GET",endpoint="/v1/ticker"} 1' in text
+    )
+    assert (
+        'pybithumb2_transferred_bytes_total{method="GET",endpoint="/v1/ticker",direction="in"} 100'
+        in text
+    )
+    assert 'pybithumb2_parsed_rows_total{model="Snapshot"} 10' in text
+
+    metrics.reset()
+    assert metrics.summary() == {}
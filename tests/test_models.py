@@ -0,0 +1,213 @@
+import pytest
+
+from pydantic import BaseModel, ValidationError
+
+from pybithumb2.models import (
+    DFList,
+    DayCandle,
+    LazyView,
+    MinuteCandle,
+    Order,
+    OrderBook,
+    OrderInfo,
+    Snapshot,
+    WarningMarketInfo,
+)
+
+CANDLE = {
+    "market": "KRW-BTC",
+    "candle_date_time_utc": "2024-12-31T15:00:00",
+    "candle_date_time_kst": "2025-01-01T00:00:00",
+    "opening_price": 140000000.0,
+    "high_price": 140100000,
+    "low_price": 139900000.5,
+    "trade_price": 140050000,
+    "timestamp": 1735689600000,
+    "candle_acc_trade_price": 1234567.89123456,
+    "candle_acc_trade_volume": 0.01234567,
+}
+
+SNAPSHOT = {
+    "market": "KRW-BTC",
+    "trade_date": "20250101",
+    "trade_time": "010203",
+    "trade_date_kst": "20250101",
+    "trade_time_kst": "100203",
+    "trade_timestamp": 1735693323000,
+    "opening_price": 140000000,
+    "high_price": 141000000,
+    "low_price": 139000000,
+    "trade_price": 140500000.5,
+    "prev_closing_price": 140000000,
+    "change": "RISE",
+    "change_price": 500000,
+    "change_rate": 0.0036,
+    "signed_change_price": 500000,
+    "signed_change_rate": 0.0036,
+    "trade_volume": 0.0123,
+    "acc_trade_price": 123456789.123,
+    "acc_trade_price_24h": 223456789.1,
+    "acc_trade_volume": 12.5,
+    "acc_trade_volume_24h": 25.1,
+    "highest_52_week_price": 160000000,
+    "highest_52_week_date": "2024-12-17",
+    "lowest_52_week_price": 60000000,
+    "lowest_52_week_date": "2024-01-23",
+    "timestamp": 1735693323500,
+}
+
+ORDER = {
+    "uuid": "C0101000000001234567",
+    "side": "bid",
+    "ord_type": "limit",
+    "price": "28000",
+    "state": "wait",
+    "market": "KRW-SUI",
+    "created_at": "2025-01-01T10:00:00+09:00",
+    "volume": "0.21428571",
+    "remaining_volume": "0.21428571",
+    "reserved_fee": "15",
+    "remaining_fee": "15",
+    "paid_fee": "0",
+    "locked": "6015",
+    "executed_volume": "0",
+    "trades_count": 0,
+}
+
+TRADE = {
+    "market": "KRW-SUI",
+    "uuid": "C0101000000001234567",
+    "price": "28000",
+    "volume": "0.1",
+    "funds": "2800",
+    "side": "bid",
+    "created_at": "2025-01-01T10:00:01+09:00",
+}
+
+ORDERBOOK = {
+    "market": "KRW-BTC",
+    "timestamp": 1735693323000,
+    "total_ask_size": 12.5,
+    "total_bid_size": 13.5,
+    "orderbook_units": [
+        {
+            "ask_price": 140500000,
+            "bid_price": 140400000,
+            "ask_size": 0.1,
+            "bid_size": 0.2,
+        }
+    ],
+}
+
+
+def assert_identical(a, b):
+    if isinstance(a, BaseModel):
+        assert type(a) is type(b)
+        assert list(a.__dict__) == list(b.__dict__)
+        assert a.model_fields_set == b.model_fields_set
+        for key in a.__dict__:
+            assert_identical(a.__dict__[key], b.__dict__[key])
+    elif isinstance(a, list):
+        assert type(a) is type(b) and len(a) == len(b)
+        for x, y in zip(a, b):
+            assert_identical(x, y)
+    else:
+        assert type(a) is type(b) and a == b and repr(a) == repr(b)
+
+
+@pytest.mark.parametrize(
+    "model, payload",
+    [
+        (MinuteCandle, [dict(CANDLE, unit=1), dict(CANDLE, unit=3)]),
+        (DayCandle, [dict(CANDLE, change_rate=-0.0001, converted_trade_price=None)]),
+        (Snapshot, [SNAPSHOT, dict(SNAPSHOT, market="KRW-ETH", change="FALL")]),
+        (Order, [ORDER]),
+        (OrderInfo, [dict(ORDER, trades=[TRADE])]),
+        (OrderBook, [ORDERBOOK]),
+        (
+            WarningMarketInfo,
+            [
+                {
+                    "market": "KRW-ABC",
+                    "warning_type": "PRICE_SUDDEN_FLUCTUATION",
+                    "end_date": "2025-01-02 10:00:00",
+                }
+            ],
+        ),
+    ],
+)
+def test_model_validate_many(model, payload):
+    expected = [model.model_validate(item) for item in payload]
+
+    assert_identical(model.model_validate_many(payload), expected)
+
+
+def test_model_validate_many_falls_back():
+    with pytest.raises(ValueError):
+        MinuteCandle.model_validate_many([dict(CANDLE, unit=2)])
+    with pytest.raises(ValueError):
+        Snapshot.model_validate_many([{"market": "KRW-BTC"}])
+
+
+@pytest.mark.parametrize("value", ["NaN", "Infinity", float("nan")])
+def test_non_finite_decimals_are_rejected(value):
+    payload = dict(SNAPSHOT, trade_price=value)
+
+    with pytest.raises(ValidationError):
+        Snapshot.model_validate(payload)
+    with pytest.raises(ValidationError):
+        Snapshot.model_validate_many([payload])
+    (view,) = Snapshot.lazy_many([payload])
+    with pytest.raises(ValidationError):
+        view.trade_price
+
+
+@pytest.mark.parametrize(
+    "model, payload",
+    [
+        (DayCandle, [dict(CANDLE, change_rate=-0.0001, converted_trade_price=None)]),
+        (Snapshot, [SNAPSHOT, dict(SNAPSHOT, market="KRW-ETH", change="FALL")]),
+        (OrderInfo, [dict(ORDER, trades=[TRADE])]),
+        (OrderBook, [ORDERBOOK]),
+    ],
+)
+def test_lazy_many(model, payload):
+    expected = [model.model_validate(item) for item in payload]
+    views = model.lazy_many(payload)
+
+    for view, item in zip(views, expected):
+        assert isinstance(view, LazyView)
+        assert list(view.__dict__) == ["_raw"]
+        for name, value in item.__dict__.items():
+            if value is None:
+                assert not hasattr(view, name)
+            else:
+                assert_identical(getattr(view, name), value)
+        assert_identical(view.model(), item)
+
+
+def test_lazy_view_converts_on_access():
+    (view,) = Snapshot.lazy_many([SNAPSHOT])
+
+    assert str(view.trade_price) == "140500000.5"
+    assert list(view.__dict__) == ["_raw", "trade_price"]
+    assert view.market.currency_to.code == "BTC"
+    assert list(view.__dict__) == ["_raw", "trade_price", "market"]
+    with pytest.raises(AttributeError):
+        view.no_such_field
+
+
+def test_lazy_view_falls_back():
+    (view,) = MinuteCandle.lazy_many([dict(CANDLE, unit=2)])
+
+    assert view.opening_price == 140000000
+    with pytest.raises(ValueError):
+        view.unit
+
+
+def test_lazy_view_df():
+    payload = [SNAPSHOT, dict(SNAPSHOT, market="KRW-ETH", change="FALL")]
+    lazy = DFList(Snapshot.lazy_many(payload)).df()
+    eager = DFList(Snapshot.model_validate_many(payload)).df()
+
+    assert lazy.equals(eager)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from pybithumb2.models import OrderBook
+from pybithumb2.orderbook import LocalOrderBook
+from pybithumb2.types import TradeSide
+
+SNAPSHOT = {
+    "market": "KRW-BTC",
+    "timestamp": 1735693323000,
+    "total_ask_size": 6.0,
+    "total_bid_size": 6.0,
+    "orderbook_units": [
+        {"ask_price": 101 + i, "bid_price": 100 - i, "ask_size": 1.0, "bid_size": 2.0}
+        for i in range(3)
+    ],
+}
+
+
+@pytest.mark.parametrize("snapshot", [SNAPSHOT, OrderBook.model_validate(SNAPSHOT)])
+def test_apply_snapshot(snapshot):
+    book = LocalOrderBook()
+
+    assert book.apply_snapshot(snapshot)
+    assert str(book.market) == "KRW-BTC"
+    assert book.best_ask == (101.0, 1.0)
+    assert book.best_bid == (100.0, 2.0)
+    assert book.spread == 1.0
+    assert book.mid_price == 100.5
+    assert list(book.asks()[0]) == [101.0, 102.0, 103.0]
+    assert list(book.bids(2)[0]) == [100.0, 99.0]
+
+
+def test_older_snapshot_is_ignored():
+    book = LocalOrderBook()
+    book.apply_snapshot(SNAPSHOT)
+
+    assert not book.apply_snapshot(dict(SNAPSHOT, timestamp=1, orderbook_units=[]))
+    assert len(book) == 6
+
+
+def test_apply_delta():
+    book = LocalOrderBook(capacity=2)
+    book.apply_snapshot(SNAPSHOT)
+
+    book.apply_delta(TradeSide.BID, 100.5, 0.5)
+    book.apply_delta("ask", 101, 0)
+    book.apply_delta(TradeSide.ASK, 102, 4.0)
+    book.apply_deltas([(TradeSide.BID, 98, 0), (TradeSide.ASK, 150, 1.0)])
+
+    assert book.best_bid == (100.5, 0.5)
+    assert book.best_ask == (102.0, 4.0)
+    assert list(book.bids()[0]) == [100.5, 100.0, 99.0]
+    assert list(book.asks()[0]) == [102.0, 103.0, 150.0]
+    assert book.size_at(TradeSide.BID, 100) == 2.0
+    assert book.size_at(TradeSide.BID, 98) == 0.0
+
+
+def test_cumulative_size():
+    book = LocalOrderBook()
+    book.apply_snapshot(SNAPSHOT)
+
+    assert book.cumulative_size(TradeSide.ASK) == 3.0
+    assert book.cumulative_size(TradeSide.BID, depth=2) == 4.0
+    assert book.cumulative_size(TradeSide.BID, price=99) == 4.0
+    assert book.cumulative_size(TradeSide.ASK, price=100) == 0.0
+    assert book.price_for_size(TradeSide.ASK, 1.5) == 102.0
+    assert book.price_for_size(TradeSide.ASK, 10) is None
+
+    book.apply_delta(TradeSide.ASK, 101, 5.0)
+    assert book.cumulative_size(TradeSide.ASK, depth=1) == 5.0
+
+
+def test_matches_sorted_reference():
+    rng = np.random.default_rng(0)
+    book = LocalOrderBook(capacity=4)
+    reference = {}
+    for _ in range(2000):
+        price = float(rng.integers(1, 200))
+        size = float(rng.integers(0, 3))
+        book.apply_delta(TradeSide.BID, price, size)
+        if size:
+            reference[price] = size
+        else:
+            reference.pop(price, None)
+
+    prices, sizes = book.bids()
+    expected = sorted(reference.items(), reverse=True)
+    assert list(prices) == [price for price, _ in expected]
+    assert list(sizes) == [size for _, size in expected]
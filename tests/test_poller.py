@@ -0,0 +1,144 @@
+import pytest
+
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import MarketID, Snapshot
+from pybithumb2.poller import TickerChange, TickerPoller
+
+MARKETS = [MarketID.from_string(f"KRW-COIN{i}") for i in range(50)]
+
+
+def ticker(market: MarketID, trade: int) -> dict:
+    return {
+        "market": str(market),
+        "trade_date": "20250101",
+        "trade_time": "010203",
+        "trade_date_kst": "20250101",
+        "trade_time_kst": "100203",
+        "trade_timestamp": 1735693323000 + trade,
+        "opening_price": 100,
+        "high_price": 110,
+        "low_price": 90,
+        "trade_price": 100 + trade,
+        "prev_closing_price": 100,
+        "change": "RISE",
+        "change_price": trade,
+        "change_rate": 0.01,
+        "signed_change_price": trade,
+        "signed_change_rate": 0.01,
+        "trade_volume": 1,
+        "acc_trade_price": 1000,
+        "acc_trade_price_24h": 1000,
+        "acc_trade_volume": 10 + trade,
+        "acc_trade_volume_24h": 10,
+        "highest_52_week_price": 200,
+        "highest_52_week_date": "2024-12-17",
+        "lowest_52_week_price": 50,
+        "lowest_52_week_date": "2024-01-23",
+        "timestamp": 1735693323500,
+    }
+
+
+class FakeClient(BithumbClient):
+    """Serves the tickers of markets whose number of trades is set by the test."""
+
+    def __init__(self, use_raw_data=True):
+        super().__init__(use_raw_data=use_raw_data)
+        self.trades = {market: 0 for market in MARKETS}
+        self.requests = 0
+
+    def get_markets(self, isDetails=False):
+        return [{"market": str(market)} for market in self.trades]
+
+    def get_snapshots(self, markets, **kwargs):
+        self.requests += 1
+        rows = [ticker(market, self.trades[market]) for market in markets]
+        if self._use_raw_data:
+            return rows
+        return Snapshot.model_validate_many(rows)
+
+
+@pytest.mark.parametrize("use_raw_data", [True, False])
+def test_only_changed_markets_are_reported(use_raw_data):
+    client = FakeClient(use_raw_data)
+    poller = TickerPoller(client, MARKETS)
+
+    first = poller.poll()
+    assert [change.market for change in first] == MARKETS
+    assert first[0].previous_trade_price is None
+
+    assert poller.poll() == []
+
+    client.trades[MARKETS[3]] = 2
+    client.trades[MARKETS[40]] = 1
+    changes = poller.poll()
+
+    assert [change.market for change in changes] == [MARKETS[3], MARKETS[40]]
+    change = changes[0]
+    assert isinstance(change, TickerChange)
+    assert isinstance(change.snapshot, Snapshot)
+    assert change.snapshot.trade_price == 102
+    assert change.previous_trade_price == 100.0
+    assert change.previous_acc_trade_volume == 10.0
+    assert change.previous_trade_timestamp == 1735693323000
+    assert poller.poll() == []
+
+
+def test_markets_default_to_every_market():
+    client = FakeClient()
+    poller = TickerPoller(client)
+
+    assert len(poller.poll()) == len(MARKETS)
+    assert poller.markets == MARKETS
+    assert poller.state_markets() == MARKETS
+    assert poller.state()["trade_price"].tolist() == [100.0] * len(MARKETS)
+
+
+def test_new_markets_in_the_response_are_added():
+    client = FakeClient()
+    poller = TickerPoller(client, MARKETS[:10])
+    poller.poll()
+
+    poller.markets = MARKETS[5:20]
+    changes = poller.poll()
+
+    assert [change.market for change in changes] == MARKETS[10:20]
+    assert len(poller.state()) == 20
+
+
+def test_interval_adapts_to_changes():
+    client = FakeClient()
+    poller = TickerPoller(client, MARKETS, min_interval=0.01, max_interval=1.0)
+    poller.poll()
+
+    # Quiet markets back off to the longest interval.
+    for _ in range(10):
+        poller.poll()
+    assert poller.interval == 1.0
+
+    # Every market changing on every poll brings it back to the shortest one.
+    for trade in range(1, 20):
+        for market in MARKETS:
+            client.trades[market] = trade
+        poller.poll()
+    assert poller.interval == 0.01
+
+
+def test_run_calls_on_change():
+    client = FakeClient()
+    poller = TickerPoller(client, MARKETS[:5], min_interval=0.01)
+    changes = []
+
+    poller.run(changes.append, duration=0.1)
+
+    assert len(changes) == 5
+    assert client.requests >= 2
+
+
+def test_df():
+    poller = TickerPoller(FakeClient(), MARKETS[:3])
+    poller.poll()
+
+    df = poller.df()
+
+    assert list(df.index) == [str(m) for m in MARKETS[:3]]
+    assert df["acc_trade_volume"].tolist() == [10.0] * 3
@@ -0,0 +1,62 @@
+import time
+import asyncio
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pybithumb2.exceptions import RateLimitError
+from pybithumb2.ratelimit import EndpointGroup, RateLimiter, TokenBucket
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+
+    start = time.monotonic()
+    for _ in range(10):
+        assert bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # 5 tokens are available immediately, the other 5 arrive at 50 per second.
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_token_bucket_is_thread_safe():
+    bucket = TokenBucket(rate=200, burst=10)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(lambda _: bucket.acquire(), range(50)))
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 40 / 200 * 0.9
+
+
+def test_token_bucket_async():
+    bucket = TokenBucket(rate=100, burst=2)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(12)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 10 / 100 * 0.9
+
+
+def test_rate_limiter_fail_fast():
+    limiter = RateLimiter(order_rate=1, order_burst=2, block=False)
+
+    limiter.acquire(EndpointGroup.ORDER)
+    limiter.acquire(EndpointGroup.ORDER)
+    with pytest.raises(RateLimitError):
+        limiter.acquire(EndpointGroup.ORDER)
+
+    # Other groups have their own buckets.
+    limiter.acquire(EndpointGroup.PUBLIC)
+    limiter.acquire(EndpointGroup.PRIVATE)
+
+
+def test_endpoint_groups():
+    assert RateLimiter.group_of("GET", "/v1/ticker", False) == EndpointGroup.PUBLIC
+    assert RateLimiter.group_of("GET", "/v1/orders", True) == EndpointGroup.PRIVATE
+    assert RateLimiter.group_of("POST", "/v1/orders", True) == EndpointGroup.ORDER
+    assert RateLimiter.group_of("DELETE", "/v1/order", True) == EndpointGroup.ORDER
@@ -0,0 +1,150 @@
+from datetime import datetime
+
+import numpy as np
+
+from pybithumb2.client import BithumbClient
+from pybithumb2.models import MarketID
+from pybithumb2.recorder import TickLog, TradeRecorder
+
+BTC = MarketID.from_string("KRW-BTC")
+ETH = MarketID.from_string("KRW-ETH")
+
+
+def trade(market: MarketID, i: int) -> dict:
+    # Two ticks share each timestamp, so deduplication has to look at sequential_id too.
+    return {
+        "market": str(market),
+        "trade_date_utc": "2025-01-01",
+        "trade_time_utc": "00:00:00",
+        "timestamp": 1735689600000 + (i // 2) * 1000,
+        "trade_price": 100.0 + i,
+        "trade_volume": 0.5,
+        "prev_closing_price": 100.0,
+        "change_price": 0.0,
+        "ask_bid": "BID" if i % 2 else "ASK",
+        "sequential_id": 17356896000000000 + i,
+    }
+
+
+class FakeClient(BithumbClient):
+    """Serves the newest `count` ticks of a tape that grows between polls."""
+
+    def __init__(self):
+        super().__init__(use_raw_data=True)
+        self.tapes = {BTC: 0, ETH: 0}
+        self.polls = []
+
+    def get_trades(self, market, to=None, count=1, daysAgo=None):
+        self.polls.append(market)
+        total = self.tapes[market]
+        return [trade(market, i) for i in reversed(range(max(0, total - count), total))]
+
+
+def test_tick_log_append_and_read(tmp_path):
+    log = TickLog(tmp_path / "KRW-BTC.ticks", index_stride=8)
+    ticks = [(1000 + i // 3, i, 1.0 + i, 0.1, i % 2) for i in range(100)]
+
+    assert log.append(ticks[:50]) == 50
+    assert log.append(ticks[50:]) == 50
+    assert len(log) == 100
+
+    records = log.read(1010, 1020)
+    assert (records["timestamp"] >= 1010).all() and (records["timestamp"] < 1020).all()
+    assert records["sequential_id"].tolist() == list(range(30, 60))
+    assert len(log.read()) == 100
+    assert len(log.read(start=2000)) == 0
+    assert log.last()["sequential_id"][0] == 99
+
+    reopened = TickLog(tmp_path / "KRW-BTC.ticks", index_stride=8)
+    assert len(reopened) == 100
+    assert reopened.read(1010, 1020)["sequential_id"].tolist() == list(range(30, 60))
+
+
+def test_tick_log_recovers_from_partial_write(tmp_path):
+    path = tmp_path / "KRW-BTC.ticks"
+    log = TickLog(path, index_stride=4)
+    log.append([(1000 + i, i, 1.0, 0.1, 0) for i in range(10)])
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 5)
+    path.with_suffix(".idx").unlink()
+
+    reopened = TickLog(path, index_stride=4)
+
+    assert len(reopened) == 10
+    assert reopened.read(1004, 1006)["sequential_id"].tolist() == [4, 5]
+
+
+def test_recorder_deduplicates_overlapping_polls(tmp_path):
+    client = FakeClient()
+    recorder = TradeRecorder(client, tmp_path, [BTC], count=20)
+
+    client.tapes[BTC] = 15
+    assert recorder.poll(BTC) == 15
+    assert recorder.poll(BTC) == 0
+    client.tapes[BTC] = 25
+    assert recorder.poll(BTC) == 10
+
+    records = recorder.log(BTC).read()
+    assert records["sequential_id"].tolist() == [
+        17356896000000000 + i for i in range(25)
+    ]
+    assert (np.diff(records["timestamp"]) >= 0).all()
+    assert records["side"].tolist() == [i % 2 for i in range(25)]
+    assert recorder.gaps == {}
+
+
+def test_recorder_resumes_from_log(tmp_path):
+    client = FakeClient()
+    client.tapes[BTC] = 15
+    TradeRecorder(client, tmp_path, [BTC], count=20).poll(BTC)
+
+    client.tapes[BTC] = 21
+    recorder = TradeRecorder(client, tmp_path, [BTC], count=20)
+
+    # The tick at the last recorded timestamp is not written twice.
+    assert recorder.poll(BTC) == 6
+    assert len(recorder.log(BTC)) == 21
+
+
+def test_recorder_detects_gaps(tmp_path):
+    client = FakeClient()
+    recorder = TradeRecorder(client, tmp_path, [BTC], count=10, min_interval=0.5)
+    client.tapes[BTC] = 10
+    recorder.poll(BTC)
+    client.tapes[BTC] = 40
+
+    recorder.poll(BTC)
+
+    assert recorder.gaps == {BTC: 1}
+    assert recorder.interval(BTC) == 0.5
+
+
+def test_recorder_adapts_interval_to_trade_rate(tmp_path):
+    client = FakeClient()
+    recorder = TradeRecorder(
+        client, tmp_path, [BTC, ETH], count=100, min_interval=0.01, max_interval=1.0
+    )
+    recorder.poll(BTC)
+    recorder.poll(ETH)
+    for _ in range(8):
+        client.tapes[BTC] += 20
+        recorder.poll(BTC)
+        recorder.poll(ETH)
+
+    # The busy market is polled often and the quiet one backs off to max_interval.
+    assert recorder.interval(BTC) < recorder.interval(ETH)
+    assert recorder.interval(ETH) == 1.0
+
+
+def test_recorder_run(tmp_path):
+    client = FakeClient()
+    client.tapes[BTC] = 5
+    recorder = TradeRecorder(
+        client, tmp_path, [BTC, ETH], min_interval=0.01, max_interval=0.02
+    )
+
+    recorder.run(duration=0.1)
+
+    assert BTC in client.polls and ETH in client.polls
+    assert len(recorder.log(BTC)) == 5
+    assert recorder.log(BTC).df()["time"].iloc[0] == datetime(2025, 1, 1)
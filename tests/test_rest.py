@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+import pybithumb2.rest as rest
+from pybithumb2.exceptions import APIError
+
+PAYLOAD = [
+    {
+        "market": "KRW-BTC",
+        "korean_name": "비트코인",
+        "trade_price": 140500000.5,
+        "change_rate": 0.0036,
+        "sequential_id": 17356933230000000,
+    }
+]
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(rest, "_json_loads", json.loads)
+    return request.param
+
+
+def test_decode_content(json_backend):
+    content = json.dumps(PAYLOAD, ensure_ascii=False).encode()
+
+    assert rest._decode_content(content) == PAYLOAD
+
+
+def test_decode_content_errors(json_backend):
+    with pytest.raises(APIError, match="Response is empty"):
+        rest._decode_content(b"")
+
+    error = {"name": "invalid_query_payload", "message": "Invalid"}
+    with pytest.raises(APIError) as exc_info:
+        rest._decode_content(json.dumps({"error": error}).encode())
+    assert exc_info.value._error == error
+
+    with pytest.raises(ValueError):
+        rest._decode_content(b"<html>Bad Gateway</html>")
+
+
+def test_decode_content_list_is_not_an_error(json_backend):
+    assert rest._decode_content(b'["error"]') == ["error"]
@@ -0,0 +1,240 @@
+import asyncio
+import json
+
+from datetime import date, time
+from decimal import Decimal
+
+import pytest
+
+from websockets import ConnectionClosed
+from websockets.asyncio.server import serve
+
+from pybithumb2.exceptions import APIError
+from pybithumb2.models import MarketID, OrderBook, Snapshot, TradeInfo
+from pybithumb2.stream import BithumbStream
+from pybithumb2.types import StreamChannel, TradeSide
+
+TICKER = {
+    "type": "ticker",
+    "code": "KRW-BTC",
+    "opening_price": 140000000,
+    "high_price": 141000000,
+    "low_price": 139000000,
+    "trade_price": 140500000,
+    "prev_closing_price": 140000000,
+    "change": "RISE",
+    "change_price": 500000,
+    "signed_change_price": 500000,
+    "change_rate": 0.0036,
+    "signed_change_rate": 0.0036,
+    "trade_volume": 0.0123,
+    "acc_trade_volume": 12.5,
+    "acc_trade_volume_24h": 25.1,
+    "acc_trade_price": 123456789.123,
+    "acc_trade_price_24h": 223456789.1,
+    "trade_date": "20250101",
+    "trade_time": "010203",
+    "trade_timestamp": 1735693323000,
+    "highest_52_week_price": 160000000,
+    "highest_52_week_date": "2024-12-17",
+    "lowest_52_week_price": 60000000,
+    "lowest_52_week_date": "2024-01-23",
+    "timestamp": 1735693323500,
+    "stream_type": "REALTIME",
+}
+
+TRADE = {
+    "type": "trade",
+    "code": "KRW-BTC",
+    "trade_price": 140500000,
+    "trade_volume": 0.0001,
+    "ask_bid": "BID",
+    "prev_closing_price": 140000000,
+    "change": "RISE",
+    "change_price": 500000,
+    "trade_date": "2025-01-01",
+    "trade_time": "01:02:03",
+    "trade_timestamp": 1735693323000,
+    "timestamp": 1735693323500,
+    "sequential_id": 17356933230000000,
+    "stream_type": "REALTIME",
+}
+
+ORDERBOOK = {
+    "type": "orderbook",
+    "code": "KRW-BTC",
+    "total_ask_size": 12.5,
+    "total_bid_size": 13.5,
+    "orderbook_units": [
+        {
+            "ask_price": 140500000,
+            "bid_price": 140400000,
+            "ask_size": 0.1,
+            "bid_size": 0.2,
+        }
+    ],
+    "timestamp": 1735693323000,
+    "stream_type": "REALTIME",
+}
+
+MESSAGES = {"ticker": TICKER, "trade": TRADE, "orderbook": ORDERBOOK}
+
+
+class StandInServer:
+    """Answers every subscription with one message per channel and market, then optionally drops the connection."""
+
+    def __init__(self, drop_after_first: bool = False, drop_all: bool = False):
+        self.requests = []
+        self.connections = 0
+        self.connected_at = []
+        self.drop_after_first = drop_after_first
+        self.drop_all = drop_all
+
+    async def handler(self, ws):
+        self.connections += 1
+        self.connected_at.append(asyncio.get_running_loop().time())
+        if self.drop_all:
+            # Accept the subscription, then close before sending anything.
+            await ws.recv()
+            return
+        await ws.send(json.dumps({"status": "UP"}))
+        async for frame in ws:
+            request = json.loads(frame)
+            self.requests.append(request)
+            for item in request[1:-1]:
+                for code in item["codes"]:
+                    message = dict(MESSAGES[item["type"]], code=code)
+                    await ws.send(json.dumps(message).encode())
+            if self.drop_after_first and self.connections == 1:
+                await ws.close()
+                return
+
+
+def run_with_server(server: StandInServer, scenario):
+    async def run():
+        async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            stream = BithumbStream(f"ws://127.0.0.1:{port}", reconnect_delay=0.01)
+            try:
+                return await asyncio.wait_for(scenario(stream), timeout=5)
+            finally:
+                await stream.close()
+
+    return asyncio.run(run())
+
+
+def test_stream_decodes_channels():
+    btc, eth = MarketID.from_string("KRW-BTC"), MarketID.from_string("KRW-ETH")
+
+    async def scenario(stream: BithumbStream):
+        await stream.subscribe(StreamChannel.TICKER, [btc, eth])
+        await stream.subscribe("trade", [btc])
+        await stream.subscribe(StreamChannel.ORDERBOOK, [btc])
+        return [await stream.recv() for _ in range(4)]
+
+    server = StandInServer()
+    ticker_btc, ticker_eth, trade, orderbook = run_with_server(server, scenario)
+
+    assert server.requests[0][1:] == [
+        {"type": "ticker", "codes": ["KRW-BTC", "KRW-ETH"]},
+        {"type": "trade", "codes": ["KRW-BTC"]},
+        {"type": "orderbook", "codes": ["KRW-BTC"]},
+        {"format": "DEFAULT"},
+    ]
+
+    assert isinstance(ticker_btc, Snapshot)
+    assert str(ticker_btc.market) == "KRW-BTC"
+    assert str(ticker_eth.market) == "KRW-ETH"
+    assert ticker_btc.trade_price == Decimal("140500000")
+    assert ticker_btc.trade_date_kst == date(2025, 1, 1)
+    assert ticker_btc.trade_time_kst == time(10, 2, 3)
+
+    assert isinstance(trade, TradeInfo)
+    assert trade.trade_date_utc == date(2025, 1, 1)
+    assert trade.trade_time_utc == time(1, 2, 3)
+    assert trade.timestamp == 1735693323000
+    assert trade.ask_bid == TradeSide.BID
+
+    assert isinstance(orderbook, OrderBook)
+    assert orderbook.orderbook_units[0].bid_size == Decimal("0.2")
+
+
+def test_stream_reconnects_and_resubscribes():
+    btc = MarketID.from_string("KRW-BTC")
+
+    async def scenario(stream: BithumbStream):
+        await stream.subscribe(StreamChannel.TRADE, [btc])
+        messages = []
+        async for message in stream:
+            messages.append(message)
+            if len(messages) == 2:
+                break
+        return messages
+
+    server = StandInServer(drop_after_first=True)
+    messages = run_with_server(server, scenario)
+
+    assert server.connections == 2
+    assert len(server.requests) == 2
+    assert server.requests[0][1:] == server.requests[1][1:]
+    assert all(isinstance(message, TradeInfo) for message in messages)
+
+
+def test_stream_raw_data_and_unsubscribe():
+    btc, eth = MarketID.from_string("KRW-BTC"), MarketID.from_string("KRW-ETH")
+
+    async def scenario(stream: BithumbStream):
+        stream._use_raw_data = True
+        await stream.subscribe(StreamChannel.TICKER, [btc, eth])
+        first = await stream.recv()
+        await stream.unsubscribe(StreamChannel.TICKER, [btc])
+        return first, stream.subscriptions
+
+    server = StandInServer()
+    first, subscriptions = run_with_server(server, scenario)
+
+    assert first == TICKER
+    assert subscriptions == {StreamChannel.TICKER: [eth]}
+    assert server.requests[-1][1] == {"type": "ticker", "codes": ["KRW-ETH"]}
+
+
+def test_stream_ends_after_last_unsubscribe():
+    btc = MarketID.from_string("KRW-BTC")
+
+    async def scenario(stream: BithumbStream):
+        await stream.subscribe(StreamChannel.TRADE, [btc])
+        messages = []
+        async for message in stream:
+            messages.append(message)
+            await stream.unsubscribe(StreamChannel.TRADE)
+        try:
+            await stream.recv()
+        except APIError:
+            return messages, stream.connected
+        raise AssertionError("recv() returned without subscriptions")
+
+    server = StandInServer()
+    messages, connected = run_with_server(server, scenario)
+
+    assert len(messages) == 1
+    assert not connected
+    assert server.connections == 1
+
+
+def test_stream_backs_off_when_the_server_keeps_closing():
+    btc = MarketID.from_string("KRW-BTC")
+
+    async def scenario(stream: BithumbStream):
+        stream._reconnect_delay = 0.05
+        stream._max_retries = 3
+        await stream.subscribe(StreamChannel.TRADE, [btc])
+        with pytest.raises(ConnectionClosed):
+            await stream.recv()
+
+    server = StandInServer(drop_all=True)
+    run_with_server(server, scenario)
+
+    assert server.connections == 4
+    gaps = [b - a for a, b in zip(server.connected_at, server.connected_at[1:])]
+    assert all(gap >= delay for gap, delay in zip(gaps, [0.05, 0.1, 0.2]))
+    assert gaps[0] < gaps[1] < gaps[2]
@@ -0,0 +1,103 @@
+import copy
+import pickle
+
+import pytest
+
+from pybithumb2.models import MarketID, Order, Snapshot
+from pybithumb2.types import Currency, OrderID
+
+
+def test_currency_is_interned():
+    currency = Currency("krw")
+
+    assert currency is Currency(code="KRW")
+    assert currency.code == "KRW"
+    assert repr(currency) == "Currency(code='KRW')"
+    assert Currency(currency) is currency
+
+
+def test_market_id_is_interned():
+    market = MarketID.from_string("KRW-BTC")
+
+    assert market is MarketID.from_string("KRW-BTC")
+    assert market is MarketID("krw", "btc")
+    assert market is MarketID(
+        currency_from=Currency(code="KRW"), currency_to=Currency(code="BTC")
+    )
+    assert market.currency_from is Currency("KRW")
+    assert str(market) == "KRW-BTC"
+    assert repr(market) == (
+        "MarketID(currency_from=Currency(code='KRW'), currency_to=Currency(code='BTC'))"
+    )
+    assert {market: 1}[MarketID.from_string("KRW-BTC")] == 1
+    assert market != MarketID.from_string("KRW-ETH")
+
+    with pytest.raises(ValueError):
+        MarketID.from_string("KRWBTC")
+
+
+def test_order_id_is_interned_while_referenced():
+    order_id = OrderID("C0101000000001234567")
+
+    assert order_id is OrderID("C0101000000001234567")
+    assert order_id == OrderID(id="C0101000000001234567")
+    assert str(order_id) == "C0101000000001234567"
+
+
+@pytest.mark.parametrize(
+    "identifier",
+    [Currency("KRW"), MarketID.from_string("KRW-BTC"), OrderID("C0101")],
+)
+def test_identifiers_are_immutable_singletons(identifier):
+    with pytest.raises(AttributeError):
+        identifier.code = "BTC"
+    assert not hasattr(identifier, "__dict__")
+    assert copy.copy(identifier) is identifier
+    assert copy.deepcopy(identifier) is identifier
+    assert pickle.loads(pickle.dumps(identifier)) is identifier
+
+
+def test_models_share_identifiers():
+    row = {
+        "uuid": "C0101000000001234567",
+        "side": "bid",
+        "ord_type": "limit",
+        "price": "28000",
+        "state": "wait",
+        "market": "KRW-SUI",
+        "created_at": "2025-01-01T10:00:00+09:00",
+        "volume": "0.21428571",
+        "remaining_volume": "0.21428571",
+        "reserved_fee": "15",
+        "remaining_fee": "15",
+        "paid_fee": "0",
+        "locked": "6015",
+        "executed_volume": "0",
+        "trades_count": 0,
+    }
+    first, second = Order.model_validate_many([row, row])
+
+    assert first.market is second.market is MarketID.from_string("KRW-SUI")
+    assert first.uuid is second.uuid
+    assert first.model_dump()["market"] == {
+        "currency_from": {"code": "KRW"},
+        "currency_to": {"code": "SUI"},
+    }
+    assert first.model_dump()["uuid"] == {"id": "C0101000000001234567"}
+    assert Snapshot.model_fields["market"].annotation is MarketID
+
+
+def test_market_id_keeps_model_methods():
+    market = MarketID.from_string("KRW-BTC")
+    dumped = {"currency_from": {"code": "KRW"}, "currency_to": {"code": "BTC"}}
+
+    assert market.model_dump() == dumped
+    assert market.model_dump(mode="json") == dumped
+    assert MarketID.model_validate(dumped) is market
+    assert MarketID.model_validate("KRW-BTC") is market
+    assert MarketID.model_validate_json(market.model_dump_json()) is market
+    assert market.model_copy() is market
+    assert market.model_copy(update={"currency_to": "ETH"}) is MarketID("KRW", "ETH")
+    assert market.df().to_dict("records") == [
+        {"currency_from": "KRW", "currency_to": "BTC"}
+    ]
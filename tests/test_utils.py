@@ -0,0 +1,65 @@
+import pytest
+
+from datetime import datetime
+
+from pybithumb2.constants import CONNECTED_DATE_FORMAT, CONNECTED_TIME_FORMAT
+from pybithumb2.utils import _parse_datetime, parse_date, parse_datetime, parse_time
+
+
+def outcome(parse, *args):
+    try:
+        return repr(parse(*args))
+    except ValueError:
+        return "ValueError"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-01-01 10:00:00",
+        "2025-01-01T10:00:00",
+        "2025-01-01T10:00:00Z",
+        "2025-01-01T10:00:00+09:00",
+        "2025-01-01 10:00:00-03:30",
+        "2025-01-01T10:00:00+00:00",
+        "2025-01-01T10:00:00.123",
+        "2025-1-1 10:00:00",
+        "2025-02-30 10:00:00",
+        "not a datetime",
+    ],
+)
+def test_parse_datetime_matches_slow_path(value):
+    assert outcome(parse_datetime, value) == outcome(_parse_datetime, value)
+    # Once more with a field whose layout has been learned.
+    parse_datetime("2025-01-01T10:00:00", "test_field")
+    assert outcome(parse_datetime, value, "test_field") == outcome(
+        _parse_datetime, value
+    )
+
+
+@pytest.mark.parametrize(
+    "value, fmt",
+    [
+        ("2025-01-02", "%Y-%m-%d"),
+        ("2025-1-2", "%Y-%m-%d"),
+        ("2025-02-30", "%Y-%m-%d"),
+        ("20250102", CONNECTED_DATE_FORMAT),
+    ],
+)
+def test_parse_date(value, fmt):
+    expected = outcome(lambda: datetime.strptime(value, fmt).date())
+    assert outcome(parse_date, value, fmt) == expected
+
+
+@pytest.mark.parametrize(
+    "value, fmt",
+    [
+        ("01:02:03", "%H:%M:%S"),
+        ("1:2:3", "%H:%M:%S"),
+        ("25:00:00", "%H:%M:%S"),
+        ("010203", CONNECTED_TIME_FORMAT),
+    ],
+)
+def test_parse_time(value, fmt):
+    expected = outcome(lambda: datetime.strptime(value, fmt).time())
+    assert outcome(parse_time, value, fmt) == expected